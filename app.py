@@ -1,6 +1,7 @@
-from flask import Flask, render_template, request, jsonify, session, redirect, url_for
+from flask import Flask, Response, render_template, request, jsonify, session, redirect, url_for, send_file
 import os
 import json
+import numpy as np
 from datetime import datetime
 from config import Config
 
@@ -8,14 +9,42 @@ from config import Config
 from models.euler import EulerMethod
 from models.heun import HeunMethod
 from models.runge_kutta import RungeKuttaMethod
+from models.adams import AdamsBashforthMethod, AdamsBashforthMoultonMethod
+from models.events import Event
+from models.divergence import DivergenceGuard
+from models.sweep import ParameterSweep
+from models.sensitivity import ForwardSensitivity
+from models.shooting import ShootingMethod
+from models.parareal import Parareal
+from models.scipy_ivp import SciPyMethod
+from models.bulirsch_stoer import BulirschStoerMethod
+from models.symplectic import StormerVerletMethod, YoshidaMethod
 
 # Importar utilidades
-from utils.plotter import create_ode_plot
+from utils.plotter import create_ode_plot, get_plot_variant, is_plot_name, plot_directory, plot_etag
+from utils.plot_sweeper import PlotSweeper
 from utils.parser import validate_function, evaluate_function
+from utils.exact_solution import request_exact_solution, attach_exact_solution
+from utils.exporter import EXPORT_FORMATS, PARQUET_AVAILABLE, stream_solution
+from utils.cost import AdmissionController, estimate_cost
+from utils.jobs import submit_job, job_status, wait_for_job, get_process_pool, process_pool_size
+from utils.checkpoints import CheckpointStore
+from utils.transport import integrate_in_process, sweep_shared_arrays
 
 app = Flask(__name__)
 app.config.from_object(Config)
 
+# Control de admisión de las peticiones de resolución
+admission_controller = AdmissionController(app.config)
+
+# Puntos de control por problema, compartidos por todas las peticiones
+checkpoint_store = (CheckpointStore(app.config['CHECKPOINT_DIR'],
+                                    max_problems=app.config['CHECKPOINT_MAX_PROBLEMS'],
+                                    min_steps=app.config['CHECKPOINT_MIN_STEPS'],
+                                    max_age=app.config['CHECKPOINT_MAX_AGE_DAYS'] * 24 * 3600,
+                                    max_bytes=app.config['CHECKPOINT_MAX_MB'] * 1024 * 1024)
+                    if app.config['CHECKPOINTS'] else None)
+
 # Configurar directorio de sesiones
 if not os.path.exists('flask_session'):
     os.makedirs('flask_session')
@@ -31,52 +60,382 @@ def index():
     return render_template('index.html', title='Solver EDO - Métodos de Euler y Heun')
 
 
-@app.route('/solve_euler', methods=['POST'])
-def solve_euler():
-    """Resolver ecuación diferencial usando método de Euler."""
+# Métodos disponibles: clave -> (clase, título, etiqueta en historial)
+SOLVERS = {
+    'euler': (EulerMethod, 'Método de Euler', 'Euler'),
+    'heun': (HeunMethod, 'Método de Heun', 'Heun'),
+    'runge_kutta': (RungeKuttaMethod, 'Método de Runge-Kutta', 'Runge-Kutta'),
+    'adams_bashforth': (AdamsBashforthMethod, 'Método de Adams-Bashforth', 'Adams-Bashforth'),
+    'adams_moulton': (AdamsBashforthMoultonMethod, 'Método de Adams-Bashforth-Moulton',
+                      'Adams-Bashforth-Moulton'),
+    'scipy': (SciPyMethod, 'SciPy solve_ivp', 'SciPy'),
+    'bulirsch_stoer': (BulirschStoerMethod, 'Método de Bulirsch-Stoer', 'Bulirsch-Stoer'),
+    # Segundo orden: function es la aceleración f(x, y) de y'' = f y v0 = y'(x0)
+    'verlet': (StormerVerletMethod, 'Método de Störmer-Verlet', 'Störmer-Verlet'),
+    'yoshida': (YoshidaMethod, 'Método de Yoshida', 'Yoshida'),
+}
+
+
+def parse_problem(data):
+    """
+    Extraer los parámetros del problema de valor inicial de una petición.
+
+    Args:
+        data: Formulario o JSON de la petición
+
+    Returns:
+        tuple: (function_str, x0, y0, xn, h, num_steps)
+    """
+    function_str = data['function']
+    x0 = float(data['x0'])
+    y0 = float(data['y0'])
+    xn = float(data['xn'])
+
+    # Determinar si es por número de pasos o tamaño de paso
+    if 'num_steps' in data and data['num_steps']:
+        num_steps = int(data['num_steps'])
+        h = (xn - x0) / num_steps
+    else:
+        h = float(data['step_size'])
+        num_steps = int((xn - x0) / h)
+
+    return function_str, x0, y0, xn, h, num_steps
+
+
+def parse_output_points(data, x0, x_end):
+    """
+    Obtener los puntos de salida densa pedidos, si los hay.
+
+    Acepta ``output_points`` (lista JSON o texto separado por comas) o
+    ``num_output_points`` (N puntos equiespaciados en [x0, x_end]).
+
+    Args:
+        data: Formulario o JSON de la petición
+        x0 (float): Inicio del intervalo
+        x_end (float): Último x alcanzado por la malla del método
+
+    Returns:
+        np.ndarray: Puntos de salida, o None para la tabla paso a paso
+    """
+    if data.get('output_points'):
+        points = data['output_points']
+        if isinstance(points, str):
+            points = [p for p in points.replace(';', ',').split(',') if p.strip()]
+        return np.array([float(p) for p in points])
+
+    if data.get('num_output_points'):
+        return np.linspace(x0, x_end, int(data['num_output_points']))
+
+    return None
+
+
+def parse_events(data, parameters=()):
+    """
+    Obtener los eventos g(x, y) = 0 pedidos, si los hay.
+
+    En JSON se acepta ``events`` como lista de objetos con ``expression``,
+    ``direction`` y ``terminal``; en formularios, un único evento con los
+    campos ``event``, ``event_direction`` y ``event_terminal``.
+
+    Args:
+        data: Formulario o JSON de la petición
+        parameters (iterable, optional): Parámetros con nombre que pueden usar
+
+    Returns:
+        list: Lista de Event (vacía si no se pidió ninguno)
+    """
+    if isinstance(data.get('events'), list):
+        return [Event(spec['expression'],
+                      direction=int(spec.get('direction', 0)),
+                      terminal=bool(spec.get('terminal', False)),
+                      name=spec.get('name'),
+                      parameters=parameters)
+                for spec in data['events']]
+
+    if data.get('event'):
+        return [Event(data['event'],
+                      direction=int(data.get('event_direction') or 0),
+                      terminal=is_enabled(data, 'event_terminal'),
+                      parameters=parameters)]
+
+    return []
+
+
+def parse_parameters(data):
+    """
+    Obtener los valores de los parámetros con nombre de la expresión.
+
+    En JSON se acepta ``parameters`` como objeto {"k": 2, "c": 0.5}; en
+    formularios, como texto "k=2, c=0.5".
+
+    Args:
+        data: Formulario o JSON de la petición
+
+    Returns:
+        dict: Nombre -> valor (vacío si no hay parámetros)
+    """
+    parameters = data.get('parameters')
+    if not parameters:
+        return {}
+
+    if isinstance(parameters, dict):
+        return {name: float(value) for name, value in parameters.items()}
+
+    values = {}
+    for item in str(parameters).split(','):
+        if not item.strip():
+            continue
+        name, separator, value = item.partition('=')
+        if not separator:
+            raise ValueError(f"Parámetro mal formado: '{item.strip()}' (use nombre=valor)")
+        values[name.strip()] = float(value)
+    return values
+
+
+def parse_guard(data):
+    """
+    Construir la guarda de divergencia de la petición.
+
+    Está activa salvo que se envíe ``guard`` desactivado; ``max_magnitude``
+    y ``max_growth`` sustituyen a los umbrales de la configuración.
+
+    Args:
+        data: Formulario o JSON de la petición
+
+    Returns:
+        DivergenceGuard: Guarda a usar, o None si se desactivó
+    """
+    if 'guard' in data and not is_enabled(data, 'guard'):
+        return None
+    return DivergenceGuard(
+        max_magnitude=float(data.get('max_magnitude') or app.config['DIVERGENCE_MAX_MAGNITUDE']),
+        max_growth=float(data.get('max_growth') or app.config['DIVERGENCE_MAX_GROWTH'])
+    )
+
+
+def is_enabled(data, key):
+    """Interpretar una casilla de formulario o un booleano JSON."""
+    value = data.get(key)
+    if isinstance(value, bool):
+        return value
+    return str(value).lower() in ('1', 'true', 'on', 'yes')
+
+
+def resolve_backend(data, num_steps):
+    """
+    Elegir el backend de integración ('python' o 'jit') para la petición.
+
+    En modo 'auto' solo se usa el backend JIT cuando hay pasos suficientes
+    para amortizar la compilación; si Numba no está disponible o la
+    expresión no es traducible, el método vuelve a Python por sí solo.
+
+    Args:
+        data: Formulario o JSON de la petición
+        num_steps (int): Número de pasos del problema
+
+    Returns:
+        str: 'python' o 'jit'
+    """
+    backend = data.get('backend') or app.config['SOLVER_BACKEND']
+    if backend not in ('python', 'jit', 'auto'):
+        raise ValueError(f"Backend desconocido: {backend} (use python, jit o auto)")
+    if backend == 'auto':
+        return 'jit' if num_steps >= app.config['JIT_MIN_STEPS'] else 'python'
+    return backend
+
+
+def resolve_dtype(data):
+    """
+    Decidir el tipo de los arrays de resultados de una petición.
+
+    float32 reduce a la mitad la memoria de la tabla, los datos de la
+    gráfica y los archivos exportados; la integración sigue acumulando en
+    float64 y el resumen estima la precisión perdida al guardar.
+
+    Args:
+        data: Formulario o JSON de la petición
+
+    Returns:
+        np.dtype: Tipo de los arrays
+    """
+    dtype = data.get('dtype') or app.config['SOLUTION_DTYPE']
+    if dtype not in app.config['SOLUTION_DTYPES']:
+        raise ValueError(f"Tipo de datos no soportado: {dtype} (use {' o '.join(app.config['SOLUTION_DTYPES'])})")
+    return np.dtype(dtype)
+
+
+def admit_request(solver, mode, output_points=None, events=()):
+    """
+    Estimar el coste de una resolución y decidir si se admite.
+
+    Args:
+        solver (ODEMethod): Método ya configurado (backend y parámetros)
+        mode (str): 'full', 'dense', 'lean' o 'arrays'
+        output_points (np.ndarray, optional): Puntos de salida del modo denso
+        events (list): Eventos a detectar
+
+    Returns:
+        tuple: (decisión, motivo, estimación)
+    """
+    solver.events = events
+    estimate = estimate_cost(type(solver), solver.function_str, solver.num_steps, mode=mode,
+                             backend='jit' if solver.uses_jit() else 'python',
+                             output_points=len(output_points) if output_points is not None else 0,
+                             event_expressions=[event.expression for event in events],
+                             value_bytes=solver.dtype.itemsize,
+                             derivative_expressions=solver.sensitivity.expressions()
+                             if solver.sensitivity is not None else ())
+
+    if not app.config['ADMISSION_CONTROL']:
+        return AdmissionController.ACCEPT, '', estimate
+    decision, reason = admission_controller.decide(estimate, solver.num_steps,
+                                                   can_downgrade=mode == 'full')
+    return decision, reason, estimate
+
+
+def run_solver(solver, mode, output_points=None, stride=None, events=(), exact_future=None):
+    """
+    Ejecutar la resolución en el modo pedido y añadir la solución exacta.
+
+    Se usa tanto en línea como en la cola en segundo plano.
+
+    Returns:
+        dict: Resultados formateados
+    """
+    if mode == 'lean':
+        results = solver.solve_lean(stride=stride, events=events)
+    elif mode == 'dense':
+        results = solver.solve_dense(output_points, events=events)
+    else:
+        results = solver.solve(events=events)
+
+    if exact_future is not None:
+        attach_exact_solution(results, exact_future, app.config['EXACT_SOLUTION_TIMEOUT'])
+    return results
+
+
+def solve_with_method(method_key):
+    """
+    Resolver la ecuación diferencial de la petición actual con el método indicado.
+
+    Args:
+        method_key (str): Clave del método en SOLVERS
+
+    Returns:
+        Respuesta de Flask con la página de resultados o un error JSON
+    """
+    method_class, method_name, history_label = SOLVERS[method_key]
+
     try:
         # Obtener datos del formulario
         data = request.get_json() if request.is_json else request.form
-
-        function_str = data['function']
-        x0 = float(data['x0'])
-        y0 = float(data['y0'])
-        xn = float(data['xn'])
-
-        # Determinar si es por número de pasos o tamaño de paso
-        if 'num_steps' in data and data['num_steps']:
-            num_steps = int(data['num_steps'])
-            h = (xn - x0) / num_steps
-        else:
-            h = float(data['step_size'])
-            num_steps = int((xn - x0) / h)
+        function_str, x0, y0, xn, h, num_steps = parse_problem(data)
+        parameters = parse_parameters(data)
 
         # Validar función
-        if not validate_function(function_str):
+        if not validate_function(function_str, parameters):
             return jsonify({'error': 'Función inválida. Use sintaxis Python válida.'}), 400
 
-        # Resolver usando método de Euler
-        euler = EulerMethod(function_str, x0, y0, h, num_steps)
-        results = euler.solve()
+        # La solución exacta (opcional) se busca en segundo plano mientras se resuelve
+        exact_future = None
+        if is_enabled(data, 'exact') and not getattr(method_class, 'SECOND_ORDER', False):
+            exact_future = request_exact_solution(function_str, x0, y0, parameters)
+
+        # Opciones del método, backend, tipo, guarda y eventos inválidos son errores de la petición
+        try:
+            solver = method_class(function_str, x0, y0, h, num_steps,
+                                  **method_class.options_from_request(data))
+            solver.parameters = parameters
+            solver.backend = resolve_backend(data, num_steps)
+            solver.dtype = resolve_dtype(data)
+            solver.guard = parse_guard(data)
+            solver.checkpoints = checkpoint_store
+            solver.checkpoint_interval = app.config['CHECKPOINT_INTERVAL_STEPS']
+            events = parse_events(data, parameters)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+
+        # Sensibilidades de y respecto a y0 y a los parámetros, en la misma integración
+        if is_enabled(data, 'sensitivity'):
+            try:
+                ForwardSensitivity(solver)
+            except ValueError as e:
+                return jsonify({'error': str(e)}), 400
+
+        # Modo de salida: 'lean' (solo valor final y traza opcional en JSON,
+        # memoria O(1)), 'dense' (puntos de salida) o 'full' (tabla completa)
+        output_points, stride = None, None
+        if data.get('mode') == 'lean':
+            mode = 'lean'
+            stride = int(data['stride']) if data.get('stride') else None
+        else:
+            output_points = parse_output_points(data, x0, x0 + num_steps * h)
+            mode = 'dense' if output_points is not None else 'full'
 
-        # Generar gráfica
-        plot_filename = f"euler_plot_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-        plot_path = create_ode_plot(results, "Método de Euler", plot_filename)
+        # Límites fijos de la configuración y presupuesto estimado antes de integrar
+        try:
+            admission_controller.check_problem(h, num_steps, mode)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+
+        decision, reason, estimate = admit_request(solver, mode, output_points, events)
+        admission = None
+        if decision == AdmissionController.DOWNGRADE:
+            # Sin tabla completa: traza submuestreada (JSON) o puntos equiespaciados (página)
+            points = app.config['DOWNGRADE_OUTPUT_POINTS']
+            if request.is_json:
+                mode, stride = 'lean', max(1, -(-num_steps // points))
+            else:
+                mode, output_points = 'dense', np.linspace(x0, x0 + num_steps * h, points)
+            admission = {'decision': decision, 'reason': reason, 'mode': mode}
+            decision, reason, estimate = admit_request(solver, mode, output_points, events)
+
+        if decision == AdmissionController.REJECT:
+            return jsonify({'error': f'Petición rechazada: {reason}', 'estimate': estimate}), 400
+
+        if decision == AdmissionController.BACKGROUND:
+            job_id = submit_job(lambda: run_solver(solver, mode, output_points, stride, events, exact_future),
+                                {'method': method_name, 'function': function_str, 'steps': num_steps, 'mode': mode})
+            if job_id is None:
+                return jsonify({'error': 'La cola en segundo plano está llena; inténtelo más tarde'}), 503
+            return jsonify({'job_id': job_id,
+                            'status_url': url_for('job', job_id=job_id),
+                            'reason': reason,
+                            'estimate': estimate}), 202
+
+        # Resolver usando el método seleccionado
+        results = run_solver(solver, mode, output_points, stride, events, exact_future)
+        if admission is not None:
+            results['admission'] = admission
+        if mode == 'lean':
+            return jsonify(results)
+
+        # Generar gráfica (nombre derivado del contenido: las repetidas se reutilizan)
+        plot_filename = create_ode_plot(results, method_name)
+        plot_sweeper.start()
 
         # Guardar en historial
         save_to_history({
-            'method': 'Euler',
+            'method': history_label,
             'function': function_str,
+            'parameters': parameters,
             'x0': x0, 'y0': y0, 'xn': xn,
             'h': h, 'steps': num_steps,
             'timestamp': datetime.now().isoformat(),
             'plot': plot_filename
         })
 
+        # Parámetros escalares de la petición, para los enlaces de descarga
+        export_query = {key: value for key, value in data.items()
+                        if isinstance(value, (str, int, float)) and key not in ('mode', 'exact')}
+
         return render_template('results.html',
                                results=results,
-                               method_name="Método de Euler",
-                               plot_url=f"static/plots/{plot_filename}",
+                               method_name=method_name,
+                               method_key=method_key,
+                               export_query=export_query if output_points is None else None,
+                               plot_url=url_for('plot_file', variant='web', filename=plot_filename),
+                               plot_filename=plot_filename,
                                function=function_str,
                                parameters={'x0': x0, 'y0': y0, 'xn': xn, 'h': h})
 
@@ -84,111 +443,359 @@ def solve_euler():
         return jsonify({'error': f'Error en el cálculo: {str(e)}'}), 500
 
 
+@app.route('/solve_euler', methods=['POST'])
+def solve_euler():
+    """Resolver ecuación diferencial usando método de Euler."""
+    return solve_with_method('euler')
+
+
 @app.route('/solve_heun', methods=['POST'])
 def solve_heun():
     """Resolver ecuación diferencial usando método de Heun."""
+    return solve_with_method('heun')
+
+
+@app.route('/solve_runge_kutta', methods=['POST'])
+def solve_runge_kutta():
+    """Resolver ecuación diferencial usando método de Runge-Kutta."""
+    return solve_with_method('runge_kutta')
+
+
+@app.route('/solve_adams_bashforth', methods=['POST'])
+def solve_adams_bashforth():
+    """Resolver ecuación diferencial usando Adams-Bashforth (orden 2-4)."""
+    return solve_with_method('adams_bashforth')
+
+
+@app.route('/solve_adams_moulton', methods=['POST'])
+def solve_adams_moulton():
+    """Resolver ecuación diferencial usando Adams-Bashforth-Moulton (orden 2-4)."""
+    return solve_with_method('adams_moulton')
+
+
+@app.route('/solve_scipy', methods=['POST'])
+def solve_scipy():
+    """Resolver ecuación diferencial con un integrador adaptativo de SciPy (solver, rtol, atol)."""
+    return solve_with_method('scipy')
+
+
+@app.route('/solve_bulirsch_stoer', methods=['POST'])
+def solve_bulirsch_stoer():
+    """Resolver ecuación diferencial por extrapolación de Bulirsch-Stoer (rtol, atol)."""
+    return solve_with_method('bulirsch_stoer')
+
+
+@app.route('/solve_verlet', methods=['POST'])
+def solve_verlet():
+    """Resolver y'' = f(x, y) con Störmer-Verlet (v0 = y'(x0))."""
+    return solve_with_method('verlet')
+
+
+@app.route('/solve_yoshida', methods=['POST'])
+def solve_yoshida():
+    """Resolver y'' = f(x, y) con el integrador simpléctico de Yoshida (v0 = y'(x0))."""
+    return solve_with_method('yoshida')
+
+
+@app.route('/export/<method_key>/<fmt>', methods=['GET', 'POST'])
+def export_solution(method_key, fmt):
+    """
+    Descargar la solución (x, y y etapas del método) como CSV, NPY o Parquet.
+
+    Acepta los mismos parámetros que las rutas de resolución, por query
+    string, formulario o JSON. El archivo se genera por bloques mientras se
+    envía, sin construirlo entero en memoria.
+    """
+    if method_key not in SOLVERS:
+        return jsonify({'error': f'Método desconocido: {method_key}'}), 404
+    if fmt not in EXPORT_FORMATS:
+        return jsonify({'error': f'Formato no soportado: {fmt}'}), 404
+    if fmt == 'parquet' and not PARQUET_AVAILABLE:
+        return jsonify({'error': 'La exportación Parquet requiere pyarrow en el servidor'}), 501
+
     try:
-        # Obtener datos del formulario
-        data = request.get_json() if request.is_json else request.form
+        data = request.get_json() if request.is_json else request.values
+        function_str, x0, y0, xn, h, num_steps = parse_problem(data)
+        parameters = parse_parameters(data)
 
-        function_str = data['function']
-        x0 = float(data['x0'])
-        y0 = float(data['y0'])
-        xn = float(data['xn'])
+        if not validate_function(function_str, parameters):
+            return jsonify({'error': 'Función inválida. Use sintaxis Python válida.'}), 400
 
-        # Determinar si es por número de pasos o tamaño de paso
-        if 'num_steps' in data and data['num_steps']:
-            num_steps = int(data['num_steps'])
-            h = (xn - x0) / num_steps
+        method_class = SOLVERS[method_key][0]
+        # Opciones del método, backend, tipo, guarda y eventos inválidos son errores de la petición
+        try:
+            solver = method_class(function_str, x0, y0, h, num_steps,
+                                  **method_class.options_from_request(data))
+            solver.parameters = parameters
+            solver.backend = resolve_backend(data, num_steps)
+            solver.dtype = resolve_dtype(data)
+            solver.guard = parse_guard(data)
+            solver.checkpoints = checkpoint_store
+            solver.checkpoint_interval = app.config['CHECKPOINT_INTERVAL_STEPS']
+            events = parse_events(data, parameters)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+
+        # La exportación no admite degradación ni cola: solo se acepta o se rechaza
+        try:
+            admission_controller.check_problem(h, num_steps, 'arrays')
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        decision, reason, estimate = admit_request(solver, 'arrays', events=events)
+        if decision != AdmissionController.ACCEPT:
+            return jsonify({'error': f'Exportación rechazada: {reason or "demasiado costosa"}',
+                            'estimate': estimate}), 400
+
+        # Las tablas grandes se integran en el pool de procesos (sin bloquear
+        # este worker con el GIL) y vuelven por memoria compartida, sin copias
+        if num_steps >= app.config['PROCESS_SOLVE_MIN_STEPS']:
+            integrate_in_process(solver, get_process_pool(), events=events)
         else:
-            h = float(data['step_size'])
-            num_steps = int((xn - x0) / h)
+            solver.integrate(events=events)
 
-        # Validar función
-        if not validate_function(function_str):
-            return jsonify({'error': 'Función inválida. Use sintaxis Python válida.'}), 400
+        return Response(stream_solution(solver, fmt),
+                        mimetype=EXPORT_FORMATS[fmt],
+                        headers={'Content-Disposition': f'attachment; filename={method_key}_solution.{fmt}'})
 
-        # Resolver usando método de Heun
-        heun = HeunMethod(function_str, x0, y0, h, num_steps)
-        results = heun.solve()
+    except Exception as e:
+        return jsonify({'error': f'Error en la exportación: {str(e)}'}), 500
 
-        # Generar gráfica
-        plot_filename = f"heun_plot_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-        plot_path = create_ode_plot(results, "Método de Heun", plot_filename)
 
-        # Guardar en historial
-        save_to_history({
-            'method': 'Heun',
-            'function': function_str,
-            'x0': x0, 'y0': y0, 'xn': xn,
-            'h': h, 'steps': num_steps,
-            'timestamp': datetime.now().isoformat(),
-            'plot': plot_filename
-        })
+@app.route('/sweep/<method_key>', methods=['POST'])
+def sweep_parameters(method_key):
+    """
+    Resolver el mismo problema para muchas combinaciones de parámetros a la vez.
 
-        return render_template('results.html',
-                               results=results,
-                               method_name="Método de Heun",
-                               plot_url=f"static/plots/{plot_filename}",
-                               function=function_str,
-                               parameters={'x0': x0, 'y0': y0, 'xn': xn, 'h': h})
+    Recibe JSON con los campos de las rutas de resolución más ``parameters``
+    ({"k": [..], "c": [..]}), ``combine`` ('grid' o 'zip') y, opcionalmente,
+    ``trajectories`` (false para devolver solo los valores finales).
+    """
+    if method_key not in SOLVERS:
+        return jsonify({'error': f'Método desconocido: {method_key}'}), 404
+
+    try:
+        data = request.get_json(silent=True)
+        if not isinstance(data, dict) or not isinstance(data.get('parameters'), dict):
+            return jsonify({'error': 'Envíe JSON con "parameters": {"nombre": [valores, ...]}'}), 400
+
+        function_str, x0, y0, xn, h, num_steps = parse_problem(data)
+        try:
+            admission_controller.check_problem(h, num_steps, 'lean')
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+
+        method_class = SOLVERS[method_key][0]
+        sweep = ParameterSweep(method_class, function_str, x0, y0, h, num_steps,
+                               data['parameters'], combine=data.get('combine', 'grid'),
+                               method_options=method_class.options_from_request(data))
+
+        include_trajectories = data.get('trajectories', True) is not False
+        stored_values = sweep.size * (num_steps + 1) if include_trajectories else sweep.size
+        if sweep.size > app.config['SWEEP_MAX_COMBINATIONS']:
+            return jsonify({'error': f"Demasiadas combinaciones: máximo {app.config['SWEEP_MAX_COMBINATIONS']}"}), 400
+        if stored_values > app.config['SWEEP_MAX_VALUES']:
+            return jsonify({'error': 'Barrido demasiado grande: pida trajectories=false o menos pasos'}), 400
+
+        mode = 'arrays' if include_trajectories else 'lean'
+        estimate = estimate_cost(method_class, function_str, num_steps, mode=mode, batch=sweep.size)
+        decision, reason = AdmissionController.ACCEPT, ''
+        if app.config['ADMISSION_CONTROL']:
+            decision, reason = admission_controller.decide(estimate, num_steps, can_downgrade=False)
+        if decision == AdmissionController.REJECT:
+            return jsonify({'error': f'Petición rechazada: {reason}', 'estimate': estimate}), 400
+        if decision == AdmissionController.BACKGROUND:
+            job_id = submit_job(lambda: sweep.run(include_trajectories=include_trajectories),
+                                {'method': f'Barrido ({method_class.METHOD_NAME})', 'function': function_str,
+                                 'steps': num_steps, 'mode': 'sweep'})
+            if job_id is None:
+                return jsonify({'error': 'La cola en segundo plano está llena; inténtelo más tarde'}), 503
+            return jsonify({'job_id': job_id, 'status_url': url_for('job', job_id=job_id),
+                            'reason': reason, 'estimate': estimate}), 202
+
+        return jsonify(sweep.run(include_trajectories=include_trajectories))
 
     except Exception as e:
-        return jsonify({'error': f'Error en el cálculo: {str(e)}'}), 500
+        return jsonify({'error': f'Error en el barrido: {str(e)}'}), 500
+
+
+@app.route('/solve_bvp/<method_key>', methods=['POST'])
+def solve_bvp(method_key):
+    """
+    Resolver un problema de contorno y'' = f(x, y, yp), y(x0) = y0, y(xn) = yn
+    por el método de disparo, integrando con el método indicado.
+
+    Además de los campos de las rutas de resolución (``function`` es f con
+    ``yp`` = y'), acepta ``yn`` (valor en xn), ``slope_min``/``slope_max``
+    (intervalo de pendientes iniciales) y ``candidates`` (disparos de la
+    primera tanda). Devuelve JSON con todas las soluciones encontradas.
+    """
+    if method_key not in SOLVERS:
+        return jsonify({'error': f'Método desconocido: {method_key}'}), 404
+    if getattr(SOLVERS[method_key][0], 'SECOND_ORDER', False):
+        return jsonify({'error': 'El disparo integra el sistema de primer orden equivalente: '
+                                 'use un método de primer orden'}), 400
 
-@app.route('/solve_runge_kutta', methods=['POST'])
-def solve_runge_kutta():
-    """Resolver ecuación diferencial usando método de Runge-Kutta."""
     try:
-        # Obtener datos del formulario
         data = request.get_json() if request.is_json else request.form
+        function_str, x0, y0, xn, h, num_steps = parse_problem(data)
 
-        function_str = data['function']
-        x0 = float(data['x0'])
-        y0 = float(data['y0'])
-        xn = float(data['xn'])
+        try:
+            candidates = int(data.get('candidates') or 64)
+            admission_controller.check_problem(h, num_steps, 'lean')
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        if candidates > app.config['BVP_MAX_CANDIDATES']:
+            return jsonify({'error': f"Demasiadas pendientes candidatas: máximo {app.config['BVP_MAX_CANDIDATES']}"}), 400
+        if num_steps * candidates > app.config['BVP_MAX_VALUES']:
+            return jsonify({'error': 'Disparo demasiado grande: pida menos pasos o menos pendientes candidatas'}), 400
+
+        method_class = SOLVERS[method_key][0]
+        try:
+            shooting = ShootingMethod(method_class, function_str, x0, y0, xn, float(data['yn']), num_steps,
+                                      slope_range=(float(data.get('slope_min') or -10),
+                                                   float(data.get('slope_max') or 10)),
+                                      candidates=candidates,
+                                      method_options=method_class.options_from_request(data),
+                                      parameters=parse_parameters(data))
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+
+        # La primera tanda domina el coste: una integración por pendiente candidata
+        estimate = estimate_cost(method_class, function_str, num_steps, mode='lean', batch=candidates)
+        decision, reason = AdmissionController.ACCEPT, ''
+        if app.config['ADMISSION_CONTROL']:
+            decision, reason = admission_controller.decide(estimate, num_steps, can_downgrade=False)
+        if decision == AdmissionController.REJECT:
+            return jsonify({'error': f'Petición rechazada: {reason}', 'estimate': estimate}), 400
+        if decision == AdmissionController.BACKGROUND:
+            job_id = submit_job(shooting.solve,
+                                {'method': f'Disparo ({method_class.METHOD_NAME})', 'function': function_str,
+                                 'steps': num_steps, 'mode': 'bvp'})
+            if job_id is None:
+                return jsonify({'error': 'La cola en segundo plano está llena; inténtelo más tarde'}), 503
+            return jsonify({'job_id': job_id, 'status_url': url_for('job', job_id=job_id),
+                            'reason': reason, 'estimate': estimate}), 202
+
+        return jsonify(shooting.solve())
 
-        # Determinar si es por número de pasos o tamaño de paso
-        if 'num_steps' in data and data['num_steps']:
-            num_steps = int(data['num_steps'])
-            h = (xn - x0) / num_steps
-        else:
-            h = float(data['step_size'])
-            num_steps = int((xn - x0) / h)
+    except Exception as e:
+        return jsonify({'error': f'Error en el cálculo: {str(e)}'}), 500
 
-        # Validar función
-        if not validate_function(function_str):
-            return jsonify({'error': 'Función inválida. Use sintaxis Python válida.'}), 400
 
-        # Resolver usando método de Runge-Kutta
-        rk = RungeKuttaMethod(function_str, x0, y0, h, num_steps)
-        results = rk.solve()
+@app.route('/solve_parareal/<method_key>', methods=['POST'])
+def solve_parareal(method_key):
+    """
+    Resolver un problema de valor inicial largo con Parareal: el método
+    indicado es el propagador fino y Euler el grueso; los subintervalos se
+    integran en paralelo en el pool de procesos.
 
-        # Generar gráfica
-        plot_filename = f"runge_kutta_plot_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-        plot_path = create_ode_plot(results, "Método de Runge-Kutta", plot_filename)
+    Además de los campos de las rutas de resolución acepta ``slices``
+    (subintervalos, por defecto uno por proceso del pool), ``coarse_ratio``
+    (pasos finos por paso grueso), ``tolerance`` y ``max_iterations``.
+    Devuelve JSON (o 202 con el trabajo si es demasiado largo para esperar).
+    """
+    if method_key not in SOLVERS:
+        return jsonify({'error': f'Método desconocido: {method_key}'}), 404
+    if getattr(SOLVERS[method_key][0], 'SECOND_ORDER', False):
+        return jsonify({'error': 'Parareal solo corrige y en las fronteras: use un método de primer orden'}), 400
 
-        # Guardar en historial
-        save_to_history({
-            'method': 'Runge-Kutta',
-            'function': function_str,
-            'x0': x0, 'y0': y0, 'xn': xn,
-            'h': h, 'steps': num_steps,
-            'timestamp': datetime.now().isoformat(),
-            'plot': plot_filename
-        })
+    try:
+        data = request.get_json() if request.is_json else request.form
+        function_str, x0, y0, xn, h, num_steps = parse_problem(data)
+        method_class = SOLVERS[method_key][0]
+        processes = process_pool_size()
 
-        return render_template('results.html',
-                               results=results,
-                               method_name="Método de Runge-Kutta",
-                               plot_url=f"static/plots/{plot_filename}",
-                               function=function_str,
-                               parameters={'x0': x0, 'y0': y0, 'xn': xn, 'h': h})
+        try:
+            admission_controller.check_problem(h, num_steps, 'lean')
+            slices = int(data.get('slices') or processes)
+            if slices > app.config['PARAREAL_MAX_SLICES']:
+                raise ValueError(f"Demasiados subintervalos: máximo {app.config['PARAREAL_MAX_SLICES']}")
+
+            parareal = Parareal(method_class, function_str, x0, y0, h, num_steps, slices,
+                                coarse_ratio=int(data.get('coarse_ratio') or 10),
+                                tolerance=float(data.get('tolerance') or 1e-10),
+                                max_iterations=min(int(data.get('max_iterations')
+                                                       or app.config['PARAREAL_MAX_ITERATIONS']),
+                                                   app.config['PARAREAL_MAX_ITERATIONS']),
+                                method_options=method_class.options_from_request(data),
+                                parameters=parse_parameters(data))
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+
+        pool = get_process_pool()
+
+        estimate = estimate_cost(method_class, function_str, num_steps, mode='lean')
+        decision, reason = AdmissionController.ACCEPT, ''
+        if app.config['ADMISSION_CONTROL']:
+            decision, reason = admission_controller.decide(estimate, num_steps, can_downgrade=False)
+        if decision == AdmissionController.REJECT:
+            return jsonify({'error': f'Petición rechazada: {reason}', 'estimate': estimate}), 400
+        if decision == AdmissionController.BACKGROUND:
+            job_id = submit_job(lambda: parareal.solve(executor=pool, processes=processes),
+                                {'method': f'Parareal ({method_class.METHOD_NAME})', 'function': function_str,
+                                 'steps': num_steps, 'mode': 'parareal'})
+            if job_id is None:
+                return jsonify({'error': 'La cola en segundo plano está llena; inténtelo más tarde'}), 503
+            return jsonify({'job_id': job_id, 'status_url': url_for('job', job_id=job_id),
+                            'reason': reason, 'estimate': estimate}), 202
+
+        return jsonify(parareal.solve(executor=pool, processes=processes))
 
     except Exception as e:
         return jsonify({'error': f'Error en el cálculo: {str(e)}'}), 500
 
 
+def parse_job_wait(args):
+    """Segundos de espera pedidos en ?wait=, acotados por JOB_WAIT_MAX_SECONDS."""
+    try:
+        wait = float(args.get('wait') or 0)
+    except ValueError:
+        return 0.0
+    return min(max(wait, 0.0), app.config['JOB_WAIT_MAX_SECONDS'])
+
+
+@app.route('/jobs/<job_id>')
+def job(job_id):
+    """
+    Consultar el estado (y el resultado, al terminar) de una resolución en segundo plano.
+
+    Con ``?wait=<segundos>`` la respuesta espera a que el trabajo termine
+    (como mucho JOB_WAIT_MAX_SECONDS) en lugar de tener que consultar en
+    bucle. En el modo ASGI (asgi.py) esta espera no ocupa ningún hilo.
+    """
+    wait = parse_job_wait(request.args)
+    status = wait_for_job(job_id, wait) if wait else job_status(job_id)
+    if status is None:
+        return jsonify({'error': f'Trabajo desconocido: {job_id}'}), 404
+    return jsonify(status)
+
+
+@app.route('/plots/<variant>/<path:filename>')
+def plot_file(variant, filename):
+    """
+    Servir una variante de una gráfica: 'web', 'thumb' (miniatura), 'svg' o
+    'hidpi' (las dos últimas se generan la primera vez que se piden).
+
+    El contenido de una variante no cambia, así que se sirve con un ETag
+    fuerte (hash del contenido) y una caché larga.
+    """
+    if not is_plot_name(filename):
+        return jsonify({'error': 'Nombre de gráfica inválido'}), 400
+
+    try:
+        path, mimetype = get_plot_variant(filename, variant)
+    except FileNotFoundError:
+        return jsonify({'error': f'Gráfica no encontrada: {filename} ({variant})'}), 404
+
+    response = send_file(os.path.abspath(path), mimetype=mimetype, etag=False, conditional=False)
+    response.set_etag(plot_etag(path))
+    response.cache_control.no_cache = None
+    response.cache_control.public = True
+    response.cache_control.max_age = app.config['PLOT_CACHE_MAX_AGE']
+    response.cache_control.immutable = True
+    return response.make_conditional(request)
+
+
 @app.route('/history')
 def history():
     """Mostrar historial de cálculos."""
@@ -206,11 +813,49 @@ def clear_history():
     try:
         with open('history.json', 'w') as f:
             json.dump([], f)
+        # Las gráficas del historial dejan de estar protegidas
+        plot_sweeper.start()
+        plot_sweeper.request_sweep()
         return redirect(url_for('history'))
     except Exception as e:
         return jsonify({'error': f'Error al limpiar historial: {str(e)}'}), 500
 
 
+def referenced_plots():
+    """
+    Gráficas referenciadas por el historial (el recolector no las borra).
+
+    Returns:
+        list: Nombres de las gráficas, o None si el historial está vacío o
+            corrupto (el recolector conserva entonces todas)
+    """
+    try:
+        with open('history.json', 'r') as f:
+            history = json.load(f)
+    except FileNotFoundError:
+        return []
+    except (OSError, ValueError) as e:
+        app.logger.warning(f"Historial ilegible ({e}): no se borra ninguna gráfica")
+        return None
+
+    if not isinstance(history, list):
+        app.logger.warning("Historial con formato inesperado: no se borra ninguna gráfica")
+        return None
+    return [entry.get('plot') for entry in history if isinstance(entry, dict)]
+
+
+# Recolector del almacén de gráficas (arranca con la primera gráfica de cada proceso)
+plot_sweeper = PlotSweeper(plot_directory(), referenced_plots,
+                           max_bytes=app.config['PLOT_STORE_MAX_MB'] * 1024 * 1024,
+                           max_age=app.config['PLOT_STORE_MAX_AGE_DAYS'] * 24 * 3600,
+                           interval=app.config['PLOT_SWEEP_INTERVAL'],
+                           grace=app.config['PLOT_SWEEP_GRACE'],
+                           logger=app.logger)
+
+# Arrays compartidos que dejó un worker del pool que murió antes de entregarlos
+sweep_shared_arrays()
+
+
 def save_to_history(calculation_data):
     """Guardar cálculo en historial."""
     try:
@@ -0,0 +1,257 @@
+"""
+asgi.py - Modo de servicio ASGI (asyncio) de la aplicación ODE Solver
+
+Sirve la misma aplicación Flask (rutas, plantillas y respuestas idénticas)
+desde un bucle de eventos: las conexiones, la lectura del cuerpo de las
+peticiones y el envío de las respuestas son corrutinas, y solo el trabajo
+de cada petición (resolver, dibujar, leer y escribir el historial) se
+ejecuta en un pool acotado de hilos. Los clientes lentos y las respuestas
+por bloques (exportaciones, gráficas) no retienen un hilo mientras esperan
+a la red, y las esperas largas de /jobs/<id>?wait=<s> no ocupan ninguno.
+
+Uso:
+    python run.py --asgi                 # uvicorn (pip install uvicorn)
+    uvicorn asgi:application --port 5000
+"""
+
+import asyncio
+import io
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs
+
+from app import app, parse_job_wait
+from utils.jobs import add_job_callback, job_status, remove_job_callback
+
+JOB_PATH = re.compile(r'^/jobs/(?P<job_id>[0-9a-f]+)$')
+
+
+class ASGIApplication:
+    """
+    Adaptador ASGI de una aplicación WSGI con el trabajo en un pool de hilos.
+
+    Cada petición HTTP se lee entera en el bucle de eventos y se despacha
+    al pool, que ejecuta la aplicación WSGI y va sacando los bloques de la
+    respuesta; el bucle solo los envía. Si el cliente se desconecta a mitad
+    de una respuesta por bloques, se deja de generar.
+    """
+
+    def __init__(self, wsgi_app, max_threads=4, chunk_bytes=64 * 1024, max_body_bytes=None):
+        """
+        Inicializar el adaptador.
+
+        Args:
+            wsgi_app (callable): Aplicación WSGI
+            max_threads (int): Peticiones que se ejecutan a la vez (el resto espera en cola)
+            chunk_bytes (int): Bytes mínimos por envío al juntar los bloques de una respuesta
+            max_body_bytes (int, optional): Tamaño máximo del cuerpo de una petición
+        """
+        self.wsgi_app = wsgi_app
+        self.chunk_bytes = chunk_bytes
+        self.max_body_bytes = max_body_bytes
+        self.executor = ThreadPoolExecutor(max_workers=max_threads, thread_name_prefix='asgi-request')
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+        elif scope['type'] == 'http':
+            match = JOB_PATH.match(scope['path'])
+            if match and scope['method'] == 'GET' and b'wait=' in scope.get('query_string', b''):
+                await self._wait_for_job(scope, send, match.group('job_id'))
+            else:
+                await self._handle(scope, receive, send)
+        else:
+            raise ValueError(f"Tipo de conexión no soportado: {scope['type']}")
+
+    async def _lifespan(self, receive, send):
+        """Arranque y parada del servidor: al parar se libera el pool."""
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                self.executor.shutdown(wait=False)
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def _read_body(self, receive):
+        """
+        Leer el cuerpo completo de la petición.
+
+        Returns:
+            bytes: Cuerpo, o None si el cliente se desconectó o superó el máximo
+        """
+        body = bytearray()
+        while True:
+            message = await receive()
+            if message['type'] == 'http.disconnect':
+                return None
+            body.extend(message.get('body', b''))
+            if self.max_body_bytes is not None and len(body) > self.max_body_bytes:
+                return None
+            if not message.get('more_body', False):
+                return bytes(body)
+
+    def _environ(self, scope, body):
+        """Construir el entorno WSGI de una petición ASGI."""
+        server = scope.get('server') or ('localhost', 80)
+        client = scope.get('client') or ('', 0)
+        environ = {
+            'REQUEST_METHOD': scope['method'],
+            'SCRIPT_NAME': scope.get('root_path', '').encode('utf-8').decode('latin-1'),
+            'PATH_INFO': scope['path'].encode('utf-8').decode('latin-1'),
+            'QUERY_STRING': scope.get('query_string', b'').decode('latin-1'),
+            'SERVER_NAME': server[0],
+            'SERVER_PORT': str(server[1]),
+            'SERVER_PROTOCOL': f"HTTP/{scope.get('http_version', '1.1')}",
+            'REMOTE_ADDR': client[0],
+            'REMOTE_PORT': str(client[1]),
+            'wsgi.version': (1, 0),
+            'wsgi.url_scheme': scope.get('scheme', 'http'),
+            'wsgi.input': io.BytesIO(body),
+            'wsgi.errors': sys.stderr,
+            'wsgi.multithread': True,
+            'wsgi.multiprocess': False,
+            'wsgi.run_once': False,
+            'CONTENT_LENGTH': str(len(body)),
+        }
+        for name, value in scope.get('headers', []):
+            name = name.decode('latin-1').upper().replace('-', '_')
+            value = value.decode('latin-1')
+            if name == 'CONTENT_TYPE':
+                environ['CONTENT_TYPE'] = value
+            elif name != 'CONTENT_LENGTH':
+                key = f'HTTP_{name}'
+                environ[key] = f'{environ[key]},{value}' if key in environ else value
+        return environ
+
+    def _start(self, environ):
+        """
+        Ejecutar la aplicación WSGI hasta tener el estado y las cabeceras (en el pool).
+
+        Returns:
+            tuple: (estado, cabeceras, iterador del cuerpo, bloque inicial)
+        """
+        response = {}
+        written = []
+
+        def start_response(status, headers, exc_info=None):
+            if exc_info is not None and response:
+                raise exc_info[1].with_traceback(exc_info[2])
+            response['status'] = int(status.split(' ', 1)[0])
+            response['headers'] = [(name.lower().encode('latin-1'), value.encode('latin-1'))
+                                   for name, value in headers]
+            return written.append
+
+        result = self.wsgi_app(environ, start_response)
+        iterator = iter(result)
+        first = self._next_chunk(iterator, result, written)
+        return response['status'], response['headers'], (iterator, result), first
+
+    def _next_chunk(self, iterator, result, prefix=None):
+        """
+        Sacar el siguiente bloque de la respuesta juntando bloques pequeños (en el pool).
+
+        Returns:
+            tuple: (bytes, si quedan más bloques)
+        """
+        chunk = bytearray(b''.join(prefix or ()))
+        for data in iterator:
+            chunk.extend(data)
+            if len(chunk) >= self.chunk_bytes:
+                return bytes(chunk), True
+        self._close(result)
+        return bytes(chunk), False
+
+    @staticmethod
+    def _close(result):
+        close = getattr(result, 'close', None)
+        if close is not None:
+            close()
+
+    async def _handle(self, scope, receive, send):
+        """Atender una petición con la aplicación WSGI en el pool de hilos."""
+        body = await self._read_body(receive)
+        if body is None:
+            if self.max_body_bytes is not None:
+                await self._send_simple(send, 413, b'Request Entity Too Large', 'text/plain')
+            return
+
+        loop = asyncio.get_running_loop()
+        status, headers, (iterator, result), (chunk, more) = await loop.run_in_executor(
+            self.executor, self._start, self._environ(scope, body))
+
+        await send({'type': 'http.response.start', 'status': status, 'headers': headers})
+        if not more:
+            await send({'type': 'http.response.body', 'body': chunk, 'more_body': False})
+            return
+
+        # Respuesta por bloques: generar en el pool mientras se vigila la desconexión
+        disconnected = asyncio.Event()
+        watcher = asyncio.ensure_future(self._watch_disconnect(receive, disconnected))
+        try:
+            while more and not disconnected.is_set():
+                await send({'type': 'http.response.body', 'body': chunk, 'more_body': True})
+                chunk, more = await loop.run_in_executor(self.executor, self._next_chunk, iterator, result)
+            if more:
+                await loop.run_in_executor(self.executor, self._close, result)
+            else:
+                await send({'type': 'http.response.body', 'body': chunk, 'more_body': False})
+        finally:
+            watcher.cancel()
+
+    @staticmethod
+    async def _watch_disconnect(receive, disconnected):
+        while True:
+            message = await receive()
+            if message['type'] == 'http.disconnect':
+                disconnected.set()
+                return
+
+    async def _wait_for_job(self, scope, send, job_id):
+        """
+        /jobs/<id>?wait=<s> sin ocupar un hilo: la corrutina espera al aviso
+        de fin del trabajo (o al plazo) y responde como la ruta de Flask.
+        """
+        query = {key: values[-1] for key, values in parse_qs(scope['query_string'].decode('latin-1')).items()}
+        with app.app_context():
+            timeout = parse_job_wait(query)
+
+        loop = asyncio.get_running_loop()
+        finished = asyncio.Event()
+
+        def notify():
+            loop.call_soon_threadsafe(finished.set)
+
+        if not add_job_callback(job_id, notify):
+            status = None
+        else:
+            try:
+                await asyncio.wait_for(finished.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                remove_job_callback(job_id, notify)
+            status = job_status(job_id)
+
+        if status is None:
+            status, code = {'error': f'Trabajo desconocido: {job_id}'}, 404
+        else:
+            code = 200
+        payload = await loop.run_in_executor(self.executor, app.json.dumps, status)
+        await self._send_simple(send, code, payload.encode('utf-8') + b'\n', 'application/json')
+
+    @staticmethod
+    async def _send_simple(send, status, body, content_type):
+        await send({'type': 'http.response.start', 'status': status,
+                    'headers': [(b'content-type', content_type.encode('latin-1')),
+                                (b'content-length', str(len(body)).encode('latin-1'))]})
+        await send({'type': 'http.response.body', 'body': body, 'more_body': False})
+
+
+# Aplicación ASGI (uvicorn asgi:application)
+application = ASGIApplication(app,
+                              max_threads=app.config['ASGI_EXECUTOR_THREADS'],
+                              chunk_bytes=app.config['ASGI_STREAM_CHUNK_BYTES'],
+                              max_body_bytes=app.config['MAX_CONTENT_LENGTH'])
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+benchmark.py - Comparativa de rendimiento de los métodos de paso fijo frente a SciPy
+
+Resuelve problemas de prueba con solución exacta conocida con Euler, Heun y
+Runge-Kutta (variando el número de pasos) y con Bulirsch-Stoer y los
+integradores adaptativos de SciPy (variando la tolerancia), y mide para cada
+configuración el error final, las evaluaciones de f y el tiempo. El
+resumen indica, para cada precisión objetivo, la configuración más barata
+de cada método: la base para decidir a qué motor enviar las peticiones
+costosas.
+
+Todas las resoluciones usan el modo lean (solo el valor final).
+"""
+
+import argparse
+import json
+import math
+import time
+
+from models import BulirschStoerMethod, EulerMethod, HeunMethod, RungeKuttaMethod, SciPyMethod
+
+# Problemas de prueba: f, condición inicial, intervalo y solución exacta
+PROBLEMS = {
+    'crecimiento': {'function': 'y', 'x0': 0.0, 'y0': 1.0, 'xn': 2.0,
+                    'exact': lambda x: math.exp(x)},
+    'lineal': {'function': 'x - y', 'x0': 0.0, 'y0': 1.0, 'xn': 5.0,
+               'exact': lambda x: x - 1 + 2 * math.exp(-x)},
+    'gaussiana': {'function': '-2*x*y', 'x0': 0.0, 'y0': 1.0, 'xn': 3.0,
+                  'exact': lambda x: math.exp(-x * x)},
+    'oscilante': {'function': 'cos(x)*y', 'x0': 0.0, 'y0': 1.0, 'xn': 20.0,
+                  'exact': lambda x: math.exp(math.sin(x))},
+    'rigida': {'function': '-50*(y - cos(x))', 'x0': 0.0, 'y0': 0.0, 'xn': 2.0,
+               'exact': lambda x: (2500 * math.cos(x) + 50 * math.sin(x) - 2500 * math.exp(-50 * x)) / 2501},
+}
+
+FIXED_METHODS = {'euler': EulerMethod, 'heun': HeunMethod, 'runge_kutta': RungeKuttaMethod}
+
+DEFAULT_STEPS = [10, 100, 1000, 10000]
+DEFAULT_SOLVERS = ['RK45', 'DOP853', 'Radau', 'BDF', 'LSODA']
+DEFAULT_TOLERANCES = [1e-3, 1e-6, 1e-9, 1e-12]
+DEFAULT_TARGETS = [1e-3, 1e-6, 1e-9]
+
+
+def run_case(solver, exact_final, repeat):
+    """
+    Resolver un caso varias veces y quedarse con el tiempo mínimo.
+
+    Args:
+        solver (ODEMethod): Método configurado
+        exact_final (float): Valor exacto en el extremo del intervalo
+        repeat (int): Repeticiones (el tiempo es el mejor de ellas)
+
+    Returns:
+        dict: Error final, evaluaciones, segundos y backend usado
+    """
+    best = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = solver.solve_lean()
+        best = min(best, time.perf_counter() - start)
+
+    summary = results['summary']
+    error = abs(results['final']['y'] - exact_final) if 'divergence' not in results else math.inf
+    return {
+        'error': error,
+        'evaluations': summary['function_evaluations'],
+        'seconds': best,
+        'backend': summary['backend'],
+        'diverged': 'divergence' in results,
+    }
+
+
+def benchmark_problem(name, problem, steps, solvers, tolerances, backend='python', repeat=3):
+    """
+    Medir todas las configuraciones sobre un problema.
+
+    Los métodos de paso fijo se prueban con cada número de pasos; los
+    adaptativos (Bulirsch-Stoer y SciPy), con cada tolerancia relativa (la
+    absoluta es 1e-3 veces menor) y un único punto de salida.
+
+    Returns:
+        list: Un registro por configuración
+    """
+    exact_final = problem['exact'](problem['xn'])
+    span = problem['xn'] - problem['x0']
+    records = []
+
+    for key, method_class in FIXED_METHODS.items():
+        for num_steps in steps:
+            solver = method_class(problem['function'], problem['x0'], problem['y0'], span / num_steps, num_steps)
+            solver.backend = backend
+            records.append({'problem': name, 'method': key, 'setting': f'n={num_steps}',
+                            **run_case(solver, exact_final, repeat)})
+
+    for rtol in tolerances:
+        solver = BulirschStoerMethod(problem['function'], problem['x0'], problem['y0'], span, 1,
+                                     rtol=rtol, atol=rtol * 1e-3)
+        solver.backend = backend
+        records.append({'problem': name, 'method': 'bulirsch_stoer', 'setting': f'rtol={rtol:g}',
+                        **run_case(solver, exact_final, repeat)})
+
+    for solver_name in solvers:
+        for rtol in tolerances:
+            solver = SciPyMethod(problem['function'], problem['x0'], problem['y0'], span, 1,
+                                 solver=solver_name, rtol=rtol, atol=rtol * 1e-3)
+            solver.backend = backend
+            records.append({'problem': name, 'method': f'scipy_{solver_name}', 'setting': f'rtol={rtol:g}',
+                            **run_case(solver, exact_final, repeat)})
+
+    return records
+
+
+def cheapest_by_target(records, targets):
+    """
+    Configuración más barata (en evaluaciones) de cada método que alcanza
+    cada precisión objetivo, por problema.
+
+    Returns:
+        dict: problema -> objetivo -> método -> registro (o None si no lo alcanza)
+    """
+    summary = {}
+    for record in records:
+        problem = summary.setdefault(record['problem'], {f'{target:g}': {} for target in targets})
+        for target in targets:
+            methods = problem[f'{target:g}']
+            current = methods.get(record['method'])
+            if record['error'] <= target and (current is None or record['evaluations'] < current['evaluations']):
+                methods[record['method']] = record
+            else:
+                methods.setdefault(record['method'], None)
+    return summary
+
+
+def print_records(records):
+    """Imprimir la tabla de resultados de un problema."""
+    header = f"{'Método':<16}{'Ajuste':>14}{'Evaluaciones':>14}{'Error final':>14}{'ms':>10}"
+    print(header)
+    print('-' * len(header))
+    for record in records:
+        error = 'diverge' if record['diverged'] else f"{record['error']:.2e}"
+        print(f"{record['method']:<16}{record['setting']:>14}{record['evaluations']:>14}"
+              f"{error:>14}{record['seconds'] * 1000:>10.2f}")
+
+
+def print_summary(summary):
+    """Imprimir, por precisión objetivo, el método más barato que la alcanza."""
+    for problem, targets in summary.items():
+        print(f"\n{problem}")
+        for target, methods in targets.items():
+            reached = [(record['evaluations'], record['seconds'], method, record['setting'])
+                       for method, record in methods.items() if record is not None]
+            if not reached:
+                print(f"  error ≤ {target:>6}: ningún método lo alcanza")
+                continue
+            evaluations, seconds, method, setting = min(reached)
+            fastest = min(reached, key=lambda item: item[1])
+            print(f"  error ≤ {target:>6}: menos evaluaciones {method} ({setting}, {evaluations}); "
+                  f"más rápido {fastest[2]} ({fastest[3]}, {fastest[1] * 1000:.2f} ms)")
+
+
+def _parse_list(text, cast):
+    return [cast(item) for item in text.split(',') if item.strip()]
+
+
+def main():
+    """Función principal."""
+    parser = argparse.ArgumentParser(
+        description='Comparativa de los métodos de paso fijo frente a los adaptativos (Bulirsch-Stoer, SciPy)',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Ejemplos:
+  python benchmark.py                          # Todos los problemas y configuraciones
+  python benchmark.py --problems lineal,rigida # Solo algunos problemas
+  python benchmark.py --backend jit --json benchmark.json
+        """
+    )
+    parser.add_argument('--problems', help=f"Problemas separados por comas ({', '.join(PROBLEMS)})")
+    parser.add_argument('--steps', help='Números de pasos de los métodos de paso fijo (ej: 10,100,1000)')
+    parser.add_argument('--solvers', help=f"Integradores de SciPy ({', '.join(SciPyMethod.SOLVERS)})")
+    parser.add_argument('--tolerances', help='Tolerancias relativas de SciPy (ej: 1e-3,1e-6)')
+    parser.add_argument('--targets', help='Precisiones objetivo del resumen (ej: 1e-4,1e-8)')
+    parser.add_argument('--backend', choices=['python', 'jit'], default='python',
+                        help='Backend de evaluación de f')
+    parser.add_argument('--repeat', type=int, default=3, help='Repeticiones por caso (se toma la mejor)')
+    parser.add_argument('--json', help='Guardar el informe en un archivo JSON')
+
+    args = parser.parse_args()
+
+    problems = _parse_list(args.problems, str) if args.problems else list(PROBLEMS)
+    unknown = [name for name in problems if name not in PROBLEMS]
+    if unknown:
+        parser.error(f"Problemas desconocidos: {', '.join(unknown)}")
+    steps = _parse_list(args.steps, int) if args.steps else DEFAULT_STEPS
+    solvers = _parse_list(args.solvers, str) if args.solvers else DEFAULT_SOLVERS
+    tolerances = _parse_list(args.tolerances, float) if args.tolerances else DEFAULT_TOLERANCES
+    targets = _parse_list(args.targets, float) if args.targets else DEFAULT_TARGETS
+
+    records = []
+    try:
+        for name in problems:
+            problem = PROBLEMS[name]
+            print(f"\n📐 {name}: dy/dx = {problem['function']}, y({problem['x0']:g}) = {problem['y0']:g}, "
+                  f"x ∈ [{problem['x0']:g}, {problem['xn']:g}]")
+            problem_records = benchmark_problem(name, problem, steps, solvers, tolerances,
+                                                backend=args.backend, repeat=args.repeat)
+            print_records(problem_records)
+            records.extend(problem_records)
+    except KeyboardInterrupt:
+        print("\n\n👋 Comparativa interrumpida")
+
+    summary = cheapest_by_target(records, targets)
+    print("\n🏁 Configuración más barata por precisión objetivo")
+    print_summary(summary)
+
+    if args.json:
+        report = {'backend': args.backend, 'records': records,
+                  'cheapest': {problem: {target: {method: record and record['setting']
+                                                  for method, record in methods.items()}
+                                         for target, methods in targets_.items()}
+                               for problem, targets_ in summary.items()}}
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n✓ Informe guardado en {args.json}")
+
+
+if __name__ == '__main__':
+    main()
@@ -20,14 +20,83 @@ class Config:
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB máximo
 
     # Configuración de plots
-    PLOT_DPI = 150
-    PLOT_FIGSIZE = (10, 6)
+    PLOT_DPI = 150  # Variante web (la que se muestra en los resultados)
+    PLOT_HIDPI = 300  # Variante de alta resolución (solo bajo demanda)
+    PLOT_THUMBNAIL_WIDTH = 320  # Ancho en píxeles de la miniatura del historial
+    PLOT_CACHE_MAX_AGE = 365 * 24 * 3600  # Las variantes no cambian: caché de un año
+    PLOT_FIGSIZE = (12, 8)
+
+    # Almacén de gráficas (static/plots/<xx>/<hash>.png) y su recolector
+    PLOT_STORE_MAX_MB = 512  # Tamaño máximo del almacén
+    PLOT_STORE_MAX_AGE_DAYS = 30  # Días sin uso tras los que se borra una gráfica
+    PLOT_SWEEP_INTERVAL = 600  # Segundos entre pasadas del recolector
+    PLOT_SWEEP_GRACE = 600  # Antigüedad mínima (s) para borrar una gráfica aún sin historial
     PLOT_STYLE = 'seaborn-v0_8'  # Estilo de matplotlib
 
     # Configuración de métodos numéricos
     MAX_STEPS = 10000  # Máximo número de pasos permitidos
     MIN_STEP_SIZE = 1e-8  # Tamaño mínimo de paso
     MAX_STEP_SIZE = 10.0  # Tamaño máximo de paso
+    LEAN_MAX_STEPS = 50_000_000  # Máximo en modo 'lean' (solo valor final / traza)
+
+    # Control de admisión (ver utils/cost.py): presupuestos por petición
+    ADMISSION_CONTROL = True
+    ADMISSION_CPU_SECONDS = 2.0  # Tiempo estimado máximo para responder en línea
+    ADMISSION_MEMORY_MB = 256  # Memoria estimada máxima por petición
+    BACKGROUND_CPU_SECONDS = 120.0  # Tiempo estimado máximo en la cola en segundo plano
+    DOWNGRADE_OUTPUT_POINTS = 1000  # Puntos de salida al degradar una tabla completa
+
+    # Cola en segundo plano (utils/jobs.py)
+    BACKGROUND_WORKERS = 1
+    BACKGROUND_MAX_PENDING = 16  # Trabajos en espera o en ejecución
+    BACKGROUND_MAX_RESULTS = 64  # Trabajos terminados conservados
+    JOB_WAIT_MAX_SECONDS = 60  # Espera máxima de /jobs/<id>?wait=<s>
+
+    # Pool de procesos para integrar en paralelo (Parareal, /solve_parareal/<método>)
+    PROCESS_POOL_WORKERS = 0  # 0 = uno por núcleo
+    PROCESS_SOLVE_MIN_STEPS = 500_000  # Exportaciones desde este tamaño se integran en el pool
+    SHARED_ARRAY_DIR = ''  # Arrays devueltos por el pool ('' = /dev/shm o el temporal del sistema)
+    PARAREAL_MAX_SLICES = 256  # Subintervalos máximos
+    PARAREAL_MAX_ITERATIONS = 20  # Iteraciones de corrección máximas
+
+    # Barridos de parámetros (/sweep/<método>)
+    SWEEP_MAX_COMBINATIONS = 100_000  # Combinaciones de parámetros por barrido
+    SWEEP_MAX_VALUES = 20_000_000  # Combinaciones x puntos guardados en las trayectorias
+
+    # Problemas de contorno por disparo (/solve_bvp/<método>)
+    BVP_MAX_CANDIDATES = 1024  # Pendientes iniciales de la primera tanda
+    BVP_MAX_VALUES = 20_000_000  # Pasos x pendientes candidatas integrados en cada tanda
+
+    # Puntos de control por problema (ver utils/checkpoints.py): continuar una
+    # resolución anterior al ampliar xn y retomar trabajos largos tras un reinicio.
+    # Desactivados por defecto (escriben en disco): ODE_CHECKPOINTS=true los activa
+    CHECKPOINTS = os.environ.get('ODE_CHECKPOINTS', 'False').lower() == 'true'
+    CHECKPOINT_DIR = './checkpoints'
+    CHECKPOINT_MIN_STEPS = 100_000  # Pasos mínimos para guardar un punto de control
+    CHECKPOINT_MAX_PROBLEMS = 256  # Problemas conservados (se borran los menos usados)
+    CHECKPOINT_MAX_MB = 1024  # Tamaño máximo del almacén
+    CHECKPOINT_MAX_AGE_DAYS = 7  # Días sin uso tras los que se borra un problema
+    CHECKPOINT_INTERVAL_STEPS = 1_000_000  # Pasos entre puntos de control en modo 'lean'
+
+    # Guarda de divergencia (ver models/divergence.py)
+    DIVERGENCE_MAX_MAGNITUDE = 1e100  # Máximo |y| antes de detener la integración
+    DIVERGENCE_MAX_GROWTH = 1e3  # Máximo crecimiento relativo de y en un paso
+
+    # Backend de integración: 'python', 'jit' (Numba, opcional) o 'auto'
+    SOLVER_BACKEND = 'auto'
+    JIT_MIN_STEPS = 20000  # En 'auto', pasos a partir de los cuales compensa compilar
+
+    # Tipo de los arrays de resultados: 'float64' o 'float32' (la mitad de memoria
+    # y de exportación; la integración acumula siempre en float64)
+    SOLUTION_DTYPE = 'float64'
+    SOLUTION_DTYPES = ('float64', 'float32')
+
+    # Solución exacta con sympy (opcional, ver utils/exact_solution.py)
+    EXACT_SOLUTION_TIMEOUT = 3.0  # Segundos máximos de espera por dsolve
+    EXACT_SOLUTION_DEADLINE = 10.0  # Segundos antes de matar el proceso de dsolve
+    EXACT_SOLUTION_CACHE_SIZE = 256  # Soluciones cerradas en caché
+    EXACT_SOLUTION_WORKERS = 2  # Procesos de dsolve simultáneos
+    EXACT_SOLUTION_MAX_PENDING = 16  # Búsquedas en curso o en cola; las demás se rechazan
 
     # Configuración de funciones permitidas (seguridad)
     ALLOWED_FUNCTIONS = [
@@ -39,6 +108,23 @@ class Config:
     # Configuración de desarrollo
     DEBUG = os.environ.get('FLASK_DEBUG', 'True').lower() == 'true'
 
+    # Configuración del servidor de producción (pre-fork, ver run.py --prod)
+    SERVER_WORKERS = int(os.environ.get('ODE_WORKERS', 0))  # 0 = uno por núcleo
+    SERVER_THREADS = int(os.environ.get('ODE_THREADS', 2))  # Hilos por worker
+    SERVER_MAX_REQUESTS = int(os.environ.get('ODE_MAX_REQUESTS', 1000))  # Reciclar tras N peticiones
+    SERVER_MAX_REQUESTS_JITTER = 50  # Evita que todos los workers se reciclen a la vez
+    SERVER_MAX_WORKER_MEMORY_MB = int(os.environ.get('ODE_MAX_WORKER_MEMORY_MB', 512))  # 0 = sin límite
+    SERVER_TIMEOUT = 120  # Segundos antes de matar un worker bloqueado
+    SERVER_GRACEFUL_TIMEOUT = 30  # Segundos para terminar peticiones en curso al apagar
+
+    # Modo ASGI (asyncio, ver asgi.py y run.py --asgi): las conexiones las atiende
+    # el bucle de eventos y el trabajo de cada petición va a un pool acotado de hilos
+    ASGI_EXECUTOR_THREADS = int(os.environ.get('ODE_ASGI_THREADS', 4))  # Peticiones en ejecución a la vez
+    ASGI_STREAM_CHUNK_BYTES = 64 * 1024  # Tamaño mínimo de cada envío de una respuesta por bloques
+
+    # Expresiones precargadas en la caché del proceso maestro
+    PRELOAD_EXPRESSIONS = ['y', 'x + y', 'x**2 - y**2', '-x*y', 'x*y - 2*x', 'sin(x) + cos(y)']
+
     @staticmethod
     def init_app(app):
         """Inicializar configuración específica de la aplicación."""
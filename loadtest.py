@@ -0,0 +1,438 @@
+#!/usr/bin/env python3
+"""
+loadtest.py - Generador de carga para los endpoints de la aplicación ODE Solver
+
+Reproduce una mezcla configurable de peticiones (expresiones, métodos y
+número de pasos, más consultas a /history) contra una instancia local
+arrancada por el propio script o contra una URL dada, y mide por endpoint
+el rendimiento, la latencia (p50/p95/p99) y la tasa de errores. Con
+--sweep repite la prueba con concurrencias crecientes para localizar el
+punto de saturación.
+
+Solo usa la biblioteca estándar (urllib e hilos).
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Mezcla por defecto: cada entrada es una petición con su peso relativo
+DEFAULT_EXPRESSIONS = ['x + y', 'x*y - 2*x', 'sin(x) + cos(y)', 'exp(-x) * y', 'y - x**2 + 1']
+DEFAULT_STEPS = [10, 100, 1000]
+DEFAULT_METHODS = ['euler', 'heun', 'runge_kutta']
+DEFAULT_HISTORY_WEIGHT = 0.1
+# Retraso (s) respecto al calendario a partir del cual una petición cuenta como tardía
+LATE_TOLERANCE = 0.01
+
+
+def default_mix():
+    """
+    Construir la mezcla por defecto: todas las combinaciones de expresión,
+    método y número de pasos con el mismo peso, más /history.
+
+    Returns:
+        list: Entradas {'endpoint', 'method', 'data', 'weight'}
+    """
+    mix = []
+    for method in DEFAULT_METHODS:
+        for expression in DEFAULT_EXPRESSIONS:
+            for steps in DEFAULT_STEPS:
+                mix.append({
+                    'endpoint': f'/solve_{method}',
+                    'method': 'POST',
+                    'data': {'function': expression, 'x0': 0, 'y0': 1, 'xn': 2, 'num_steps': steps},
+                    'weight': 1.0,
+                })
+    solves = len(mix)
+    mix.append({'endpoint': '/history', 'method': 'GET', 'data': None,
+                'weight': solves * DEFAULT_HISTORY_WEIGHT})
+    return mix
+
+
+def load_mix(path):
+    """
+    Leer una mezcla de un archivo JSON.
+
+    El archivo es una lista de objetos con ``endpoint``, ``method`` ('GET'
+    o 'POST', por defecto POST si hay ``data``), ``data`` (campos del
+    formulario) y ``weight`` (peso relativo, por defecto 1).
+
+    Args:
+        path (str): Ruta del archivo
+
+    Returns:
+        list: Entradas de la mezcla
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+    mix = []
+    for entry in entries:
+        data = entry.get('data')
+        mix.append({
+            'endpoint': entry['endpoint'],
+            'method': entry.get('method', 'POST' if data else 'GET').upper(),
+            'data': data,
+            'weight': float(entry.get('weight', 1.0)),
+        })
+    return mix
+
+
+class LoadStats:
+    """Latencias y errores acumulados por endpoint (seguro entre hilos)."""
+
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.error_samples = {}
+        self.late = 0
+        self.scheduled = 0
+        self.dropped = 0
+        self._lock = threading.Lock()
+
+    def record(self, endpoint, latency, error=None):
+        with self._lock:
+            self.latencies[endpoint].append(latency)
+            if error is not None:
+                self.errors[endpoint] += 1
+                self.error_samples.setdefault(endpoint, error)
+
+    def record_late(self):
+        with self._lock:
+            self.late += 1
+
+    @staticmethod
+    def percentile(sorted_values, fraction):
+        """Percentil por el método del rango más cercano."""
+        if not sorted_values:
+            return float('nan')
+        index = min(len(sorted_values) - 1, max(0, math.ceil(fraction * len(sorted_values)) - 1))
+        return sorted_values[index]
+
+    def summary(self, elapsed):
+        """
+        Resumir la prueba.
+
+        Args:
+            elapsed (float): Duración de la prueba en segundos
+
+        Returns:
+            dict: Endpoint (y 'TOTAL') -> métricas
+        """
+        with self._lock:
+            groups = dict(self.latencies)
+            groups['TOTAL'] = [latency for values in self.latencies.values() for latency in values]
+            errors = dict(self.errors, TOTAL=sum(self.errors.values()))
+
+        report = {}
+        for endpoint, values in groups.items():
+            values = sorted(values)
+            count = len(values)
+            report[endpoint] = {
+                'requests': count,
+                'errors': errors.get(endpoint, 0),
+                'error_rate': errors.get(endpoint, 0) / count if count else 0.0,
+                'throughput': count / elapsed if elapsed else 0.0,
+                'p50_ms': 1000 * self.percentile(values, 0.50),
+                'p95_ms': 1000 * self.percentile(values, 0.95),
+                'p99_ms': 1000 * self.percentile(values, 0.99),
+                'max_ms': 1000 * values[-1] if values else float('nan'),
+            }
+        return report
+
+
+class LoadGenerator:
+    """
+    Generador de carga contra una URL base.
+
+    En modo de tasa fija las peticiones se lanzan según un calendario
+    (bucle abierto: una respuesta lenta no retrasa las siguientes, como
+    ocurre con usuarios reales); sin tasa, cada hilo encadena peticiones
+    (bucle cerrado), lo que mide la capacidad máxima.
+    """
+
+    def __init__(self, base_url, mix, timeout=60.0, seed=None):
+        """
+        Inicializar el generador.
+
+        Args:
+            base_url (str): URL de la aplicación (ej: http://127.0.0.1:5000)
+            mix (list): Entradas de la mezcla (ver default_mix)
+            timeout (float): Tiempo máximo por petición en segundos
+            seed (int, optional): Semilla para reproducir la secuencia
+        """
+        self.base_url = base_url.rstrip('/')
+        self.mix = mix
+        self.weights = [entry['weight'] for entry in mix]
+        self.timeout = timeout
+        self.random = random.Random(seed)
+        self._random_lock = threading.Lock()
+
+    def _choose(self):
+        with self._random_lock:
+            return self.random.choices(self.mix, weights=self.weights)[0]
+
+    def request(self, entry, stats, due=None):
+        """
+        Ejecutar una petición de la mezcla y registrar su latencia.
+
+        Args:
+            entry (dict): Entrada de la mezcla
+            stats (LoadStats): Acumulador de resultados
+            due (float, optional): Instante programado (``time.perf_counter``)
+                en bucle abierto; la latencia se mide desde él para incluir
+                la espera en cola y evitar la omisión coordinada
+        """
+        url = self.base_url + entry['endpoint']
+        body = None
+        if entry['method'] == 'POST':
+            body = urllib.parse.urlencode(entry['data'] or {}).encode('utf-8')
+        request = urllib.request.Request(url, data=body, method=entry['method'])
+
+        start = time.perf_counter()
+        if due is not None:
+            if start - due > LATE_TOLERANCE:
+                stats.record_late()
+            start = due
+        error = None
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                response.read()
+        except urllib.error.HTTPError as e:
+            e.read()
+            error = f'HTTP {e.code}'
+        except Exception as e:
+            error = f'{type(e).__name__}: {e}'
+        stats.record(entry['endpoint'], time.perf_counter() - start, error)
+
+    def run(self, duration, concurrency, rate=None):
+        """
+        Ejecutar una prueba.
+
+        Args:
+            duration (float): Duración en segundos
+            concurrency (int): Peticiones simultáneas como máximo
+            rate (float, optional): Peticiones por segundo (None = lo más rápido posible)
+
+        Returns:
+            tuple: (LoadStats, segundos transcurridos)
+        """
+        stats = LoadStats()
+        start = time.perf_counter()
+        deadline = start + duration
+
+        if rate:
+            # Bucle abierto: cada petición sale en su instante del calendario.
+            # Si los hilos no dan abasto, las peticiones esperan en cola y esa
+            # espera cuenta como latencia; al acabar el tiempo se descartan
+            # las que aún no han salido para no alargar la prueba.
+            executor = ThreadPoolExecutor(max_workers=concurrency)
+            futures = []
+            sent = 0
+            while True:
+                due = start + sent / rate
+                if due >= deadline:
+                    break
+                delay = due - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                futures.append(executor.submit(self.request, self._choose(), stats, due))
+                sent += 1
+            delay = deadline - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            executor.shutdown(wait=True, cancel_futures=True)
+            stats.scheduled = sent
+            stats.dropped = sum(1 for future in futures if future.cancelled())
+        else:
+            def worker():
+                while time.perf_counter() < deadline:
+                    self.request(self._choose(), stats)
+
+            threads = [threading.Thread(target=worker, daemon=True) for _ in range(concurrency)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        return stats, time.perf_counter() - start
+
+
+def print_report(report, title):
+    """Imprimir la tabla de métricas por endpoint."""
+    print(f"\n{title}")
+    header = f"{'Endpoint':<26}{'Peticiones':>11}{'Errores':>9}{'req/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+    print(header)
+    print('-' * len(header))
+    for endpoint in sorted(report, key=lambda name: (name == 'TOTAL', name)):
+        m = report[endpoint]
+        print(f"{endpoint:<26}{m['requests']:>11}{m['error_rate']:>8.1%} {m['throughput']:>8.1f}"
+              f"{m['p50_ms']:>9.1f}{m['p95_ms']:>9.1f}{m['p99_ms']:>9.1f}")
+
+
+def sweep_concurrency(generator, levels, duration, gain_threshold=0.05):
+    """
+    Repetir la prueba en bucle cerrado con concurrencias crecientes.
+
+    El punto de saturación es el primer nivel a partir del cual duplicar la
+    concurrencia ya no aumenta el rendimiento más de ``gain_threshold``
+    (solo crece la latencia).
+
+    Args:
+        generator (LoadGenerator): Generador configurado
+        levels (list): Concurrencias a probar, en orden creciente
+        duration (float): Duración de cada nivel en segundos
+        gain_threshold (float): Ganancia relativa mínima de rendimiento
+
+    Returns:
+        dict: Resultados por nivel y concurrencia de saturación
+    """
+    results = []
+    saturation = None
+    for concurrency in levels:
+        stats, elapsed = generator.run(duration, concurrency)
+        total = stats.summary(elapsed)['TOTAL']
+        results.append({'concurrency': concurrency, **total})
+        print(f"  concurrencia {concurrency:>4}: {total['throughput']:8.1f} req/s, "
+              f"p95 {total['p95_ms']:8.1f} ms, errores {total['error_rate']:.1%}")
+
+        if saturation is None and len(results) > 1:
+            previous = results[-2]['throughput']
+            if previous and total['throughput'] < previous * (1 + gain_threshold):
+                saturation = results[-2]['concurrency']
+
+    return {'levels': results, 'saturation_concurrency': saturation}
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def start_local_server(port, production=False, extra_args=(), startup_timeout=60.0):
+    """
+    Arrancar la aplicación en un proceso aparte (run.py) y esperar a que responda.
+
+    Args:
+        port (int): Puerto local
+        production (bool): Usar el servidor pre-fork (run.py --prod)
+        extra_args (iterable): Argumentos adicionales para run.py
+        startup_timeout (float): Segundos máximos de espera
+
+    Returns:
+        subprocess.Popen: Proceso del servidor
+    """
+    command = [sys.executable, str(Path(__file__).parent / 'run.py'),
+               '--port', str(port), '--skip-checks', *extra_args]
+    if production:
+        command.append('--prod')
+    env = dict(os.environ, FLASK_DEBUG='False')
+    process = subprocess.Popen(command, cwd=str(Path(__file__).parent), env=env,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    url = f'http://127.0.0.1:{port}/'
+    deadline = time.time() + startup_timeout
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"El servidor terminó al arrancar (código {process.returncode})")
+        try:
+            with urllib.request.urlopen(url, timeout=2) as response:
+                response.read()
+            return process
+        except (urllib.error.URLError, OSError):
+            time.sleep(0.2)
+
+    process.terminate()
+    raise RuntimeError(f"El servidor no respondió en {startup_timeout} s")
+
+
+def main():
+    """Función principal."""
+    parser = argparse.ArgumentParser(
+        description='Generador de carga para ODE Solver',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Ejemplos de uso:
+  python loadtest.py                              # Arranca la app en local, 30 s en bucle cerrado
+  python loadtest.py --rate 50 --duration 60      # 50 peticiones/s durante un minuto
+  python loadtest.py --url http://servidor:5000   # Contra una instancia ya desplegada
+  python loadtest.py --prod --sweep 1,2,4,8,16,32 # Buscar la saturación del servidor pre-fork
+  python loadtest.py --mix mezcla.json --json informe.json
+        """
+    )
+    parser.add_argument('--url', help='URL de la aplicación (por defecto se arranca una instancia local)')
+    parser.add_argument('--prod', action='store_true',
+                        help='Arrancar la instancia local en modo producción (run.py --prod)')
+    parser.add_argument('--workers', type=int, help='Workers de la instancia local en modo producción')
+    parser.add_argument('--mix', help='Archivo JSON con la mezcla de peticiones')
+    parser.add_argument('--duration', type=float, default=30.0, help='Segundos de prueba (por nivel)')
+    parser.add_argument('--concurrency', type=int, default=8, help='Peticiones simultáneas')
+    parser.add_argument('--rate', type=float, help='Peticiones por segundo (bucle abierto)')
+    parser.add_argument('--sweep', help='Concurrencias a probar, separadas por comas (ej: 1,2,4,8)')
+    parser.add_argument('--timeout', type=float, default=60.0, help='Tiempo máximo por petición')
+    parser.add_argument('--seed', type=int, help='Semilla de la secuencia de peticiones')
+    parser.add_argument('--json', help='Guardar el informe en un archivo JSON')
+    args = parser.parse_args()
+
+    mix = load_mix(args.mix) if args.mix else default_mix()
+
+    server = None
+    base_url = args.url
+    if not base_url:
+        port = _free_port()
+        extra_args = ['--workers', str(args.workers)] if args.workers else []
+        print(f"🔧 Arrancando la aplicación en el puerto {port}...")
+        server = start_local_server(port, production=args.prod, extra_args=extra_args)
+        base_url = f'http://127.0.0.1:{port}'
+
+    generator = LoadGenerator(base_url, mix, timeout=args.timeout, seed=args.seed)
+    try:
+        if args.sweep:
+            levels = sorted(int(level) for level in args.sweep.split(',') if level.strip())
+            print(f"📈 Barrido de concurrencia contra {base_url} ({args.duration:.0f} s por nivel)")
+            report = sweep_concurrency(generator, levels, args.duration)
+            saturation = report['saturation_concurrency']
+            print(f"\nSaturación: {'concurrencia ' + str(saturation) if saturation else 'no alcanzada'}")
+        else:
+            mode = f"{args.rate:g} req/s" if args.rate else 'bucle cerrado'
+            print(f"🚀 {args.duration:.0f} s contra {base_url} ({mode}, concurrencia {args.concurrency})")
+            stats, elapsed = generator.run(args.duration, args.concurrency, rate=args.rate)
+            report = {'endpoints': stats.summary(elapsed), 'elapsed': elapsed,
+                      'error_samples': stats.error_samples}
+            print_report(report['endpoints'], f"Resultados ({elapsed:.1f} s)")
+            if args.rate:
+                started = stats.scheduled - stats.dropped
+                report.update(target_rate=args.rate, achieved_rate=started / args.duration,
+                              late=stats.late, dropped=stats.dropped)
+                print(f"\nTasa: {report['achieved_rate']:.1f} de {args.rate:g} req/s; "
+                      f"{stats.late} peticiones salieron tarde y {stats.dropped} no llegaron a salir")
+            for endpoint, sample in stats.error_samples.items():
+                print(f"  Ejemplo de error en {endpoint}: {sample}")
+
+        if args.json:
+            with open(args.json, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2)
+            print(f"\n✓ Informe guardado en {args.json}")
+    except KeyboardInterrupt:
+        print("\n\n👋 Prueba interrumpida")
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=10)
+
+
+if __name__ == '__main__':
+    main()
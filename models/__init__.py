@@ -4,9 +4,47 @@ Módulo de métodos numéricos para resolver ecuaciones diferenciales ordinarias
 Este módulo contiene implementaciones de:
 - Método de Euler
 - Método de Heun (Euler mejorado)
+- Método de Runge-Kutta de 4to orden
+- Métodos multipaso de Adams-Bashforth y Adams-Bashforth-Moulton
+- Barridos vectorizados de parámetros con nombre
+- Problemas de contorno de segundo orden por disparo
+- Integración paralela en el tiempo (Parareal) en un pool de procesos
+- Integradores adaptativos de SciPy (solve_ivp) sobre la misma malla de salida
+- Integradores simplécticos (Störmer-Verlet, Yoshida) para y'' = f(x, y)
+- Extrapolación de Gragg-Bulirsch-Stoer con paso y orden adaptativos
+- Sensibilidades hacia delante de y respecto a y0 y a los parámetros
+
+Todos comparten la base ODEMethod (bucle de integración y salida densa).
 """
 
+from .base import ODEMethod
 from .euler import EulerMethod
 from .heun import HeunMethod
+from .runge_kutta import RungeKuttaMethod
+from .adams import AdamsBashforthMethod, AdamsBashforthMoultonMethod
+from .divergence import DivergenceGuard
+from .sweep import ParameterSweep
+from .shooting import ShootingMethod
+from .parareal import Parareal
+from .scipy_ivp import SciPyMethod
+from .symplectic import StormerVerletMethod, YoshidaMethod
+from .bulirsch_stoer import BulirschStoerMethod
+from .sensitivity import ForwardSensitivity
 
-__all__ = ['EulerMethod', 'HeunMethod']
\ No newline at end of file
+__all__ = [
+    'ODEMethod',
+    'EulerMethod',
+    'HeunMethod',
+    'RungeKuttaMethod',
+    'AdamsBashforthMethod',
+    'AdamsBashforthMoultonMethod',
+    'DivergenceGuard',
+    'ParameterSweep',
+    'ShootingMethod',
+    'Parareal',
+    'SciPyMethod',
+    'StormerVerletMethod',
+    'YoshidaMethod',
+    'BulirschStoerMethod',
+    'ForwardSensitivity'
+]
\ No newline at end of file
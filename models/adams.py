@@ -0,0 +1,308 @@
+from collections import deque
+
+import numpy as np
+from .base import ODEMethod
+from .runge_kutta import rk4_step
+
+
+class AdamsBashforthMethod(ODEMethod):
+    """
+    Implementación de los métodos multipaso explícitos de Adams-Bashforth
+    (órdenes 2 a 4) para resolver ecuaciones diferenciales de la forma:
+    dy/dx = f(x, y) con condición inicial y(x0) = y0
+
+    Cada paso reutiliza las pendientes de los pasos anteriores, guardadas en
+    un buffer circular, por lo que solo cuesta una evaluación de f. Los
+    primeros (orden - 1) pasos se arrancan con Runge-Kutta de 4to orden.
+    """
+
+    METHOD_NAME = 'Adams-Bashforth'
+    STAGE_ATTRS = ('slope_values',)
+
+    # Coeficientes de f_n, f_{n-1}, ... para cada orden
+    COEFFICIENTS = {
+        2: (3 / 2, -1 / 2),
+        3: (23 / 12, -16 / 12, 5 / 12),
+        4: (55 / 24, -59 / 24, 37 / 24, -9 / 24),
+    }
+
+    FORMULAS = {
+        2: 'y_{n+1} = y_n + (h/2) × (3f_n - f_{n-1})',
+        3: 'y_{n+1} = y_n + (h/12) × (23f_n - 16f_{n-1} + 5f_{n-2})',
+        4: 'y_{n+1} = y_n + (h/24) × (55f_n - 59f_{n-1} + 37f_{n-2} - 9f_{n-3})',
+    }
+
+    def __init__(self, function_str, x0, y0, h, num_steps, order=4):
+        """
+        Inicializar el método de Adams-Bashforth.
+
+        Args:
+            function_str (str): Función f(x,y) como string (ej: "x + y", "x*y - 2*x")
+            x0 (float): Valor inicial de x
+            y0 (float): Valor inicial de y (condición inicial)
+            h (float): Tamaño del paso
+            num_steps (int): Número de pasos a realizar
+            order (int): Orden del método (2, 3 o 4)
+        """
+        super().__init__(function_str, x0, y0, h, num_steps)
+
+        if order not in self.COEFFICIENTS:
+            raise ValueError(f"Orden no soportado: {order} (use 2, 3 o 4)")
+        self.order = order
+        self.bootstrap_steps = min(order - 1, num_steps)
+
+        # Buffer circular con f_n, f_{n-1}, ... (el más reciente primero)
+        self._history = deque(maxlen=order)
+
+    @classmethod
+    def options_from_request(cls, data):
+        """Leer el orden del método de la petición."""
+        if data.get('order'):
+            return {'order': int(data['order'])}
+        return {}
+
+    @property
+    def METHOD_INFO(self):
+        """Información del método para la interfaz."""
+        return {
+            'name': f'Método de Adams-Bashforth (orden {self.order})',
+            'formula': self.FORMULAS[self.order],
+            'description': 'Método multipaso explícito que reutiliza las pendientes anteriores',
+            'order': self.order,
+            'error_type': f'O(h^{self.order + 1}) por paso, O(h^{self.order}) global',
+            'steps': [
+                f'1. Arranque: {self.order - 1} paso(s) de Runge-Kutta de 4to orden',
+                f'2. Multipaso: {self.FORMULAS[self.order]} (1 evaluación de f por paso)'
+            ]
+        }
+
+    def _reset(self):
+        """Vaciar el historial de pendientes antes de integrar."""
+        super()._reset()
+        self._history.clear()
+
+    def checkpoint_signature(self):
+        """El orden cambia la malla de valores: forma parte del problema."""
+        return dict(super().checkpoint_signature(), order=self.order)
+
+    def _checkpoint_state(self, step, x, y, k1):
+        """Añadir el historial de pendientes (el más reciente primero)."""
+        return dict(super()._checkpoint_state(step, x, y, k1),
+                    history=[float(slope) for slope in self._history])
+
+    def _restore_state(self, state):
+        """Recuperar el historial de pendientes de un punto de control."""
+        self._history.extend(state['history'])
+
+    def _adams_bashforth(self, y):
+        """Aplicar la fórmula explícita con el historial actual."""
+        increment = 0.0
+        for coefficient, slope in zip(self.COEFFICIENTS[self.order], self._history):
+            increment += coefficient * slope
+        return y + self.h * increment
+
+    def _step(self, x, y, k1):
+        """
+        Avanzar un paso de Adams-Bashforth.
+
+        Args:
+            x (float): Valor actual de x
+            y (float): Valor actual de y
+            k1 (float): Pendiente f(x_i, y_i)
+
+        Returns:
+            tuple: (y_{i+1}, (pendiente,))
+        """
+        self._history.appendleft(k1)
+
+        # Arranque con RK4 hasta tener suficientes pendientes
+        if len(self._history) < self.order:
+            y_next, _ = rk4_step(self._evaluate, x, y, k1, self.h)
+            return y_next, (k1,)
+
+        return self._adams_bashforth(y), (k1,)
+
+    def _format_results(self):
+        """
+        Formatear resultados para mostrar en la interfaz.
+
+        Returns:
+            dict: Resultados formateados
+        """
+        # Crear tabla de resultados paso a paso
+        steps_table = []
+        for i in range(len(self.x_values)):
+            step_data = {
+                'step': i,
+                'x': round(self.x_values[i], 6),
+                'y': round(self.y_values[i], 6),
+                'slope': round(self.slope_values[i], 6) if not np.isnan(self.slope_values[i]) else 'N/A'
+            }
+
+            # Para pasos intermedios, indicar cómo se obtuvo y_{i+1}
+            if i < len(self.x_values) - 1:
+                if i < self.bootstrap_steps:
+                    source = 'arranque RK4'
+                else:
+                    source = f'Adams-Bashforth orden {self.order}'
+                step_data['calculation'] = f"y_{i + 1} = {round(self.y_values[i + 1], 6):.6f} ({source})"
+
+            steps_table.append(step_data)
+
+        # Datos para la gráfica
+        plot_data = {
+            'x_values': self._plot_values(self.x_values),
+            'y_values': self._plot_values(self.y_values),
+            'method': self.METHOD_NAME
+        }
+
+        return {
+            'steps_table': steps_table,
+            'plot_data': plot_data,
+            'method_info': self.METHOD_INFO,
+            'summary': {
+                'initial_value': f"y({self.x0}) = {self.y0}",
+                'final_value': f"y({self.x_values[-1]:.6f}) ≈ {self.y_values[-1]:.6f}",
+                'total_steps': self.num_steps,
+                'step_size': self.h,
+                'interval': f"[{self.x0}, {self.x_values[-1]:.6f}]",
+                'function_evaluations': self.function_evaluations,
+                'bootstrap_steps': self.bootstrap_steps
+            }
+        }
+
+
+class AdamsBashforthMoultonMethod(AdamsBashforthMethod):
+    """
+    Implementación de los métodos predictor-corrector de Adams-Bashforth-Moulton
+    (órdenes 2 a 4) para resolver ecuaciones diferenciales de la forma:
+    dy/dx = f(x, y) con condición inicial y(x0) = y0
+
+    Esquema PECE: predictor Adams-Bashforth, evaluación de f en el punto
+    predicho, corrector Adams-Moulton y evaluación final (que se reutiliza
+    como pendiente del paso siguiente). Cuesta dos evaluaciones por paso.
+    """
+
+    METHOD_NAME = 'Adams-Bashforth-Moulton'
+    STAGE_ATTRS = (
+        'k1_values',    # f_n
+        'k2_values',    # f(x_{n+1}, y_pred)
+        'y_predictor',  # Predictor Adams-Bashforth
+    )
+
+    # Coeficientes del corrector para f_{n+1}, f_n, f_{n-1}, ...
+    CORRECTOR_COEFFICIENTS = {
+        2: (1 / 2, 1 / 2),
+        3: (5 / 12, 8 / 12, -1 / 12),
+        4: (9 / 24, 19 / 24, -5 / 24, 1 / 24),
+    }
+
+    CORRECTOR_FORMULAS = {
+        2: 'y_{n+1} = y_n + (h/2) × (f^p_{n+1} + f_n)',
+        3: 'y_{n+1} = y_n + (h/12) × (5f^p_{n+1} + 8f_n - f_{n-1})',
+        4: 'y_{n+1} = y_n + (h/24) × (9f^p_{n+1} + 19f_n - 5f_{n-1} + f_{n-2})',
+    }
+
+    @property
+    def METHOD_INFO(self):
+        """Información del método para la interfaz."""
+        return {
+            'name': f'Método de Adams-Bashforth-Moulton (orden {self.order})',
+            'formula': self.CORRECTOR_FORMULAS[self.order],
+            'description': 'Método multipaso predictor-corrector (PECE) que reutiliza las pendientes anteriores',
+            'order': self.order,
+            'error_type': f'O(h^{self.order + 1}) por paso, O(h^{self.order}) global',
+            'predictor_corrector': True,
+            'steps': [
+                f'1. Arranque: {self.order - 1} paso(s) de Runge-Kutta de 4to orden',
+                f'2. Predictor: {self.FORMULAS[self.order]}',
+                '3. Evaluar: f^p_{n+1} = f(x_{n+1}, y_pred)',
+                f'4. Corrector: {self.CORRECTOR_FORMULAS[self.order]}'
+            ]
+        }
+
+    def _step(self, x, y, k1):
+        """
+        Avanzar un paso de Adams-Bashforth-Moulton.
+
+        Args:
+            x (float): Valor actual de x
+            y (float): Valor actual de y
+            k1 (float): Pendiente f(x_i, y_i)
+
+        Returns:
+            tuple: (y_{i+1}, (k1, k2, y_predictor)); en los pasos de arranque
+                k2 e y_predictor son NaN
+        """
+        self._history.appendleft(k1)
+
+        # Arranque con RK4 hasta tener suficientes pendientes
+        if len(self._history) < self.order:
+            y_next, _ = rk4_step(self._evaluate, x, y, k1, self.h)
+            return y_next, (k1, np.nan, np.nan)
+
+        # PASO 1: Predictor Adams-Bashforth
+        y_pred = self._adams_bashforth(y)
+
+        # PASO 2: Evaluar la pendiente en el punto predicho
+        k2 = self._evaluate(x + self.h, y_pred)
+
+        # PASO 3: Corrector Adams-Moulton
+        coefficients = self.CORRECTOR_COEFFICIENTS[self.order]
+        increment = coefficients[0] * k2
+        for coefficient, slope in zip(coefficients[1:], self._history):
+            increment += coefficient * slope
+
+        return y + self.h * increment, (k1, k2, y_pred)
+
+    def _format_results(self):
+        """
+        Formatear resultados para mostrar en la interfaz.
+
+        Returns:
+            dict: Resultados formateados
+        """
+        # Crear tabla de resultados paso a paso
+        steps_table = []
+        for i in range(len(self.x_values)):
+            step_data = {
+                'step': i,
+                'x': round(self.x_values[i], 6),
+                'y': round(self.y_values[i], 6),
+                'k1': round(self.k1_values[i], 6) if not np.isnan(self.k1_values[i]) else 'N/A'
+            }
+
+            # Para pasos intermedios, agregar predictor y corrector
+            if i < len(self.x_values) - 1:
+                if i < self.bootstrap_steps:
+                    step_data['calculation'] = f"y_{i + 1} = {round(self.y_values[i + 1], 6):.6f} (arranque RK4)"
+                else:
+                    step_data.update({
+                        'y_predictor': round(self.y_predictor[i], 6),
+                        'k2': round(self.k2_values[i], 6),
+                        'calculation': f"y_pred = {self.y_predictor[i]:.6f} → y_{i + 1} = {round(self.y_values[i + 1], 6):.6f} (corrector Adams-Moulton orden {self.order})"
+                    })
+
+            steps_table.append(step_data)
+
+        # Datos para la gráfica
+        plot_data = {
+            'x_values': self._plot_values(self.x_values),
+            'y_values': self._plot_values(self.y_values),
+            'method': self.METHOD_NAME
+        }
+
+        return {
+            'steps_table': steps_table,
+            'plot_data': plot_data,
+            'method_info': self.METHOD_INFO,
+            'summary': {
+                'initial_value': f"y({self.x0}) = {self.y0}",
+                'final_value': f"y({self.x_values[-1]:.6f}) ≈ {self.y_values[-1]:.6f}",
+                'total_steps': self.num_steps,
+                'step_size': self.h,
+                'interval': f"[{self.x0}, {self.x_values[-1]:.6f}]",
+                'function_evaluations': self.function_evaluations,
+                'bootstrap_steps': self.bootstrap_steps
+            }
+        }
@@ -0,0 +1,717 @@
+import numpy as np
+from utils.parser import evaluate_function, evaluate_function_array
+from utils.jit import jit_supported, run_kernel
+from .events import EventMonitor
+from .divergence import DivergenceGuard
+
+
+class ODEMethod:
+    """
+    Base común de los métodos de un paso para dy/dx = f(x, y), y(x0) = y0.
+
+    Las subclases definen la fórmula de un paso (``_step``), los arrays en
+    los que se guardan sus etapas (``STAGE_ATTRS``) y el formato de la tabla
+    (``_format_results``). El bucle de integración, la salida densa y el
+    resto de la maquinaria se comparten aquí.
+    """
+
+    # Nombre corto del método (se usa en gráficas y mensajes de error)
+    METHOD_NAME = ''
+
+    # Atributos donde se guardan las etapas de cada paso, en el orden que
+    # devuelve _step. La primera etapa siempre es f(x_i, y_i).
+    STAGE_ATTRS = ()
+
+    # Información del método para la interfaz
+    METHOD_INFO = {}
+
+    # Evaluaciones de f por paso (sin contar la del nuevo punto)
+    EVALS_PER_STEP = 1
+
+    # Cuerpo de un paso para el backend JIT (utils/jit.py): a partir de x, y,
+    # h, k1 y f debe calcular y_next; JIT_STAGES son las variables de cada
+    # etapa en el orden de STAGE_ATTRS. None si el método no lo soporta.
+    JIT_STEP_SOURCE = None
+    JIT_STAGES = ()
+
+    def __init__(self, function_str, x0, y0, h, num_steps):
+        """
+        Inicializar el método.
+
+        Los arrays de resultados se reservan al llamar a solve(), de modo que
+        los modos que no guardan cada paso (salida densa) no los ocupan.
+
+        Args:
+            function_str (str): Función f(x,y) como string (ej: "x + y", "x*y - 2*x")
+            x0 (float): Valor inicial de x
+            y0 (float): Valor inicial de y (condición inicial)
+            h (float): Tamaño del paso
+            num_steps (int): Número de pasos a realizar
+        """
+        self.function_str = function_str
+        self.x0 = x0
+        self.y0 = y0
+        self.h = h
+        self.num_steps = num_steps
+
+        self.x_values = None
+        self.y_values = None
+        self.function_evaluations = 0
+
+        # Valores de los parámetros con nombre de la expresión (ej: {'k': 2.0})
+        self.parameters = {}
+
+        # Eventos g(x, y) = 0 vigilados durante la integración
+        self.events = []
+        self.event_monitor = None
+
+        # Guarda de divergencia (None la desactiva) y diagnóstico si se activó
+        self.guard = DivergenceGuard()
+        self.divergence = None
+
+        # Backend de integración: 'python' o 'jit' (Numba, si está disponible)
+        self.backend = 'python'
+        self.backend_used = None
+
+        # Tipo de los arrays de resultados (float64 o float32). La integración
+        # siempre acumula en float64: solo se redondea lo que se guarda
+        self.dtype = np.dtype(np.float64)
+
+        # Puntos de control (utils/checkpoints.py): almacén, cada cuántos pasos
+        # guardar durante las integraciones largas y estado desde el que se continuó
+        self.checkpoints = None
+        self.checkpoint_interval = None
+        self.resume_from = None
+
+        # Reserva de los arrays de resultados: None usa np.zeros; una función
+        # (nombres, longitud, dtype) -> {nombre: array} permite reservarlos en
+        # memoria compartida (utils/transport.py)
+        self.allocator = None
+
+        # Sensibilidades hacia delante (models/sensitivity.py): None las desactiva
+        self.sensitivity = None
+
+    def _allocate(self):
+        """Reservar los arrays de resultados e imponer la condición inicial."""
+        names = ('x_values', 'y_values') + self.STAGE_ATTRS
+        if self.allocator is not None:
+            arrays = self.allocator(names, self.num_steps + 1, self.dtype)
+        else:
+            arrays = {name: np.zeros(self.num_steps + 1, dtype=self.dtype) for name in names}
+        for name in names:
+            setattr(self, name, arrays[name])
+
+        # Condiciones iniciales
+        self.x_values[0] = self.x0
+        self.y_values[0] = self.y0
+
+    @classmethod
+    def options_from_request(cls, data):
+        """
+        Extraer de una petición los argumentos propios del método.
+
+        Args:
+            data: Formulario o JSON de la petición
+
+        Returns:
+            dict: Argumentos adicionales para el constructor
+        """
+        return {}
+
+    def _reset(self):
+        """Reiniciar el estado interno antes de integrar."""
+        self.function_evaluations = 0
+        self.divergence = None
+
+    def checkpoint_signature(self):
+        """
+        Datos que identifican el problema en los puntos de control.
+
+        Todo lo que cambia la malla o los valores que produce el método debe
+        figurar aquí; xn no, porque un intervalo más largo extiende la misma
+        malla. El tipo de los arrays solo figura si no es float64, para que
+        los puntos de control existentes sigan valiendo.
+
+        Returns:
+            dict: Firma serializable en JSON
+        """
+        signature = {
+            'method': type(self).__name__,
+            'function': self.function_str,
+            'parameters': {name: float(value) for name, value in sorted(self.parameters.items())},
+            'x0': float(self.x0),
+            'y0': float(self.y0),
+            'h': float(self.h),
+        }
+        if self.dtype != np.float64:
+            signature['dtype'] = self.dtype.name
+        return signature
+
+    def _checkpoint_state(self, step, x, y, k1):
+        """
+        Estado necesario para continuar la integración desde el paso ``step``.
+
+        Las subclases con más estado que (x, y, f(x, y)) lo añaden aquí y lo
+        recuperan en _restore_state.
+        """
+        return {'step': int(step), 'x': float(x), 'y': float(y), 'k1': float(k1),
+                'function_evaluations': self.function_evaluations}
+
+    def _restore_state(self, state):
+        """Recuperar el estado propio de la subclase de un punto de control."""
+
+    def _load_checkpoint(self, arrays=False):
+        """
+        Buscar un punto de control desde el que continuar esta integración.
+
+        Con eventos o sensibilidades se integra desde x0, porque los pasos
+        ya recorridos no se vigilaron ni se derivaron.
+
+        Args:
+            arrays (bool): Exigir los arrays de la tabla completa
+
+        Returns:
+            dict: Estado desde el que continuar, o None
+        """
+        self.resume_from = None
+        if self.checkpoints is not None and not self.events and self.sensitivity is None:
+            self.resume_from = self.checkpoints.load(self, arrays=arrays)
+        return self.resume_from
+
+    def _save_checkpoint(self, step, x, y, k1, arrays=None):
+        """Guardar el estado tras ``step`` pasos si hay almacén y es válido."""
+        if (self.checkpoints is None or self.divergence is not None or step == 0
+                or self.sensitivity is not None or not np.isfinite([x, y, k1]).all()):
+            return
+        self.checkpoints.save(self, self._checkpoint_state(step, x, y, k1), arrays)
+
+    def _evaluate(self, x, y):
+        """Evaluar f(x, y), contando las evaluaciones."""
+        self.function_evaluations += 1
+        return evaluate_function(self.function_str, x, y, self.parameters)
+
+    def _evaluate_array(self, x, y):
+        """
+        Evaluar f(x, y) para un vector de estados y (uno por combinación de
+        parámetros). Los barridos la usan en lugar de _evaluate.
+        """
+        self.function_evaluations += 1
+        return evaluate_function_array(self.function_str, x, y, self.parameters)
+
+    def _step(self, x, y, k1):
+        """
+        Avanzar un paso desde (x, y).
+
+        Args:
+            x (float): Valor actual de x
+            y (float): Valor actual de y
+            k1 (float): f(x, y), ya evaluada por el bucle
+
+        Returns:
+            tuple: (y_{i+1}, etapas) con las etapas en el orden de STAGE_ATTRS
+        """
+        raise NotImplementedError
+
+    def _interpolate(self, x, y, y_next, k1, k1_next, stages, theta):
+        """
+        Interpolar la solución dentro de un paso (salida densa).
+
+        Por defecto se usa el interpolante cúbico de Hermite, que solo
+        necesita los valores y las pendientes en los extremos del paso, ya
+        calculados por el propio método.
+
+        Args:
+            x (float): Inicio del paso
+            y (float): y en el inicio del paso
+            y_next (float): y al final del paso
+            k1 (float): f en el inicio del paso
+            k1_next (float): f al final del paso
+            stages (tuple): Etapas del paso
+            theta (np.ndarray): Posiciones relativas dentro del paso, en [0, 1]
+
+        Returns:
+            np.ndarray: Valores interpolados de y
+        """
+        theta2 = theta * theta
+        theta3 = theta2 * theta
+        h00 = 2 * theta3 - 3 * theta2 + 1
+        h10 = theta3 - 2 * theta2 + theta
+        h01 = -2 * theta3 + 3 * theta2
+        h11 = theta3 - theta2
+        return h00 * y + h10 * self.h * k1 + h01 * y_next + h11 * self.h * k1_next
+
+    def _iterate_steps(self):
+        """
+        Recorrer los pasos del método usando solo variables escalares.
+
+        Cada pendiente f(x_{i+1}, y_{i+1}) se reutiliza como k1 del paso
+        siguiente, así que no se evalúa dos veces.
+
+        Si hay eventos, se comprueban tras cada paso y un evento terminal
+        detiene la iteración después de entregar el paso que lo contiene.
+
+        Con la guarda de divergencia activa, un paso divergente (o en el que
+        f no se puede evaluar) no se entrega: la iteración termina en el
+        último punto válido y el diagnóstico queda en ``self.divergence``.
+
+        Si ``self.resume_from`` tiene un punto de control, la iteración
+        empieza en su paso en lugar de en x0.
+
+        Con sensibilidades el método avanza el estado aumentado de
+        ``self.sensitivity`` y solo se entrega su componente y.
+
+        Yields:
+            tuple: (i, x_i, y_i, x_{i+1}, y_{i+1}, f(x_{i+1}, y_{i+1}), etapas)
+        """
+        self._reset()
+        tracker = self.sensitivity
+        checkpoint = self.resume_from
+        if checkpoint is not None:
+            start, x, y, k1 = checkpoint['step'], checkpoint['x'], checkpoint['y'], checkpoint['k1']
+            self.function_evaluations = checkpoint['function_evaluations']
+            self._restore_state(checkpoint)
+        else:
+            start = 0
+            x = float(self.x0)
+            # y0 puede ser un vector de estados que avanzan a la vez (barridos)
+            y = self.y0 if isinstance(self.y0, np.ndarray) else float(self.y0)
+            if tracker is not None:
+                y = tracker.start(x, y)
+            k1 = self._evaluate(x, y)
+
+        # Estado que avanza el método; sin sensibilidades es el propio (y, f)
+        state, slope = y, k1
+        if tracker is not None:
+            y, k1, _ = tracker.project(state, slope, ())
+
+        monitor = EventMonitor(self.events, self.parameters) if self.events else None
+        self.event_monitor = monitor
+        if monitor:
+            monitor.start(x, y)
+
+        guard = self.guard
+
+        for i in range(start, self.num_steps):
+            try:
+                state_next, stages = self._step(x, state, slope)
+                x_next = x + self.h
+                slope_next = self._evaluate(x_next, state_next)
+            except ValueError as e:
+                if guard is None:
+                    raise
+                self.divergence = guard.diagnostic(guard.EVALUATION, i + 1, x, y, str(e))
+                return
+
+            if tracker is None:
+                y_next, k1_next = state_next, slope_next
+            else:
+                y_next, k1_next, stages = tracker.project(state_next, slope_next, stages)
+
+            if guard:
+                status = guard.check(y, y_next, k1_next)
+                if status:
+                    self.divergence = guard.diagnostic(status, i + 1, x, y)
+                    return
+
+            if tracker is not None:
+                tracker.advance(x_next, state_next)
+            yield i, x, y, x_next, y_next, k1_next, stages
+
+            if monitor:
+                interpolant = (lambda theta, x=x, y=y, y_next=y_next, k1=k1, k1_next=k1_next, stages=stages:
+                               self._interpolate(x, y, y_next, k1, k1_next, stages, theta))
+                if monitor.check(x, self.h, y_next, interpolant):
+                    return
+
+            x, y, k1, state, slope = x_next, y_next, k1_next, state_next, slope_next
+
+    def uses_jit(self):
+        """Decidir si la integración puede delegarse en el kernel compilado."""
+        return (self.backend == 'jit'
+                and not self.events
+                and not self.parameters
+                and self.sensitivity is None
+                and jit_supported(self.function_str, type(self)))
+
+    def _truncate(self, steps_taken):
+        """Recortar los arrays de resultados a los pasos realmente integrados."""
+        if steps_taken == self.num_steps:
+            return
+        self.num_steps = steps_taken
+        self.x_values = self.x_values[:steps_taken + 1]
+        self.y_values = self.y_values[:steps_taken + 1]
+        for attr in self.STAGE_ATTRS:
+            setattr(self, attr, getattr(self, attr)[:steps_taken + 1])
+
+    def _kernel_stopped(self, status, steps_taken, x, y):
+        """Registrar la parada anticipada de un kernel JIT."""
+        if self.guard is None:
+            raise ValueError(f"Resultado no finito en el paso {steps_taken + 1}")
+        self.divergence = self.guard.diagnostic(status, steps_taken + 1, float(x), float(y))
+
+    def _decorate_results(self, results):
+        """Añadir eventos, divergencia, sensibilidades, backend y continuación a unos resultados formateados."""
+        results['summary']['backend'] = self.backend_used
+        if self.resume_from is not None:
+            results['summary']['resumed_from_step'] = self.resume_from['step']
+        if self.divergence is not None:
+            results['divergence'] = self.divergence
+            results['summary']['diverged'] = True
+        if self.event_monitor is not None:
+            results['events'] = self.event_monitor.found
+            results['summary']['events_found'] = len(self.event_monitor.found)
+            results['summary']['terminated_by_event'] = self.event_monitor.terminated
+        if self.sensitivity is not None:
+            results['sensitivity'] = self.sensitivity.report()
+            results['summary']['sensitivity_evaluations'] = results['sensitivity']['evaluations']
+        if self.dtype != np.float64:
+            results['summary']['dtype'] = self.dtype.name
+            results['summary']['precision_loss'] = self._precision_loss(results['plot_data'])
+            # Las tablas redondean escalares de NumPy que JSON no admite
+            for row in results.get('steps_table', ()):
+                for key, value in row.items():
+                    if isinstance(value, np.floating):
+                        row[key] = round(float(value), 6)
+        return results
+
+    def _plot_values(self, values):
+        """
+        Convertir un array de resultados en la lista de plot_data.
+
+        En float32 cada valor se entrega con la representación decimal más
+        corta que lo identifica (unas 8 cifras) en lugar de las 17 de su
+        conversión exacta a float64, lo que reduce el JSON a la mitad.
+
+        Args:
+            values (np.ndarray): Valores a convertir
+
+        Returns:
+            list: Valores como floats de Python
+        """
+        if self.dtype != np.float64:
+            return np.asarray(values, dtype=self.dtype).astype(str).astype(np.float64).tolist()
+        return values.tolist()
+
+    def _precision_loss(self, plot_data):
+        """
+        Estimar la precisión perdida al guardar los resultados en ``self.dtype``.
+
+        La integración acumula en float64, así que el único error añadido es
+        el redondeo de cada valor guardado: como mucho media unidad en la
+        última cifra (u = eps/2) relativa a su magnitud.
+
+        Args:
+            plot_data (dict): Valores entregados (x_values, y_values)
+
+        Returns:
+            dict: Redondeo unitario, cifras significativas, error absoluto
+                máximo en y y resolución de x relativa al paso
+        """
+        unit_roundoff = float(np.finfo(self.dtype).eps) / 2
+        with np.errstate(invalid='ignore'):
+            y_max = np.nanmax(np.abs(plot_data['y_values'])) if plot_data['y_values'] else 0.0
+            x_max = np.nanmax(np.abs(plot_data['x_values'])) if plot_data['x_values'] else 0.0
+        loss = {
+            'unit_roundoff': unit_roundoff,
+            'significant_digits': round(float(-np.log10(unit_roundoff)), 1),
+            'max_abs_error_y': float(y_max * unit_roundoff),
+            # Desplazamiento máximo de cada x guardado, en fracciones del paso
+            'x_resolution_steps': float(x_max * unit_roundoff / abs(self.h)) if self.h else 0.0,
+        }
+        if loss['x_resolution_steps'] > 0.01:
+            loss['warning'] = (f"Los valores de x guardados en {self.dtype.name} se desplazan hasta "
+                               f"{loss['x_resolution_steps']:.2g} pasos; use float64 para esta malla")
+        return loss
+
+    def integrate(self, events=None):
+        """
+        Integrar guardando cada paso en los arrays de resultados, sin formatear.
+
+        Args:
+            events (list, optional): Eventos (Event) a detectar; uno terminal
+                detiene la integración al final del paso que lo contiene
+
+        Returns:
+            ODEMethod: El propio método, con x_values, y_values y las etapas
+                (recortados al último punto válido si la solución diverge)
+        """
+        if events is not None:
+            self.events = events
+        self._allocate()
+
+        # Continuar desde la tabla de una resolución anterior del mismo problema
+        state = self._load_checkpoint(arrays=True)
+        start = 0
+        if state is not None:
+            start = state['step']
+            for name, values in state['arrays'].items():
+                getattr(self, name)[:start + 1] = values
+
+        if self.uses_jit():
+            # Bucle completo fusionado en un kernel compilado
+            self._reset()
+            self.event_monitor = None
+            steps, evaluations, status = run_kernel(self, start=start)
+            steps_taken = start + steps
+            self.function_evaluations = (state['function_evaluations'] + evaluations - 1
+                                         if state is not None else evaluations)
+            self._truncate(steps_taken)
+            if status:
+                self._kernel_stopped(status, steps_taken, self.x_values[-1], self.y_values[-1])
+            self.backend_used = 'jit'
+            # El kernel no devuelve su estado final en float64: en otros tipos
+            # el de la tabla está redondeado y no sirve para continuar
+            if self.dtype == np.float64:
+                self._save_integration_checkpoint(self.x_values[-1], self.y_values[-1])
+            return self
+
+        self.backend_used = 'python'
+        stage_arrays = [getattr(self, attr) for attr in self.STAGE_ATTRS]
+        final_slope = state['k1'] if state is not None else None
+        final_state = (state['x'], state['y']) if state is not None else (self.x0, self.y0)
+        steps_taken = start
+
+        for i, x, y, x_next, y_next, k1_next, stages in self._iterate_steps():
+            for array, value in zip(stage_arrays, stages):
+                array[i] = value
+            self.x_values[i + 1] = x_next
+            self.y_values[i + 1] = y_next
+            final_slope = k1_next
+            final_state = (x_next, y_next)
+            steps_taken = i + 1
+
+        self._truncate(steps_taken)
+
+        # Pendiente en el último punto para completar la tabla
+        if final_slope is None:
+            final_slope = self._evaluate(self.x_values[-1], self.y_values[-1])
+        getattr(self, self.STAGE_ATTRS[0])[-1] = final_slope
+
+        self._save_integration_checkpoint(*final_state, final_slope)
+        return self
+
+    def _save_integration_checkpoint(self, x, y, k1=None):
+        """
+        Guardar el final de integrate() con los arrays de la tabla completa.
+
+        El estado (x, y, f) es el de la integración en float64, no el de los
+        arrays, que pueden estar en un tipo más corto.
+        """
+        if self.checkpoints is None:
+            return
+        if k1 is None:
+            k1 = getattr(self, self.STAGE_ATTRS[0])[-1]
+        arrays = {name: getattr(self, name) for name in ('x_values', 'y_values') + self.STAGE_ATTRS}
+        self._save_checkpoint(self.num_steps, x, y, k1, arrays)
+
+    def solve(self, events=None):
+        """
+        Ejecutar el método guardando cada paso para mostrar la tabla completa.
+
+        Args:
+            events (list, optional): Eventos (Event) a detectar; uno terminal
+                detiene la integración al final del paso que lo contiene
+
+        Returns:
+            dict: Diccionario con los resultados organizados para mostrar
+        """
+        try:
+            self.integrate(events)
+            return self._decorate_results(self._format_results())
+
+        except Exception as e:
+            raise Exception(f"Error en método de {self.METHOD_NAME}: {str(e)}")
+
+    def solve_dense(self, x_points, events=None):
+        """
+        Evaluar la solución en puntos arbitrarios sin guardar cada paso.
+
+        Los puntos se rellenan con el interpolante del paso que los contiene
+        a medida que avanza la integración, por lo que la memoria usada es
+        proporcional al número de puntos pedidos y no al número de pasos. La
+        integración se detiene en el paso que contiene el último punto.
+
+        Args:
+            x_points (array-like): Valores de x dentro de [x0, x0 + num_steps*h]
+            events (list, optional): Eventos (Event) a detectar
+
+        Returns:
+            dict: Resultados con la misma estructura que solve()
+        """
+        try:
+            if events is not None:
+                self.events = events
+            self.backend_used = 'python'
+            points = np.asarray(x_points, dtype=float).ravel()
+            x_end = self.x0 + self.num_steps * self.h
+
+            # Posición de cada punto medida en pasos desde x0
+            positions = (points - self.x0) / self.h if self.h else np.zeros_like(points)
+            if points.size == 0 or positions.min() < -1e-9 or positions.max() > self.num_steps + 1e-9:
+                raise ValueError(f"Los puntos de salida deben estar en [{self.x0}, {x_end}]")
+
+            order = np.argsort(positions, kind='stable')
+            sorted_positions = positions[order]
+            y_out = np.empty(points.size, dtype=self.dtype)
+
+            # Puntos que coinciden con x0
+            next_point = int(np.searchsorted(sorted_positions, 1e-12, side='right'))
+            y_out[order[:next_point]] = self.y0
+
+            x_last, y_last, steps_taken = self.x0, self.y0, 0
+            if next_point < points.size:
+                for i, x, y, x_next, y_next, k1_next, stages in self._iterate_steps():
+                    x_last, y_last, steps_taken = x_next, y_next, i + 1
+
+                    block_end = int(np.searchsorted(sorted_positions, i + 1 + 1e-9, side='right'))
+                    if block_end > next_point:
+                        indices = order[next_point:block_end]
+                        theta = np.clip((points[indices] - x) / self.h, 0.0, 1.0)
+                        y_out[indices] = self._interpolate(x, y, y_next, stages[0], k1_next, stages, theta)
+                        next_point = block_end
+
+                    # No integrar más allá del último punto pedido
+                    if next_point >= points.size:
+                        break
+
+            # Un evento terminal o una divergencia dejan sin valor los puntos posteriores
+            y_out[order[next_point:]] = np.nan
+
+            return self._decorate_results(
+                self._format_dense_results(points, y_out, x_last, y_last, steps_taken))
+
+        except Exception as e:
+            raise Exception(f"Error en método de {self.METHOD_NAME}: {str(e)}")
+
+    def solve_lean(self, stride=None, events=None):
+        """
+        Ejecutar el método guardando solo el estado actual (memoria O(1)).
+
+        No se reservan arrays ni se construye la tabla paso a paso, por lo que
+        admite un número de pasos muy superior al del modo normal. Opcionalmente
+        se conserva una traza submuestreada con uno de cada ``stride`` puntos.
+
+        Args:
+            stride (int, optional): Guardar cada k-ésimo punto de la malla
+            events (list, optional): Eventos (Event) a detectar
+
+        Returns:
+            dict: Valor final, traza (extremos incluidos) y resumen
+        """
+        try:
+            if events is not None:
+                self.events = events
+            if stride is not None and stride < 1:
+                raise ValueError(f"El submuestreo debe ser un entero positivo: {stride}")
+
+            x_last, y_last, steps_taken = float(self.x0), float(self.y0), 0
+            trace_x, trace_y = [x_last], [y_last]
+            self.backend_used = 'python'
+
+            # Sin traza se puede continuar desde un punto de control del problema
+            # (con traza faltarían sus puntos anteriores)
+            self.resume_from = None
+            state = self._load_checkpoint() if not stride else None
+            if state is not None:
+                x_last, y_last, steps_taken = state['x'], state['y'], state['step']
+            interval = self.checkpoint_interval if self.checkpoints is not None else None
+
+            if not stride and self.uses_jit():
+                # Bucle completo fusionado en un kernel compilado, por tramos de
+                # checkpoint_interval pasos con un punto de control tras cada uno
+                self._reset()
+                self.event_monitor = None
+                self.backend_used = 'jit'
+                if state is not None:
+                    self.function_evaluations = state['function_evaluations']
+                while steps_taken < self.num_steps:
+                    segment = min(interval or self.num_steps, self.num_steps - steps_taken)
+                    steps, x_last, y_last, evaluations, status = run_kernel(
+                        self, lean=True, start=(steps_taken, x_last, y_last), num_steps=segment)
+                    steps_taken += steps
+                    self.function_evaluations += evaluations
+                    if status:
+                        self._kernel_stopped(status, steps_taken, x_last, y_last)
+                        break
+                    if self.checkpoints is not None:
+                        self._save_checkpoint(steps_taken, x_last, y_last, self._evaluate(x_last, y_last))
+            else:
+                k1_last = state['k1'] if state is not None else None
+                for i, x, y, x_next, y_next, k1_next, stages in self._iterate_steps():
+                    x_last, y_last, k1_last, steps_taken = x_next, y_next, k1_next, i + 1
+                    if stride and steps_taken % stride == 0:
+                        trace_x.append(x_next)
+                        trace_y.append(y_next)
+                    if interval and steps_taken % interval == 0:
+                        self._save_checkpoint(steps_taken, x_last, y_last, k1_last)
+                if k1_last is not None:
+                    self._save_checkpoint(steps_taken, x_last, y_last, k1_last)
+
+            # El punto final siempre forma parte de la traza
+            if steps_taken and trace_x[-1] != x_last:
+                trace_x.append(x_last)
+                trace_y.append(y_last)
+
+            return self._decorate_results({
+                'output_mode': 'lean',
+                'final': {'x': x_last, 'y': y_last},
+                'plot_data': {
+                    'x_values': self._plot_values(np.asarray(trace_x)),
+                    'y_values': self._plot_values(np.asarray(trace_y)),
+                    'method': self.METHOD_NAME
+                },
+                'method_info': dict(self.METHOD_INFO),
+                'summary': {
+                    'initial_value': f"y({self.x0}) = {self.y0}",
+                    'final_value': f"y({x_last:.6f}) ≈ {y_last:.6f}",
+                    'total_steps': steps_taken,
+                    'step_size': self.h,
+                    'interval': f"[{self.x0}, {x_last:.6f}]",
+                    'function_evaluations': self.function_evaluations,
+                    'stride': stride
+                }
+            })
+
+        except Exception as e:
+            raise Exception(f"Error en método de {self.METHOD_NAME}: {str(e)}")
+
+    def _format_dense_results(self, x_out, y_out, x_last, y_last, steps_taken):
+        """
+        Formatear los resultados de la salida densa.
+
+        Args:
+            x_out (np.ndarray): Puntos de salida pedidos
+            y_out (np.ndarray): Valores interpolados en esos puntos
+            x_last (float): Último x alcanzado por la integración
+            y_last (float): y en x_last
+            steps_taken (int): Pasos realmente integrados
+
+        Returns:
+            dict: Resultados formateados
+        """
+        steps_table = [
+            {'step': i, 'x': round(float(x), 6), 'y': round(float(y), 6)}
+            for i, (x, y) in enumerate(zip(x_out, y_out))
+        ]
+
+        plot_data = {
+            'x_values': self._plot_values(x_out),
+            'y_values': self._plot_values(y_out),
+            'method': self.METHOD_NAME
+        }
+
+        return {
+            'output_mode': 'dense',
+            'steps_table': steps_table,
+            'plot_data': plot_data,
+            'method_info': dict(self.METHOD_INFO),
+            'summary': {
+                'initial_value': f"y({self.x0}) = {self.y0}",
+                'final_value': f"y({x_last:.6f}) ≈ {y_last:.6f}",
+                'total_steps': steps_taken,
+                'step_size': self.h,
+                'interval': f"[{self.x0}, {x_last:.6f}]",
+                'function_evaluations': self.function_evaluations,
+                'output_points': len(x_out)
+            }
+        }
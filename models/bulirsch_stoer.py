@@ -0,0 +1,326 @@
+import math
+
+import numpy as np
+from .base import ODEMethod
+
+
+class BulirschStoerMethod(ODEMethod):
+    """
+    Método de extrapolación de Gragg-Bulirsch-Stoer para dy/dx = f(x, y).
+
+    Cada paso interno de tamaño H aplica la regla del punto medio modificada
+    (Gragg) con n_j = 2, 4, 6, ... subpasos y extrapola a H/n → 0 con el
+    esquema de Aitken-Neville. Como el error del punto medio modificado solo
+    tiene potencias pares de H/n, cada columna de la tabla gana dos órdenes:
+    la fila j alcanza orden 2j + 2. La diferencia entre las dos últimas
+    columnas estima el error, que decide a la vez el tamaño del siguiente
+    paso interno y la fila de la tabla (el orden) con menos trabajo por
+    unidad de x, como en ODEX de Hairer y Wanner.
+
+    Igual que en SciPyMethod, la malla x_i = x0 + i·h de la petición solo
+    fija dónde se entregan los valores: dentro de cada paso de la malla se
+    dan los pasos internos que hagan falta, sin pasarse del siguiente punto.
+    Con funciones suaves y tolerancias estrictas basta un paso interno de
+    orden alto por cada punto de la malla, con muchas menos evaluaciones de
+    f que Runge-Kutta para la misma precisión.
+    """
+
+    METHOD_NAME = 'Bulirsch-Stoer'
+    STAGE_ATTRS = ('slope_values',)
+
+    # Estimación para el presupuesto previo: un paso interno de orden 6-8
+    # por punto de la malla (el número real depende de las tolerancias)
+    EVALS_PER_STEP = 12
+
+    # Filas de la tabla de extrapolación (n_j = 2, 4, ..., 2·MAX_ROWS)
+    MAX_ROWS = 8
+    SEQUENCE = tuple(2 * (j + 1) for j in range(MAX_ROWS))
+
+    # Control del paso: factor de seguridad y límites de cambio por paso
+    SAFETY = 0.94
+    MIN_FACTOR = 0.02
+    MAX_FACTOR = 4.0
+
+    # Rechazos consecutivos antes de dar el paso por imposible
+    MAX_REJECTIONS = 50
+
+    def __init__(self, function_str, x0, y0, h, num_steps, rtol=1e-6, atol=1e-9):
+        """
+        Inicializar el método.
+
+        Args:
+            function_str (str): Función f(x,y) como string
+            x0 (float): Valor inicial de x
+            y0 (float): Valor inicial de y
+            h (float): Separación de la malla de salida
+            num_steps (int): Número de puntos de salida tras x0
+            rtol (float): Tolerancia relativa
+            atol (float): Tolerancia absoluta
+        """
+        if not rtol > 0 or not atol > 0:
+            raise ValueError("Las tolerancias deben ser positivas")
+        super().__init__(function_str, x0, y0, h, num_steps)
+        self.rtol = float(rtol)
+        self.atol = float(atol)
+
+        # Evaluaciones acumuladas hasta cada fila: f(x, y) más n_1 + ... + n_j
+        self._work = np.cumsum((1,) + self.SEQUENCE)[1:]
+
+        # Estado del control: tamaño y fila propuestos para el próximo paso interno
+        self._proposal = None
+        self._row = None
+
+        # Estadísticas de la última resolución
+        self.internal_steps = 0
+        self.rejected_steps = 0
+        self._order_sum = 0
+
+    @classmethod
+    def options_from_request(cls, data):
+        """Leer las tolerancias de la petición."""
+        options = {}
+        for name in ('rtol', 'atol'):
+            if data.get(name):
+                options[name] = float(data[name])
+        return options
+
+    @property
+    def METHOD_INFO(self):
+        """Información del método para la interfaz."""
+        return {
+            'name': 'Método de Bulirsch-Stoer (extrapolación de Gragg)',
+            'formula': 'T_{j,k+1} = T_{j,k} + (T_{j,k} - T_{j-1,k}) / ((n_j / n_{j-k})² - 1)',
+            'description': 'Punto medio modificado extrapolado a paso cero, con paso y orden adaptativos',
+            'order': f'2-{2 * self.MAX_ROWS} (adaptativo)',
+            'error_type': f'Controlado por las tolerancias (rtol={self.rtol:g}, atol={self.atol:g})',
+            'steps': [
+                '1. Punto medio modificado con n = 2, 4, 6, ... subpasos sobre el paso interno H',
+                '2. Extrapolación de Aitken-Neville a H/n → 0 (cada columna gana dos órdenes)',
+                '3. Se acepta la primera fila cuyo error estimado cumple la tolerancia',
+                '4. El siguiente H y la fila objetivo minimizan las evaluaciones por unidad de x'
+            ]
+        }
+
+    def _reset(self):
+        """Reiniciar el control del paso y las estadísticas."""
+        super()._reset()
+        self._proposal = None
+        self._row = None
+        self.internal_steps = 0
+        self.rejected_steps = 0
+        self._order_sum = 0
+
+    def checkpoint_signature(self):
+        """Firma del problema, con las tolerancias."""
+        return dict(super().checkpoint_signature(), rtol=self.rtol, atol=self.atol)
+
+    def _checkpoint_state(self, step, x, y, k1):
+        """Añadir el paso y la fila propuestos, para continuar con los mismos pasos internos."""
+        return dict(super()._checkpoint_state(step, x, y, k1),
+                    proposal=self._proposal, row=self._row,
+                    internal_steps=self.internal_steps, rejected_steps=self.rejected_steps,
+                    order_sum=self._order_sum)
+
+    def _restore_state(self, state):
+        """Recuperar el control del paso de un punto de control."""
+        self._proposal = state['proposal']
+        self._row = state['row']
+        self.internal_steps = state['internal_steps']
+        self.rejected_steps = state['rejected_steps']
+        self._order_sum = state['order_sum']
+
+    def _initial_row(self):
+        """Fila inicial según la tolerancia (más estricta, más orden)."""
+        row = int(-math.log10(self.rtol) * 0.6 + 1.5) - 1
+        return max(1, min(self.MAX_ROWS - 2, row))
+
+    def _modified_midpoint(self, x, y, f0, H, n):
+        """
+        Regla del punto medio modificada de Gragg con ``n`` subpasos (n evaluaciones de f).
+
+        Args:
+            x (float): Inicio del paso interno
+            y (float): y en x
+            f0 (float): f(x, y), ya evaluada
+            H (float): Tamaño del paso interno
+            n (int): Número de subpasos (par)
+
+        Returns:
+            float: Aproximación de y(x + H)
+        """
+        step = H / n
+        z_prev = y
+        z = y + step * f0
+        for m in range(1, n):
+            z_prev, z = z, z_prev + 2 * step * self._evaluate(x + m * step, z)
+        # Suavizado final de Gragg
+        return 0.5 * (z + z_prev + step * self._evaluate(x + H, z))
+
+    def _error_norm(self, y, y_new, difference):
+        """
+        Norma RMS del error estimado relativa a atol + rtol·|y|.
+
+        Con un vector de estados (barridos) se ignoran los componentes no
+        finitos; si no queda ninguno, el error es infinito.
+        """
+        scale = self.atol + self.rtol * np.maximum(np.abs(y), np.abs(y_new))
+        ratio = np.atleast_1d(np.abs(difference) / scale)
+        ratio = ratio[np.isfinite(ratio)]
+        if ratio.size == 0:
+            return math.inf
+        return float(np.sqrt(np.mean(ratio * ratio)))
+
+    def _factor(self, error, row):
+        """Factor de cambio de H que llevaría el error de la fila ``row`` a la tolerancia."""
+        if error == 0:
+            return self.MAX_FACTOR
+        factor = self.SAFETY * (0.65 / error) ** (1 / (2 * row + 1))
+        return min(self.MAX_FACTOR, max(self.MIN_FACTOR, factor))
+
+    def _extrapolate(self, x, y, f0, H, target):
+        """
+        Intentar un paso interno construyendo la tabla de extrapolación
+        hasta la fila ``target + 1``.
+
+        Returns:
+            tuple: (y(x + H) o None si se rechaza, fila aceptada o de referencia,
+                factores de cambio de H por fila)
+        """
+        table = []
+        factors = {}
+        last = min(target + 1, self.MAX_ROWS - 1)
+        for j in range(last + 1):
+            n_j = self.SEQUENCE[j]
+            row = [self._modified_midpoint(x, y, f0, H, n_j)]
+            for k in range(1, j + 1):
+                ratio = (n_j / self.SEQUENCE[j - k]) ** 2 - 1
+                row.append(row[k - 1] + (row[k - 1] - table[j - 1][k - 1]) / ratio)
+            table.append(row)
+            if j == 0:
+                continue
+
+            error = self._error_norm(y, row[j], row[j] - row[j - 1])
+            factors[j] = self._factor(error, j) if math.isfinite(error) else self.MIN_FACTOR
+            if j >= target - 1 and error <= 1:
+                return row[j], j, factors
+        return None, min(target, last), factors
+
+    def _next_row(self, row, factors):
+        """
+        Elegir la fila y el tamaño del siguiente paso interno: la de menos
+        evaluaciones por unidad de x entre la aceptada y la anterior, o una
+        más si la aceptada sale claramente más barata.
+
+        Returns:
+            tuple: (fila, factor de cambio de H)
+        """
+        work = self._work
+        if row >= 2 and work[row - 1] / factors[row - 1] < 0.8 * work[row] / factors[row]:
+            return row - 1, factors[row - 1]
+        if (row < self.MAX_ROWS - 2 and (row == 1 or work[row] / factors[row] < 0.9 * work[row - 1] / factors[row - 1])):
+            return row + 1, factors[row] * work[row + 1] / work[row]
+        return row, factors[row]
+
+    def _step(self, x, y, k1):
+        """
+        Avanzar un paso de la malla con los pasos internos necesarios.
+
+        Args:
+            x (float): Valor actual de x
+            y (float): Valor actual de y
+            k1 (float): f(x_i, y_i)
+
+        Returns:
+            tuple: (y_{i+1}, (k1,))
+
+        Raises:
+            ValueError: Si el paso interno se hace despreciable sin cumplir la tolerancia
+        """
+        if self._proposal is None:
+            self._proposal = self.h
+            self._row = self._initial_row()
+
+        x_end = x + self.h
+        x_sub, y_sub, f_sub = x, y, k1
+        rejections = 0
+        while True:
+            # Aritmética del paso en la dirección de h (la malla puede ir hacia atrás)
+            remaining = x_end - x_sub
+            H = math.copysign(min(abs(self._proposal), abs(remaining)), self.h)
+            clipped = abs(H) < abs(self._proposal)
+            try:
+                y_new, row, factors = self._extrapolate(x_sub, y_sub, f_sub, H, self._row)
+            except ValueError:
+                # f no se puede evaluar con un paso tan grande: reducirlo
+                y_new, row, factors = None, self._row, {}
+
+            if y_new is None:
+                self.rejected_steps += 1
+                rejections += 1
+                factor = factors.get(row, 0.5)
+                self._proposal = H * min(factor, 0.5)
+                if rejections > self.MAX_REJECTIONS or abs(self._proposal) <= 1e-14 * max(1.0, abs(x_sub)):
+                    raise ValueError(f"el paso interno se hizo despreciable en x = {x_sub:.6g} "
+                                     f"sin alcanzar la tolerancia")
+                continue
+
+            self.internal_steps += 1
+            self._order_sum += 2 * row + 2
+            rejections = 0
+            self._row, factor = self._next_row(row, factors)
+            proposal = H * factor
+            # Un paso recortado para caer en la malla no indica que H deba bajar
+            self._proposal = max(proposal, self._proposal, key=abs) if clipped else proposal
+
+            x_sub, y_sub = x_sub + H, y_new
+            if abs(H) >= abs(remaining):
+                return y_new, (k1,)
+            f_sub = self._evaluate(x_sub, y_sub)
+
+    def _decorate_results(self, results):
+        """Añadir al resumen las tolerancias y las estadísticas de la extrapolación."""
+        results = super()._decorate_results(results)
+        results['summary'].update({
+            'rtol': self.rtol,
+            'atol': self.atol,
+            'internal_steps': self.internal_steps,
+            'rejected_steps': self.rejected_steps,
+            'mean_order': round(self._order_sum / self.internal_steps, 2) if self.internal_steps else None,
+        })
+        return results
+
+    def _format_results(self):
+        """
+        Formatear resultados para mostrar en la interfaz.
+
+        Returns:
+            dict: Resultados formateados
+        """
+        steps_table = []
+        for i in range(len(self.x_values)):
+            steps_table.append({
+                'step': i,
+                'x': round(self.x_values[i], 6),
+                'y': round(self.y_values[i], 6),
+                'slope': round(self.slope_values[i], 6) if not np.isnan(self.slope_values[i]) else 'N/A'
+            })
+
+        plot_data = {
+            'x_values': self._plot_values(self.x_values),
+            'y_values': self._plot_values(self.y_values),
+            'method': self.METHOD_NAME
+        }
+
+        return {
+            'steps_table': steps_table,
+            'plot_data': plot_data,
+            'method_info': dict(self.METHOD_INFO),
+            'summary': {
+                'initial_value': f"y({self.x0}) = {self.y0}",
+                'final_value': f"y({self.x_values[-1]:.6f}) ≈ {self.y_values[-1]:.6f}",
+                'total_steps': self.num_steps,
+                'step_size': self.h,
+                'interval': f"[{self.x0}, {self.x_values[-1]:.6f}]",
+                'function_evaluations': self.function_evaluations
+            }
+        }
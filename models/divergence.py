@@ -0,0 +1,83 @@
+import math
+
+
+class DivergenceGuard:
+    """
+    Detecta paso a paso que la solución numérica está divergiendo.
+
+    Un paso se considera divergente si produce valores no finitos, si |y|
+    supera un umbral absoluto o si y cambia en un solo paso mucho más que su
+    propia magnitud. Al detectarlo, la integración se detiene y se conserva
+    la parte válida de la trayectoria junto con un diagnóstico.
+    """
+
+    # Códigos de estado compartidos con los kernels JIT (utils/jit.py)
+    OK, NON_FINITE, MAGNITUDE, GROWTH, EVALUATION = range(5)
+
+    REASONS = {
+        NON_FINITE: 'no_finito',
+        MAGNITUDE: 'magnitud',
+        GROWTH: 'crecimiento',
+        EVALUATION: 'error_evaluacion',
+    }
+
+    def __init__(self, max_magnitude=1e100, max_growth=1e3):
+        """
+        Inicializar la guarda.
+
+        Args:
+            max_magnitude (float): Máximo |y| admitido
+            max_growth (float): Máximo |y_{i+1} - y_i| / max(|y_i|, 1) en un paso
+        """
+        if not max_magnitude > 0 or not max_growth > 0:
+            raise ValueError("Los umbrales de divergencia deben ser positivos")
+        self.max_magnitude = float(max_magnitude)
+        self.max_growth = float(max_growth)
+
+    def check(self, y, y_next, k1_next):
+        """
+        Comprobar un paso ya calculado.
+
+        Args:
+            y (float): y al inicio del paso
+            y_next (float): y al final del paso
+            k1_next (float): f al final del paso
+
+        Returns:
+            int: OK o el código de la causa de divergencia
+        """
+        if not (math.isfinite(y_next) and math.isfinite(k1_next)):
+            return self.NON_FINITE
+        if abs(y_next) > self.max_magnitude:
+            return self.MAGNITUDE
+        if abs(y_next - y) > self.max_growth * max(abs(y), 1.0):
+            return self.GROWTH
+        return self.OK
+
+    def diagnostic(self, status, step, x, y, detail=None):
+        """
+        Construir el diagnóstico de una divergencia.
+
+        Args:
+            status (int): Código devuelto por check() (o EVALUATION)
+            step (int): Número del paso que divergió (empezando en 1)
+            x (float): Último x válido
+            y (float): y en ese x
+            detail (str, optional): Mensaje de error de la evaluación
+
+        Returns:
+            dict: Causa, mensaje y último punto válido
+        """
+        messages = {
+            self.NON_FINITE: 'la solución dejó de ser finita',
+            self.MAGNITUDE: f'|y| superó {self.max_magnitude:g}',
+            self.GROWTH: f'y creció más de {self.max_growth:g} veces su magnitud en un paso',
+            self.EVALUATION: f'no se pudo evaluar f ({detail})',
+        }
+        return {
+            'reason': self.REASONS[status],
+            'message': f"Divergencia en el paso {step}: {messages[status]}",
+            'step': step,
+            'x': x,
+            'y': y,
+        }
@@ -1,75 +1,47 @@
 import numpy as np
-from utils.parser import evaluate_function
+from .base import ODEMethod
 
 
-class EulerMethod:
+class EulerMethod(ODEMethod):
     """
     Implementación del Método de Euler para resolver ecuaciones diferenciales
     de la forma: dy/dx = f(x, y) con condición inicial y(x0) = y0
     """
 
-    def __init__(self, function_str, x0, y0, h, num_steps):
-        """
-        Inicializar el método de Euler.
-
-        Args:
-            function_str (str): Función f(x,y) como string (ej: "x + y", "x*y - 2*x")
-            x0 (float): Valor inicial de x
-            y0 (float): Valor inicial de y (condición inicial)
-            h (float): Tamaño del paso
-            num_steps (int): Número de pasos a realizar
-        """
-        self.function_str = function_str
-        self.x0 = x0
-        self.y0 = y0
-        self.h = h
-        self.num_steps = num_steps
+    METHOD_NAME = 'Euler'
+    STAGE_ATTRS = ('slope_values',)
 
-        # Arrays para almacenar resultados
-        self.x_values = np.zeros(num_steps + 1)
-        self.y_values = np.zeros(num_steps + 1)
-        self.slope_values = np.zeros(num_steps + 1)
+    EVALS_PER_STEP = 1
 
-        # Condiciones iniciales
-        self.x_values[0] = x0
-        self.y_values[0] = y0
-
-    def solve(self):
+    # Paso equivalente para el backend JIT
+    JIT_STEP_SOURCE = """
+        y_next = y + h * k1
+    """
+    JIT_STAGES = ('k1',)
+
+    # Información del método
+    METHOD_INFO = {
+        'name': 'Método de Euler',
+        'formula': 'y_{n+1} = y_n + h × f(x_n, y_n)',
+        'description': 'Método numérico de primer orden para resolver EDOs',
+        'order': 1,
+        'error_type': 'O(h²) por paso, O(h) global'
+    }
+
+    def _step(self, x, y, k1):
         """
-        Ejecutar el método de Euler para resolver la ecuación diferencial.
+        Avanzar un paso del método de Euler.
+
+        Args:
+            x (float): Valor actual de x
+            y (float): Valor actual de y
+            k1 (float): Pendiente f(x_i, y_i)
 
         Returns:
-            dict: Diccionario con los resultados organizados para mostrar
+            tuple: (y_{i+1}, (pendiente,))
         """
-        try:
-            # Calcular pendiente inicial
-            self.slope_values[0] = evaluate_function(self.function_str, self.x0, self.y0)
-
-            # Aplicar método de Euler iterativamente
-            for i in range(self.num_steps):
-                # Valores actuales
-                x_current = self.x_values[i]
-                y_current = self.y_values[i]
-
-                # Calcular pendiente f(xi, yi)
-                slope = evaluate_function(self.function_str, x_current, y_current)
-                self.slope_values[i] = slope
-
-                # Fórmula de Euler: y_{i+1} = y_i + h * f(x_i, y_i)
-                self.x_values[i + 1] = x_current + self.h
-                self.y_values[i + 1] = y_current + self.h * slope
-
-            # Calcular pendiente final
-            self.slope_values[-1] = evaluate_function(
-                self.function_str,
-                self.x_values[-1],
-                self.y_values[-1]
-            )
-
-            return self._format_results()
-
-        except Exception as e:
-            raise Exception(f"Error en método de Euler: {str(e)}")
+        # Fórmula de Euler: y_{i+1} = y_i + h * f(x_i, y_i)
+        return y + self.h * k1, (k1,)
 
     def _format_results(self):
         """
@@ -97,29 +69,21 @@ class EulerMethod:
 
         # Datos para la gráfica
         plot_data = {
-            'x_values': self.x_values.tolist(),
-            'y_values': self.y_values.tolist(),
+            'x_values': self._plot_values(self.x_values),
+            'y_values': self._plot_values(self.y_values),
             'method': 'Euler'
         }
 
-        # Información del método
-        method_info = {
-            'name': 'Método de Euler',
-            'formula': 'y_{n+1} = y_n + h × f(x_n, y_n)',
-            'description': 'Método numérico de primer orden para resolver EDOs',
-            'order': 1,
-            'error_type': 'O(h²) por paso, O(h) global'
-        }
-
         return {
             'steps_table': steps_table,
             'plot_data': plot_data,
-            'method_info': method_info,
+            'method_info': dict(self.METHOD_INFO),
             'summary': {
                 'initial_value': f"y({self.x0}) = {self.y0}",
                 'final_value': f"y({self.x_values[-1]:.6f}) ≈ {self.y_values[-1]:.6f}",
                 'total_steps': self.num_steps,
                 'step_size': self.h,
-                'interval': f"[{self.x0}, {self.x_values[-1]:.6f}]"
+                'interval': f"[{self.x0}, {self.x_values[-1]:.6f}]",
+                'function_evaluations': self.function_evaluations
             }
         }
\ No newline at end of file
@@ -0,0 +1,168 @@
+from utils.parser import validate_function, evaluate_function
+
+
+class Event:
+    """
+    Evento g(x, y) = 0 a detectar durante la integración.
+
+    Por ejemplo, ``Event('y - 2')`` detecta cuándo la solución cruza y = 2 y
+    ``Event('y', direction=-1, terminal=True)`` detiene la integración cuando
+    y llega a cero bajando. La expresión puede usar los parámetros con nombre
+    de f (``Event('y - k', parameters=['k'])``).
+    """
+
+    def __init__(self, expression, direction=0, terminal=False, name=None, parameters=()):
+        """
+        Inicializar el evento.
+
+        Args:
+            expression (str): Función g(x, y) cuyo cero define el evento
+            direction (int): 1 solo cruces ascendentes, -1 solo descendentes, 0 ambos
+            terminal (bool): Detener la integración en el paso del evento
+            name (str, optional): Nombre para mostrar (default: la expresión)
+            parameters (iterable, optional): Nombres de los parámetros que puede usar
+        """
+        if not validate_function(expression, parameters):
+            raise ValueError(f"Expresión de evento inválida: {expression}")
+        if direction not in (-1, 0, 1):
+            raise ValueError(f"Dirección de evento inválida: {direction} (use -1, 0 o 1)")
+
+        self.expression = expression
+        self.direction = direction
+        self.terminal = terminal
+        self.name = name or expression
+
+    def evaluate(self, x, y, params=None):
+        """Evaluar g(x, y) con los valores de los parámetros del método."""
+        return evaluate_function(self.expression, x, y, params)
+
+    def crosses(self, g_start, g_end):
+        """
+        Comprobar si el signo de g cambia en la dirección pedida.
+
+        Args:
+            g_start (float): g al inicio del paso
+            g_end (float): g al final del paso
+
+        Returns:
+            int: Dirección del cruce (1 o -1), o 0 si no hay cruce válido
+        """
+        if g_start == 0 or (g_start > 0) == (g_end > 0) and g_end != 0:
+            return 0
+
+        crossing = 1 if g_end > g_start else -1
+        if self.direction and crossing != self.direction:
+            return 0
+        return crossing
+
+
+class EventMonitor:
+    """
+    Vigila un conjunto de eventos paso a paso y localiza sus cruces.
+
+    Los cruces se localizan con regula falsi (variante de Illinois) sobre el
+    interpolante del paso, de modo que no requieren evaluaciones extra de f.
+    """
+
+    def __init__(self, events, parameters=None, tolerance=1e-12, max_iterations=100):
+        """
+        Inicializar el monitor.
+
+        Args:
+            events (list): Lista de Event
+            parameters (dict, optional): Valores de los parámetros con nombre del método
+            tolerance (float): Tolerancia relativa en theta para la raíz
+            max_iterations (int): Máximo de iteraciones por raíz
+        """
+        self.events = list(events)
+        self.parameters = parameters
+        self.tolerance = tolerance
+        self.max_iterations = max_iterations
+        self.found = []
+        self.terminated = False
+        self._g_values = []
+
+    def start(self, x, y):
+        """Evaluar los eventos en el punto inicial."""
+        self.found = []
+        self.terminated = False
+        self._g_values = [event.evaluate(x, y, self.parameters) for event in self.events]
+
+    def check(self, x, h, y_next, interpolant):
+        """
+        Comprobar los eventos al final de un paso.
+
+        Args:
+            x (float): Inicio del paso
+            h (float): Tamaño del paso
+            y_next (float): y al final del paso
+            interpolant (callable): theta -> y(x + theta*h) dentro del paso
+
+        Returns:
+            bool: True si un evento terminal exige detener la integración
+        """
+        x_next = x + h
+        g_next = [event.evaluate(x_next, y_next, self.parameters) for event in self.events]
+
+        occurrences = []
+        for event, g_start, g_end in zip(self.events, self._g_values, g_next):
+            direction = event.crosses(g_start, g_end)
+            if direction:
+                theta = self._locate(event, x, h, interpolant, g_start, g_end)
+                occurrences.append((theta, event, direction))
+
+        self._g_values = g_next
+
+        # Registrar en orden de aparición, hasta el primer evento terminal
+        for theta, event, direction in sorted(occurrences, key=lambda item: item[0]):
+            self.found.append({
+                'name': event.name,
+                'x': x + theta * h,
+                'y': float(interpolant(theta)),
+                'direction': 'ascendente' if direction > 0 else 'descendente',
+                'terminal': event.terminal
+            })
+            if event.terminal:
+                self.terminated = True
+                return True
+
+        return False
+
+    def _locate(self, event, x, h, interpolant, g_start, g_end):
+        """
+        Encontrar theta en [0, 1] con g(x + theta*h, y(theta)) = 0.
+
+        Returns:
+            float: Posición relativa del cruce dentro del paso
+        """
+        if g_end == 0:
+            return 1.0
+
+        low, high = 0.0, 1.0
+        g_low, g_high = g_start, g_end
+        side = 0
+        previous = None
+
+        for _ in range(self.max_iterations):
+            theta = (low * g_high - high * g_low) / (g_high - g_low)
+            if previous is not None and abs(theta - previous) < self.tolerance:
+                return theta
+            previous = theta
+
+            g_theta = event.evaluate(x + theta * h, float(interpolant(theta)), self.parameters)
+            if g_theta == 0:
+                return theta
+
+            # Illinois: si el mismo extremo se conserva dos veces, dividir su g
+            if (g_theta > 0) == (g_high > 0):
+                high, g_high = theta, g_theta
+                if side == 1:
+                    g_low /= 2
+                side = 1
+            else:
+                low, g_low = theta, g_theta
+                if side == -1:
+                    g_high /= 2
+                side = -1
+
+        return previous
@@ -1,88 +1,66 @@
 import numpy as np
-from utils.parser import evaluate_function
+from .base import ODEMethod
 
 
-class HeunMethod:
+class HeunMethod(ODEMethod):
     """
     Implementación del Método de Heun (Euler mejorado) para resolver ecuaciones
     diferenciales de la forma: dy/dx = f(x, y) con condición inicial y(x0) = y0
     """
 
-    def __init__(self, function_str, x0, y0, h, num_steps):
+    METHOD_NAME = 'Heun'
+    STAGE_ATTRS = (
+        'k1_values',    # Primera pendiente
+        'k2_values',    # Segunda pendiente
+        'y_predictor',  # Valor predictor (Euler simple)
+    )
+
+    EVALS_PER_STEP = 2
+
+    # Paso equivalente para el backend JIT
+    JIT_STEP_SOURCE = """
+        y_pred = y + h * k1
+        k2 = f(x + h, y_pred)
+        y_next = y + (h / 2) * (k1 + k2)
+    """
+    JIT_STAGES = ('k1', 'k2', 'y_pred')
+
+    # Información del método
+    METHOD_INFO = {
+        'name': 'Método de Heun (Euler Mejorado)',
+        'formula': 'y_{n+1} = y_n + (h/2) × [f(x_n, y_n) + f(x_{n+1}, y_pred)]',
+        'description': 'Método predictor-corrector de segundo orden para resolver EDOs',
+        'order': 2,
+        'error_type': 'O(h³) por paso, O(h²) global',
+        'steps': [
+            '1. Predictor: y_pred = y_n + h × f(x_n, y_n)',
+            '2. Corrector: y_{n+1} = y_n + (h/2) × [f(x_n, y_n) + f(x_{n+1}, y_pred)]'
+        ]
+    }
+
+    def _step(self, x, y, k1):
         """
-        Inicializar el método de Heun.
+        Avanzar un paso del método de Heun.
 
         Args:
-            function_str (str): Función f(x,y) como string (ej: "x + y", "x*y - 2*x")
-            x0 (float): Valor inicial de x
-            y0 (float): Valor inicial de y (condición inicial)
-            h (float): Tamaño del paso
-            num_steps (int): Número de pasos a realizar
-        """
-        self.function_str = function_str
-        self.x0 = x0
-        self.y0 = y0
-        self.h = h
-        self.num_steps = num_steps
-
-        # Arrays para almacenar resultados
-        self.x_values = np.zeros(num_steps + 1)
-        self.y_values = np.zeros(num_steps + 1)
-        self.k1_values = np.zeros(num_steps + 1)  # Primera pendiente
-        self.k2_values = np.zeros(num_steps + 1)  # Segunda pendiente
-        self.y_predictor = np.zeros(num_steps + 1)  # Valor predictor (Euler simple)
-
-        # Condiciones iniciales
-        self.x_values[0] = x0
-        self.y_values[0] = y0
-
-    def solve(self):
-        """
-        Ejecutar el método de Heun para resolver la ecuación diferencial.
+            x (float): Valor actual de x
+            y (float): Valor actual de y
+            k1 (float): Primera pendiente f(x_i, y_i)
 
         Returns:
-            dict: Diccionario con los resultados organizados para mostrar
+            tuple: (y_{i+1}, (k1, k2, y_predictor))
         """
-        try:
-            # Calcular k1 inicial
-            self.k1_values[0] = evaluate_function(self.function_str, self.x0, self.y0)
-
-            # Aplicar método de Heun iterativamente
-            for i in range(self.num_steps):
-                # Valores actuales
-                x_current = self.x_values[i]
-                y_current = self.y_values[i]
-
-                # PASO 1: Calcular k1 = f(x_i, y_i)
-                k1 = evaluate_function(self.function_str, x_current, y_current)
-                self.k1_values[i] = k1
-
-                # PASO 2: Predictor usando Euler simple
-                # y_predictor = y_i + h * k1
-                x_next = x_current + self.h
-                y_pred = y_current + self.h * k1
-                self.y_predictor[i] = y_pred
-
-                # PASO 3: Calcular k2 = f(x_{i+1}, y_predictor)
-                k2 = evaluate_function(self.function_str, x_next, y_pred)
-                self.k2_values[i] = k2
-
-                # PASO 4: Corrector (promedio de pendientes)
-                # y_{i+1} = y_i + (h/2) * (k1 + k2)
-                self.x_values[i + 1] = x_next
-                self.y_values[i + 1] = y_current + (self.h / 2) * (k1 + k2)
-
-            # Calcular k1 final para completar la tabla
-            self.k1_values[-1] = evaluate_function(
-                self.function_str,
-                self.x_values[-1],
-                self.y_values[-1]
-            )
-
-            return self._format_results()
-
-        except Exception as e:
-            raise Exception(f"Error en método de Heun: {str(e)}")
+        # PASO 1: Predictor usando Euler simple
+        # y_predictor = y_i + h * k1
+        x_next = x + self.h
+        y_pred = y + self.h * k1
+
+        # PASO 2: Calcular k2 = f(x_{i+1}, y_predictor)
+        k2 = self._evaluate(x_next, y_pred)
+
+        # PASO 3: Corrector (promedio de pendientes)
+        # y_{i+1} = y_i + (h/2) * (k1 + k2)
+        return y + (self.h / 2) * (k1 + k2), (k1, k2, y_pred)
 
     def _format_results(self):
         """
@@ -118,34 +96,22 @@ class HeunMethod:
 
         # Datos para la gráfica
         plot_data = {
-            'x_values': self.x_values.tolist(),
-            'y_values': self.y_values.tolist(),
-            'y_predictor': self.y_predictor[:-1].tolist(),  # Excluir último elemento
+            'x_values': self._plot_values(self.x_values),
+            'y_values': self._plot_values(self.y_values),
+            'y_predictor': self._plot_values(self.y_predictor[:-1]),  # Excluir último elemento
             'method': 'Heun'
         }
 
-        # Información del método
-        method_info = {
-            'name': 'Método de Heun (Euler Mejorado)',
-            'formula': 'y_{n+1} = y_n + (h/2) × [f(x_n, y_n) + f(x_{n+1}, y_pred)]',
-            'description': 'Método predictor-corrector de segundo orden para resolver EDOs',
-            'order': 2,
-            'error_type': 'O(h³) por paso, O(h²) global',
-            'steps': [
-                '1. Predictor: y_pred = y_n + h × f(x_n, y_n)',
-                '2. Corrector: y_{n+1} = y_n + (h/2) × [f(x_n, y_n) + f(x_{n+1}, y_pred)]'
-            ]
-        }
-
         return {
             'steps_table': steps_table,
             'plot_data': plot_data,
-            'method_info': method_info,
+            'method_info': dict(self.METHOD_INFO),
             'summary': {
                 'initial_value': f"y({self.x0}) = {self.y0}",
                 'final_value': f"y({self.x_values[-1]:.6f}) ≈ {self.y_values[-1]:.6f}",
                 'total_steps': self.num_steps,
                 'step_size': self.h,
-                'interval': f"[{self.x0}, {self.x_values[-1]:.6f}]"
+                'interval': f"[{self.x0}, {self.x_values[-1]:.6f}]",
+                'function_evaluations': self.function_evaluations
             }
         }
\ No newline at end of file
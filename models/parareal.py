@@ -0,0 +1,247 @@
+import math
+import time
+
+import numpy as np
+from utils.parser import validate_function
+
+from .euler import EulerMethod
+from .runge_kutta import RungeKuttaMethod
+
+
+def _propagate(method_class, function_str, x0, y0, h, num_steps, method_options, parameters):
+    """
+    Integrar un subintervalo sin guardar los pasos (se ejecuta en los procesos del pool).
+
+    Returns:
+        tuple: (y final, evaluaciones de f, segundos empleados)
+
+    Raises:
+        ValueError: Si la solución diverge dentro del subintervalo
+    """
+    start = time.perf_counter()
+    solver = method_class(function_str, x0, y0, h, num_steps, **method_options)
+    solver.parameters = parameters
+    results = solver.solve_lean()
+    if 'divergence' in results:
+        raise ValueError(f"La solución diverge en x = {results['divergence']['x']:.6g}: "
+                         f"{results['divergence']['message']}")
+    return results['final']['y'], solver.function_evaluations, time.perf_counter() - start
+
+
+class Parareal:
+    """
+    Integración paralela en el tiempo (Parareal) de dy/dx = f(x, y).
+
+    El intervalo se divide en subintervalos. Un propagador grueso y barato
+    (por defecto Euler con pasos ``coarse_ratio`` veces mayores) estima los
+    valores en sus fronteras de forma secuencial, y el propagador fino (el
+    método pedido, con el paso h) integra todos los subintervalos a la vez en
+    procesos distintos. Cada iteración corrige las fronteras con
+
+        U_{n+1} = G(U_n nuevo) + F(U_n anterior) - G(U_n anterior)
+
+    hasta que dejan de cambiar. Tras k iteraciones los k primeros
+    subintervalos coinciden con la integración fina secuencial, así que el
+    método converge como mucho en tantas iteraciones como subintervalos.
+    """
+
+    def __init__(self, fine_class, function_str, x0, y0, h, num_steps, slices,
+                 coarse_class=EulerMethod, coarse_ratio=10, tolerance=1e-10,
+                 max_iterations=20, method_options=None, parameters=None):
+        """
+        Inicializar el problema.
+
+        Args:
+            fine_class (type): Método fino (subclase de ODEMethod, ej: RungeKuttaMethod)
+            function_str (str): Función f(x, y)
+            x0 (float): Valor inicial de x
+            y0 (float): Valor inicial de y
+            h (float): Paso del método fino
+            num_steps (int): Número total de pasos finos
+            slices (int): Número de subintervalos (uno por proceso es lo habitual)
+            coarse_class (type): Método grueso
+            coarse_ratio (int): Pasos finos por cada paso grueso
+            tolerance (float): Cambio máximo relativo de las fronteras para converger
+            max_iterations (int): Máximo de iteraciones de corrección
+            method_options (dict, optional): Argumentos adicionales del método fino
+            parameters (dict, optional): Valores de los parámetros con nombre
+        """
+        self.parameters = dict(parameters or {})
+        if not validate_function(function_str, self.parameters):
+            raise ValueError(f"Función inválida: {function_str}")
+        if num_steps < 1:
+            raise ValueError("El número de pasos debe ser positivo")
+        if not 1 <= slices <= num_steps:
+            raise ValueError(f"El número de subintervalos debe estar entre 1 y {num_steps}")
+        if coarse_ratio < 1:
+            raise ValueError("La relación de pasos fino/grueso debe ser al menos 1")
+        if getattr(fine_class, 'SECOND_ORDER', False):
+            raise ValueError("Parareal solo corrige y en las fronteras: use un método de primer orden")
+
+        self.fine_class = fine_class
+        self.coarse_class = coarse_class
+        self.function_str = function_str
+        self.x0 = x0
+        self.y0 = y0
+        self.h = h
+        self.num_steps = num_steps
+        self.coarse_ratio = coarse_ratio
+        self.tolerance = tolerance
+        self.max_iterations = max_iterations
+        self.method_options = method_options or {}
+
+        # Pasos finos de cada subintervalo (repartidos lo más igual posible)
+        base, extra = divmod(num_steps, slices)
+        self.slice_steps = [base + (1 if n < extra else 0) for n in range(slices)]
+        self.slice_start = np.concatenate([[0], np.cumsum(self.slice_steps)])
+        self.boundaries = x0 + self.slice_start * h
+
+        self.function_evaluations = 0
+
+    @property
+    def slices(self):
+        return len(self.slice_steps)
+
+    def _coarse(self, n, y):
+        """Propagador grueso G sobre el subintervalo n desde y."""
+        steps = max(1, math.ceil(self.slice_steps[n] / self.coarse_ratio))
+        coarse_h = (self.boundaries[n + 1] - self.boundaries[n]) / steps
+        y_end, evaluations, _ = _propagate(self.coarse_class, self.function_str, self.boundaries[n], y,
+                                           coarse_h, steps, {}, self.parameters)
+        self.function_evaluations += evaluations
+        return y_end
+
+    def _fine_arguments(self, n, y):
+        return (self.fine_class, self.function_str, float(self.boundaries[n]), float(y), self.h,
+                self.slice_steps[n], self.method_options, self.parameters)
+
+    def solve(self, executor=None, processes=None):
+        """
+        Resolver el problema con iteraciones Parareal.
+
+        Args:
+            executor (concurrent.futures.Executor, optional): Pool donde se
+                ejecutan los propagadores finos; sin él se ejecutan en este
+                proceso, uno tras otro
+            processes (int, optional): Procesos del pool, para el resumen
+                (por defecto, uno por subintervalo)
+
+        Returns:
+            dict: Valor final, valores en las fronteras, iteraciones y
+                aceleración medida frente a la integración fina secuencial
+        """
+        try:
+            wall_start = time.perf_counter()
+            slices = self.slices
+
+            # Predicción inicial: barrido grueso secuencial
+            U = np.empty(slices + 1)
+            U[0] = self.y0
+            G_old = np.empty(slices)
+            for n in range(slices):
+                G_old[n] = self._coarse(n, U[n])
+                U[n + 1] = G_old[n]
+
+            # Caché de F por subintervalo: solo se recalcula si cambió su valor inicial
+            fine_cache = {}
+            fine_seconds = np.zeros(slices)
+            iterations = []
+            converged = False
+
+            for k in range(min(self.max_iterations, slices)):
+                # Propagadores finos de todos los subintervalos, a la vez
+                pending = [n for n in range(slices) if fine_cache.get(n, (None,))[0] != U[n]]
+                arguments = [self._fine_arguments(n, U[n]) for n in pending]
+                if executor is not None and len(pending) > 1:
+                    outputs = list(executor.map(_propagate, *zip(*arguments)))
+                else:
+                    outputs = [_propagate(*args) for args in arguments]
+                for n, (y_end, evaluations, seconds) in zip(pending, outputs):
+                    fine_cache[n] = (U[n], y_end)
+                    fine_seconds[n] = seconds
+                    self.function_evaluations += evaluations
+                F = np.array([fine_cache[n][1] for n in range(slices)])
+
+                # Corrección secuencial: G(nuevo) + F(anterior) - G(anterior)
+                U_new = np.empty_like(U)
+                U_new[0] = self.y0
+                G_new = np.empty(slices)
+                for n in range(slices):
+                    # Los primeros k + 1 subintervalos ya son exactos: G no interviene
+                    if n <= k:
+                        G_new[n] = G_old[n]
+                        U_new[n + 1] = F[n]
+                        continue
+                    G_new[n] = self._coarse(n, U_new[n])
+                    U_new[n + 1] = G_new[n] + F[n] - G_old[n]
+
+                change = float(np.max(np.abs(U_new - U)))
+                iterations.append({'iteration': k + 1, 'fine_solves': len(pending), 'max_change': change})
+                U, G_old = U_new, G_new
+
+                if not np.isfinite(U).all():
+                    raise ValueError("Las correcciones de Parareal no son finitas")
+                if change <= self.tolerance * (1 + float(np.max(np.abs(U)))):
+                    converged = True
+                    break
+            else:
+                # Tantas iteraciones como subintervalos: solución fina exacta
+                converged = len(iterations) == slices
+
+            wall_seconds = time.perf_counter() - wall_start
+            if executor is None:
+                processes = 1
+            return self._format_results(U, iterations, converged, wall_seconds, float(fine_seconds.sum()),
+                                        min(processes or slices, slices))
+
+        except Exception as e:
+            raise Exception(f"Error en Parareal: {str(e)}")
+
+    def _format_results(self, U, iterations, converged, wall_seconds, serial_seconds, processes):
+        """
+        Formatear los resultados.
+
+        Args:
+            U (np.ndarray): Valores en las fronteras de los subintervalos
+            iterations (list): Historial de iteraciones
+            converged (bool): Si se alcanzó la tolerancia
+            wall_seconds (float): Tiempo real empleado
+            serial_seconds (float): Tiempo de la integración fina secuencial
+                (suma de los tiempos finos de la última pasada por subintervalo)
+            processes (int): Procesos que ejecutaron los propagadores finos
+
+        Returns:
+            dict: Resultados formateados
+        """
+        x_values = self.boundaries.tolist()
+        speedup = serial_seconds / wall_seconds if wall_seconds else None
+
+        return {
+            'output_mode': 'parareal',
+            'final': {'x': x_values[-1], 'y': float(U[-1])},
+            'boundaries': {'x_values': x_values, 'y_values': U.tolist()},
+            'iterations': iterations,
+            'plot_data': {
+                'x_values': x_values,
+                'y_values': U.tolist(),
+                'method': f'Parareal ({self.fine_class.METHOD_NAME})'
+            },
+            'summary': {
+                'initial_value': f"y({self.x0}) = {self.y0}",
+                'final_value': f"y({x_values[-1]:.6f}) ≈ {U[-1]:.6f}",
+                'fine_method': self.fine_class.METHOD_NAME,
+                'coarse_method': self.coarse_class.METHOD_NAME,
+                'total_steps': self.num_steps,
+                'step_size': self.h,
+                'coarse_ratio': self.coarse_ratio,
+                'slices': self.slices,
+                'processes': processes,
+                'iterations': len(iterations),
+                'converged': converged,
+                'function_evaluations': self.function_evaluations,
+                'wall_seconds': wall_seconds,
+                'serial_fine_seconds': serial_seconds,
+                'speedup': speedup,
+                'efficiency': speedup / processes if speedup is not None else None,
+            }
+        }
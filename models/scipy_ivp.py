@@ -0,0 +1,305 @@
+import math
+
+import numpy as np
+from scipy.integrate import BDF, DOP853, LSODA, RK23, RK45, Radau
+
+from utils.jit import compiled_function
+from .base import ODEMethod
+from .events import EventMonitor
+
+
+class SciPyMethod(ODEMethod):
+    """
+    Resolución de dy/dx = f(x, y) con los integradores adaptativos de
+    SciPy (los mismos que usa ``scipy.integrate.solve_ivp``).
+
+    El integrador elige sus propios pasos internos según las tolerancias;
+    la malla x_i = x0 + i·h de la petición solo fija dónde se entregan los
+    valores, que se obtienen de la salida densa del integrador. Así la tabla,
+    la gráfica, la exportación, los eventos y la guarda de divergencia
+    funcionan igual que con los métodos de paso fijo, y una malla gruesa no
+    empeora la precisión.
+
+    La función se entrega ya compilada: con el backend 'jit' se usa la
+    versión de Numba de la expresión y, si no, las clausuras optimizadas del
+    evaluador.
+    """
+
+    METHOD_NAME = 'SciPy'
+    STAGE_ATTRS = ('slope_values',)
+
+    # En la malla solo se evalúa la pendiente de cada punto; las evaluaciones
+    # del integrador dependen de las tolerancias, no del número de pasos
+    EVALS_PER_STEP = 1
+
+    # Integradores disponibles: clase de SciPy, orden y descripción
+    SOLVERS = {
+        'RK45': (RK45, '5(4)', 'Runge-Kutta explícito de Dormand-Prince'),
+        'RK23': (RK23, '3(2)', 'Runge-Kutta explícito de Bogacki-Shampine'),
+        'DOP853': (DOP853, '8(5,3)', 'Runge-Kutta explícito de orden 8 (Dormand-Prince)'),
+        'Radau': (Radau, '5', 'Runge-Kutta implícito Radau IIA (problemas rígidos)'),
+        'BDF': (BDF, '1-5', 'Fórmulas de diferenciación hacia atrás (problemas rígidos)'),
+        'LSODA': (LSODA, '1-12', 'Adams/BDF con detección automática de rigidez (ODEPACK)'),
+    }
+
+    def __init__(self, function_str, x0, y0, h, num_steps, solver='RK45', rtol=1e-6, atol=1e-9):
+        """
+        Inicializar el método.
+
+        Args:
+            function_str (str): Función f(x,y) como string
+            x0 (float): Valor inicial de x
+            y0 (float): Valor inicial de y
+            h (float): Separación de la malla de salida
+            num_steps (int): Número de puntos de salida tras x0
+            solver (str): Integrador de SciPy (ver SOLVERS)
+            rtol (float): Tolerancia relativa
+            atol (float): Tolerancia absoluta
+        """
+        if solver not in self.SOLVERS:
+            raise ValueError(f"Integrador desconocido: {solver}. Disponibles: {', '.join(self.SOLVERS)}")
+        if not rtol > 0 or not atol > 0:
+            raise ValueError("Las tolerancias deben ser positivas")
+        super().__init__(function_str, x0, y0, h, num_steps)
+        self.solver = solver
+        self.rtol = float(rtol)
+        self.atol = float(atol)
+        self.METHOD_NAME = f'SciPy {solver}'
+
+        # Estadísticas del integrador en la última resolución
+        self.internal_steps = 0
+        self.solver_evaluations = 0
+
+    @classmethod
+    def options_from_request(cls, data):
+        """Leer el integrador y las tolerancias de la petición."""
+        options = {}
+        if data.get('solver'):
+            options['solver'] = data['solver']
+        for name in ('rtol', 'atol'):
+            if data.get(name):
+                options[name] = float(data[name])
+        return options
+
+    @property
+    def METHOD_INFO(self):
+        """Información del método para la interfaz."""
+        _, order, description = self.SOLVERS[self.solver]
+        return {
+            'name': f'SciPy solve_ivp ({self.solver})',
+            'formula': f'Paso adaptativo: error local ≤ {self.atol:g} + {self.rtol:g} × |y|',
+            'description': description,
+            'order': order,
+            'error_type': f'Controlado por las tolerancias (rtol={self.rtol:g}, atol={self.atol:g})',
+            'steps': [
+                '1. El integrador elige cada paso interno según el error estimado',
+                '2. Los valores en la malla x₀ + i·h se toman de su salida densa',
+                '3. f(xᵢ, yᵢ) se evalúa en cada punto de la malla para la tabla'
+            ]
+        }
+
+    def checkpoint_signature(self):
+        """Firma del problema, con el integrador y las tolerancias."""
+        return dict(super().checkpoint_signature(), solver=self.solver, rtol=self.rtol, atol=self.atol)
+
+    def _load_checkpoint(self, arrays=False):
+        """
+        Sin puntos de control: el estado del integrador (paso interno,
+        historial de BDF/LSODA) no cabe en (x, y, f), y continuar desde un
+        punto de la malla no reproduciría los mismos valores.
+        """
+        self.resume_from = None
+        return None
+
+    def _save_checkpoint(self, step, x, y, k1, arrays=None):
+        """Sin puntos de control (ver _load_checkpoint)."""
+
+    def uses_jit(self):
+        """No hay kernel fusionado: el backend 'jit' solo compila f (ver _rhs)."""
+        return False
+
+    def _rhs(self, shape):
+        """
+        Construir f en la forma que espera SciPy: fun(x, y) con y un vector plano.
+
+        Args:
+            shape (tuple): Forma del estado (() para un problema escalar)
+
+        Returns:
+            callable: Función del sistema
+        """
+        compiled = None
+        if self.backend == 'jit' and not self.parameters and shape == ():
+            compiled = compiled_function(self.function_str)
+        self.backend_used = 'jit' if compiled is not None else 'python'
+
+        if compiled is not None:
+            def fun(x, y):
+                self.function_evaluations += 1
+                value = compiled(x, y[0])
+                if not math.isfinite(value):
+                    raise ValueError(f"Resultado no finito: {value}")
+                return np.array([value])
+        elif shape == ():
+            def fun(x, y):
+                return np.array([self._evaluate(x, float(y[0]))])
+        else:
+            # Estados vectoriales (barridos, disparos): un solo sistema de SciPy
+            def fun(x, y):
+                return np.ravel(self._evaluate(x, y.reshape(shape)))
+        return fun
+
+    def _iterate_steps(self):
+        """
+        Recorrer los puntos de la malla avanzando el integrador de SciPy.
+
+        Tras cada paso interno se interpolan de una vez, con su salida densa,
+        todos los puntos de la malla que cubre. Un fallo del integrador se
+        trata como un error de evaluación de f (guarda de divergencia).
+
+        Yields:
+            tuple: (i, x_i, y_i, x_{i+1}, y_{i+1}, f(x_{i+1}, y_{i+1}), etapas)
+        """
+        self._reset()
+        self.resume_from = None
+        self.internal_steps = 0
+        self.solver_evaluations = 0
+
+        x = float(self.x0)
+        y = self.y0 if isinstance(self.y0, np.ndarray) else float(self.y0)
+        shape = np.shape(y)
+        k1 = self._evaluate(x, y)
+
+        monitor = EventMonitor(self.events, self.parameters) if self.events else None
+        self.event_monitor = monitor
+        if monitor:
+            monitor.start(x, y)
+
+        guard = self.guard
+        x_end = self.x0 + self.num_steps * self.h
+        solver_class = self.SOLVERS[self.solver][0]
+        integrator = None
+
+        # Puntos de la malla ya interpolados y pendientes de entregar
+        pending_x, pending_y, position = np.empty(0), np.empty((0, 0)), 0
+
+        for i in range(self.num_steps):
+            try:
+                if integrator is None:
+                    integrator = solver_class(self._rhs(shape), x, np.ravel(y).astype(float), x_end,
+                                              rtol=self.rtol, atol=self.atol)
+                while position >= len(pending_x):
+                    pending_x, pending_y = self._advance(integrator, i + 1)
+                    position = 0
+                x_next = float(pending_x[position])
+                y_next = pending_y[:, position]
+                y_next = float(y_next[0]) if shape == () else y_next.reshape(shape)
+                position += 1
+                k1_next = self._evaluate(x_next, y_next)
+            except ValueError as e:
+                if guard is None:
+                    raise
+                self.divergence = guard.diagnostic(guard.EVALUATION, i + 1, x, y, str(e))
+                return
+
+            if guard:
+                status = guard.check(y, y_next, k1_next)
+                if status:
+                    self.divergence = guard.diagnostic(status, i + 1, x, y)
+                    return
+
+            yield i, x, y, x_next, y_next, k1_next, (k1,)
+
+            if monitor:
+                interpolant = (lambda theta, x=x, y=y, y_next=y_next, k1=k1, k1_next=k1_next:
+                               self._interpolate(x, y, y_next, k1, k1_next, (k1,), theta))
+                if monitor.check(x, self.h, y_next, interpolant):
+                    return
+
+            x, y, k1 = x_next, y_next, k1_next
+
+    def _advance(self, integrator, first_index):
+        """
+        Dar un paso interno del integrador e interpolar los puntos de la
+        malla que cubre.
+
+        Args:
+            integrator (scipy.integrate.OdeSolver): Integrador en curso
+            first_index (int): Índice del primer punto de la malla aún no entregado
+
+        Returns:
+            tuple: (x de los puntos, y con forma (componentes, puntos)), vacíos
+                si el paso no alcanzó ningún punto
+
+        Raises:
+            ValueError: Si el integrador falla o ya terminó
+        """
+        if integrator.status != 'running':
+            raise ValueError("el integrador terminó antes del final de la malla")
+        message = integrator.step()
+        self.internal_steps += 1
+        self.solver_evaluations = integrator.nfev
+        if integrator.status == 'failed':
+            raise ValueError(f"el integrador {self.solver} falló: {message}")
+
+        if integrator.status == 'finished':
+            last_index = self.num_steps
+        else:
+            last_index = min(self.num_steps, math.floor((integrator.t - self.x0) / self.h + 1e-9))
+        if last_index < first_index:
+            return np.empty(0), np.empty((0, 0))
+
+        indices = np.arange(first_index, last_index + 1)
+        x_points = self.x0 + indices * self.h
+        y_points = integrator.dense_output()(x_points).reshape(-1, len(indices))
+        # La salida densa de DOP853 evalúa f
+        self.solver_evaluations = integrator.nfev
+        return x_points, y_points
+
+    def _decorate_results(self, results):
+        """Añadir al resumen el integrador y sus estadísticas."""
+        results = super()._decorate_results(results)
+        results['summary'].update({
+            'solver': self.solver,
+            'rtol': self.rtol,
+            'atol': self.atol,
+            'internal_steps': self.internal_steps,
+            'solver_evaluations': self.solver_evaluations,
+        })
+        return results
+
+    def _format_results(self):
+        """
+        Formatear resultados para mostrar en la interfaz.
+
+        Returns:
+            dict: Resultados formateados
+        """
+        steps_table = []
+        for i in range(len(self.x_values)):
+            steps_table.append({
+                'step': i,
+                'x': round(self.x_values[i], 6),
+                'y': round(self.y_values[i], 6),
+                'slope': round(self.slope_values[i], 6) if not np.isnan(self.slope_values[i]) else 'N/A'
+            })
+
+        plot_data = {
+            'x_values': self._plot_values(self.x_values),
+            'y_values': self._plot_values(self.y_values),
+            'method': self.METHOD_NAME
+        }
+
+        return {
+            'steps_table': steps_table,
+            'plot_data': plot_data,
+            'method_info': dict(self.METHOD_INFO),
+            'summary': {
+                'initial_value': f"y({self.x0}) = {self.y0}",
+                'final_value': f"y({self.x_values[-1]:.6f}) ≈ {self.y_values[-1]:.6f}",
+                'total_steps': self.num_steps,
+                'step_size': self.h,
+                'interval': f"[{self.x0}, {self.x_values[-1]:.6f}]",
+                'function_evaluations': self.function_evaluations
+            }
+        }
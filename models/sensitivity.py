@@ -0,0 +1,159 @@
+import numpy as np
+from utils.differentiation import differentiate_expression
+from utils.parser import evaluate_function
+from .base import ODEMethod
+
+
+class ForwardSensitivity:
+    """
+    Sensibilidades hacia delante de y(x) respecto a y0 y a los parámetros.
+
+    Junto a y se integran, en el mismo bucle y con la misma fórmula del
+    método, las ecuaciones variacionales
+
+        s' = (∂f/∂y) s,               s(x0) = 1     (s = ∂y/∂y0)
+        r_p' = (∂f/∂y) r_p + ∂f/∂p,   r_p(x0) = 0   (r_p = ∂y/∂p)
+
+    con ∂f/∂y y ∂f/∂p derivadas simbólicamente del AST de f
+    (utils/differentiation.py). El método avanza el vector [y, s, r_p...]
+    como avanzan los barridos sus vectores de estados; hacia fuera solo se
+    entrega la componente y, así que la tabla, la gráfica y los eventos no
+    cambian. En los métodos de paso fijo la sensibilidad obtenida es la
+    derivada exacta de la solución discreta.
+
+    Cada evaluación de f añade la de ∂f/∂y y la de cada ∂f/∂p: una sola
+    integración sustituye a las dos por cada variable que necesitarían las
+    diferencias finitas.
+    """
+
+    def __init__(self, method, parameters=None):
+        """
+        Activar las sensibilidades en un método ya configurado.
+
+        Args:
+            method (ODEMethod): Método con su función y sus parámetros
+            parameters (iterable, optional): Parámetros respecto a los que
+                derivar (por defecto, todos los de ``method.parameters``)
+
+        Raises:
+            ValueError: Si el método no integra con su propio bucle de pasos o
+                si f no es derivable
+        """
+        if getattr(method, 'SECOND_ORDER', False):
+            raise ValueError("Las sensibilidades solo están disponibles para y' = f(x, y)")
+        if type(method)._iterate_steps is not ODEMethod._iterate_steps:
+            raise ValueError(f"El método {method.METHOD_NAME} no admite sensibilidades")
+
+        names = list(method.parameters) if parameters is None else list(parameters)
+        for name in names:
+            if name not in method.parameters:
+                raise ValueError(f"Parámetro desconocido: {name}")
+
+        self.method = method
+        self.names = names
+        self.df_dy = differentiate_expression(method.function_str, 'y')
+        self.df_dp = [differentiate_expression(method.function_str, name) for name in names]
+
+        self.evaluations = 0
+        self.x = None
+        self.state = None
+
+        method.sensitivity = self
+        method._evaluate = self._evaluate
+
+    def expressions(self):
+        """Derivadas de f que se evalúan junto a ella."""
+        return [self.df_dy] + self.df_dp
+
+    def start(self, x, y):
+        """
+        Estado aumentado inicial [y0, 1, 0, ...].
+
+        Args:
+            x (float): x0
+            y (float): y0
+
+        Returns:
+            np.ndarray: Estado que avanza el método
+        """
+        self.evaluations = 0
+        state = np.zeros(2 + len(self.names))
+        state[0] = y
+        state[1] = 1.0
+        self.x, self.state = x, state
+        return state
+
+    def _evaluate(self, x, state):
+        """
+        Evaluar f y las ecuaciones variacionales sobre el estado aumentado.
+
+        Fuera del bucle (estado escalar) se comporta como la f del método.
+        """
+        method = self.method
+        method.function_evaluations += 1
+        if not isinstance(state, np.ndarray):
+            return evaluate_function(method.function_str, x, state, method.parameters)
+
+        y = float(state[0])
+        slope = np.empty_like(state)
+        slope[0] = evaluate_function(method.function_str, x, y, method.parameters)
+        jacobian = evaluate_function(self.df_dy, x, y, method.parameters)
+        slope[1:] = jacobian * state[1:]
+        for j, expression in enumerate(self.df_dp, start=2):
+            slope[j] += evaluate_function(expression, x, y, method.parameters)
+        self.evaluations += 1 + len(self.df_dp)
+        return slope
+
+    @staticmethod
+    def project(state, slope, stages):
+        """
+        Componente y de un paso del estado aumentado.
+
+        Returns:
+            tuple: (y, f, etapas) como los entregaría el método sin sensibilidades
+        """
+        return (float(state[0]), float(slope[0]),
+                tuple(float(stage[0]) if isinstance(stage, np.ndarray) else stage for stage in stages))
+
+    def advance(self, x, state):
+        """Registrar el último punto entregado por la iteración."""
+        self.x, self.state = x, state
+
+    def report(self):
+        """
+        Sensibilidades en el último punto integrado.
+
+        ∂y/∂x0 se obtiene sin integrar nada más: desplazar x0 con xn fijo
+        equivale a partir de y0 con pendiente f(x0, y0), así que vale
+        -s · f(x0, y0).
+
+        Returns:
+            dict: Derivadas absolutas, relativas (∂ln y / ∂ln v) y coste
+        """
+        method = self.method
+        if self.state is None:
+            # Ningún paso integrado (todos los puntos pedidos en x0)
+            self.start(float(method.x0), float(method.y0))
+        x, state = self.x, self.state
+        y, dy_dy0 = float(state[0]), float(state[1])
+        slope0 = evaluate_function(method.function_str, method.x0, method.y0, method.parameters)
+
+        derivatives = {'y0': dy_dy0, 'x0': -dy_dy0 * slope0}
+        values = {'y0': float(method.y0), 'x0': float(method.x0)}
+        for j, name in enumerate(self.names, start=2):
+            derivatives[name] = float(state[j])
+            values[name] = float(method.parameters[name])
+
+        relative = {name: (derivative * values[name] / y if y else None)
+                    for name, derivative in derivatives.items()}
+
+        return {
+            'x': float(x),
+            'y': y,
+            'dy_dy0': dy_dy0,
+            'derivatives': derivatives,
+            'relative': relative,
+            'jacobian': self.df_dy,
+            'parameter_derivatives': dict(zip(self.names, self.df_dp)),
+            'evaluations': self.evaluations
+        }
@@ -0,0 +1,226 @@
+import numpy as np
+from utils.parser import validate_function, validate_parameters, evaluate_function_array
+
+
+class ShootingMethod:
+    """
+    Método de disparo para problemas de contorno de segundo orden:
+    y'' = f(x, y, yp), y(a) = alpha, y(b) = beta, donde ``yp`` es y'.
+
+    La ecuación se reescribe como el sistema (y, y')' = (y', f) y se integra
+    con cualquiera de los métodos existentes, con el estado como matriz
+    2 x N: cada columna es un disparo con una pendiente inicial distinta.
+    Una primera tanda de pendientes candidatas acota las raíces del residuo
+    y(b; s) - beta, y cada ronda de refinamiento (regula falsi de Illinois,
+    una variante de la secante que conserva el intervalo) avanza todas las
+    raíces a la vez con una sola integración vectorizada.
+    """
+
+    def __init__(self, method_class, function_str, a, alpha, b, beta, num_steps,
+                 slope_range=(-10.0, 10.0), candidates=64, tolerance=1e-10,
+                 max_rounds=50, method_options=None, parameters=None):
+        """
+        Inicializar el problema de contorno.
+
+        Args:
+            method_class (type): Clase del método de integración (subclase de ODEMethod)
+            function_str (str): f(x, y, yp) con y'' = f (ej: "-y", "6*x", "yp + 2*y")
+            a (float): Extremo izquierdo
+            alpha (float): y(a)
+            b (float): Extremo derecho
+            beta (float): y(b)
+            num_steps (int): Número de pasos entre a y b
+            slope_range (tuple): Intervalo de pendientes iniciales candidatas
+            candidates (int): Número de pendientes de la primera tanda
+            tolerance (float): Tolerancia en |y(b) - beta| (relativa a 1 + |beta|)
+            max_rounds (int): Máximo de rondas de refinamiento
+            method_options (dict, optional): Argumentos adicionales del método
+            parameters (dict, optional): Valores de los parámetros con nombre
+        """
+        self.parameters = dict(parameters or {})
+        names = validate_parameters(list(self.parameters) + ['yp'])
+        if not validate_function(function_str, names):
+            raise ValueError(f"Función inválida: {function_str}")
+        if b == a or num_steps < 1:
+            raise ValueError("El intervalo [a, b] y el número de pasos deben ser no vacíos")
+        if candidates < 2 or not slope_range[0] < slope_range[1]:
+            raise ValueError("Se necesitan al menos 2 pendientes candidatas en un intervalo no vacío")
+        if getattr(method_class, 'SECOND_ORDER', False):
+            raise ValueError("El disparo integra el sistema de primer orden equivalente: "
+                             "use un método de primer orden")
+
+        self.method_class = method_class
+        self.function_str = function_str
+        self.a, self.alpha = a, alpha
+        self.b, self.beta = b, beta
+        self.num_steps = num_steps
+        self.h = (b - a) / num_steps
+        self.slope_range = slope_range
+        self.candidates = candidates
+        self.tolerance = tolerance
+        self.max_rounds = max_rounds
+        self.method_options = method_options or {}
+
+        self.function_evaluations = 0
+        self.batched_solves = 0
+
+    def _rhs(self, x, state):
+        """Evaluar el sistema (y', f(x, y, y')) para todos los disparos a la vez."""
+        self.function_evaluations += 1
+        params = dict(self.parameters, yp=state[1])
+        return np.array([state[1], evaluate_function_array(self.function_str, x, state[0], params)])
+
+    def _shoot(self, slopes, keep_trajectories=False):
+        """
+        Integrar de a a b una tanda de disparos en una sola pasada.
+
+        Args:
+            slopes (np.ndarray): Pendientes iniciales y'(a)
+            keep_trajectories (bool): Guardar el estado en todos los pasos
+
+        Returns:
+            tuple: (x, estados) con estados de forma (pasos + 1, 2, N) si se
+                guardan las trayectorias, o (b, estado final 2 x N)
+        """
+        state0 = np.vstack([np.full(len(slopes), float(self.alpha)), slopes])
+        solver = self.method_class(self.function_str, self.a, state0, self.h, self.num_steps,
+                                   **self.method_options)
+        solver.guard = None
+        solver._evaluate = self._rhs
+        self.batched_solves += 1
+
+        x_values = np.empty(self.num_steps + 1)
+        x_values[0] = self.a
+        states = np.empty((self.num_steps + 1,) + state0.shape) if keep_trajectories else None
+        if keep_trajectories:
+            states[0] = state0
+
+        final = state0
+        with np.errstate(all='ignore'):
+            for i, x, y, x_next, y_next, k1_next, stages in solver._iterate_steps():
+                x_values[i + 1] = x_next
+                if keep_trajectories:
+                    states[i + 1] = y_next
+                final = y_next
+
+        if keep_trajectories:
+            return x_values, states
+        return x_values[-1], final
+
+    def _residual(self, slopes):
+        """Residuo y(b; s) - beta de cada pendiente (una integración vectorizada)."""
+        _, final = self._shoot(np.asarray(slopes, dtype=float))
+        return final[0] - self.beta
+
+    def solve(self):
+        """
+        Resolver el problema de contorno.
+
+        Returns:
+            dict: Soluciones encontradas (una por raíz del residuo en el
+                intervalo de pendientes), historial de rondas y resumen
+        """
+        try:
+            threshold = self.tolerance * (1 + abs(self.beta))
+
+            # Ronda 0: tanda de pendientes candidatas
+            slopes = np.linspace(self.slope_range[0], self.slope_range[1], self.candidates)
+            residuals = self._residual(slopes)
+            rounds = [{'round': 0, 'shots': len(slopes),
+                       'max_abs_residual': float(np.nanmax(np.abs(residuals)))}]
+
+            # Raíces exactas y cambios de signo entre candidatas consecutivas
+            finite = np.isfinite(residuals)
+            exact = finite & (np.abs(residuals) <= threshold)
+            change = (finite[:-1] & finite[1:]
+                      & (np.sign(residuals[:-1]) * np.sign(residuals[1:]) < 0)
+                      & ~exact[:-1] & ~exact[1:])
+
+            roots = list(slopes[exact])
+            low, high = slopes[:-1][change], slopes[1:][change]
+            r_low, r_high = residuals[:-1][change], residuals[1:][change]
+
+            if not roots and not low.size:
+                raise ValueError(
+                    f"El residuo y(b) - beta no cambia de signo para pendientes en "
+                    f"[{self.slope_range[0]}, {self.slope_range[1]}]; amplíe el intervalo")
+
+            # Rondas de refinamiento: todas las raíces avanzan en la misma integración
+            side = np.zeros(low.size)
+            active = np.ones(low.size, dtype=bool)
+            for round_number in range(1, self.max_rounds + 1):
+                if not active.any():
+                    break
+
+                candidate = (low * r_high - high * r_low) / (r_high - r_low)
+                r_candidate = np.full(low.size, np.nan)
+                r_candidate[active] = self._residual(candidate[active])
+                rounds.append({'round': round_number, 'shots': int(active.sum()),
+                               'max_abs_residual': float(np.nanmax(np.abs(r_candidate[active])))})
+
+                converged = active & ((np.abs(r_candidate) <= threshold)
+                                      | (np.abs(high - low) <= 1e-14 * (1 + np.abs(candidate))))
+                roots.extend(candidate[converged])
+                active &= ~converged
+
+                # Illinois: el extremo que no se mueve dos veces seguidas pierde peso
+                replace_high = active & (np.sign(r_candidate) == np.sign(r_high))
+                replace_low = active & ~replace_high
+                high = np.where(replace_high, candidate, high)
+                r_high = np.where(replace_high, r_candidate, r_high)
+                r_low = np.where(replace_high & (side == 1), r_low / 2, r_low)
+                low = np.where(replace_low, candidate, low)
+                r_low = np.where(replace_low, r_candidate, r_low)
+                r_high = np.where(replace_low & (side == -1), r_high / 2, r_high)
+                side = np.where(replace_high, 1, np.where(replace_low, -1, side))
+
+            # Las raíces que no convergieron se entregan con su mejor aproximación
+            unconverged = int(active.sum())
+            if unconverged:
+                roots.extend(np.where(np.abs(r_low) < np.abs(r_high), low, high)[active])
+
+            return self._format_results(np.sort(np.asarray(roots, dtype=float)), rounds, unconverged)
+
+        except Exception as e:
+            raise Exception(f"Error en el método de disparo: {str(e)}")
+
+    def _format_results(self, roots, rounds, unconverged):
+        """
+        Integrar las pendientes finales guardando las trayectorias y formatear.
+
+        Returns:
+            dict: Resultados formateados
+        """
+        x_values, states = self._shoot(roots, keep_trajectories=True)
+        solutions = []
+        for lane, slope in enumerate(roots):
+            y_values = states[:, 0, lane]
+            solutions.append({
+                'initial_slope': float(slope),
+                'residual': float(y_values[-1] - self.beta),
+                'y_values': y_values.tolist(),
+                'yp_values': states[:, 1, lane].tolist(),
+            })
+
+        return {
+            'output_mode': 'bvp',
+            'x_values': x_values.tolist(),
+            'solutions': solutions,
+            'rounds': rounds,
+            'plot_data': {
+                'x_values': x_values.tolist(),
+                'y_values': solutions[0]['y_values'] if solutions else [],
+                'method': f'Disparo ({self.method_class.METHOD_NAME})'
+            },
+            'summary': {
+                'problem': f"y'' = {self.function_str}, y({self.a}) = {self.alpha}, y({self.b}) = {self.beta}",
+                'method': self.method_class.METHOD_NAME,
+                'total_steps': self.num_steps,
+                'step_size': self.h,
+                'solutions_found': len(solutions),
+                'unconverged': unconverged,
+                'refinement_rounds': len(rounds) - 1,
+                'batched_solves': self.batched_solves,
+                'function_evaluations': self.function_evaluations,
+            }
+        }
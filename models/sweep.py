@@ -0,0 +1,190 @@
+import numpy as np
+from utils.parser import validate_function, validate_parameters
+
+
+class ParameterSweep:
+    """
+    Barrido vectorizado de los parámetros con nombre de f(x, y).
+
+    Todas las combinaciones de parámetros se integran a la vez con un único
+    método cuyo estado y es un vector (una componente por combinación): cada
+    paso evalúa la expresión una sola vez sobre los arrays de parámetros, en
+    lugar de resolver el problema una vez por combinación.
+    """
+
+    COMBINE_MODES = ('grid', 'zip')
+
+    def __init__(self, method_class, function_str, x0, y0, h, num_steps,
+                 parameters, combine='grid', method_options=None):
+        """
+        Inicializar el barrido.
+
+        Args:
+            method_class (type): Clase del método (subclase de ODEMethod)
+            function_str (str): Función f(x, y) con parámetros (ej: "k*y - c")
+            x0 (float): Valor inicial de x
+            y0 (float): Valor inicial de y (común a todas las combinaciones)
+            h (float): Tamaño del paso
+            num_steps (int): Número de pasos a realizar
+            parameters (dict): Nombre -> lista de valores de cada parámetro
+            combine (str): 'grid' (producto cartesiano) o 'zip' (valores emparejados)
+            method_options (dict, optional): Argumentos adicionales del método
+        """
+        if combine not in self.COMBINE_MODES:
+            raise ValueError(f"Modo de combinación desconocido: {combine} (use grid o zip)")
+
+        self.names = validate_parameters(parameters)
+        if not self.names:
+            raise ValueError("El barrido necesita al menos un parámetro")
+        if not validate_function(function_str, self.names):
+            raise ValueError(f"Función inválida: {function_str}")
+
+        self.values = [np.atleast_1d(np.asarray(parameters[name], dtype=float)).ravel()
+                       for name in self.names]
+
+        if combine == 'grid':
+            grids = np.meshgrid(*self.values, indexing='ij')
+        else:
+            try:
+                grids = np.broadcast_arrays(*self.values)
+            except ValueError:
+                raise ValueError("En modo zip todos los parámetros deben tener la misma longitud")
+
+        self.method_class = method_class
+        self.function_str = function_str
+        self.x0 = x0
+        self.y0 = y0
+        self.h = h
+        self.num_steps = num_steps
+        self.combine = combine
+        self.method_options = method_options or {}
+
+        self.shape = grids[0].shape
+        self.lanes = {name: np.ascontiguousarray(grid).ravel() for name, grid in zip(self.names, grids)}
+        self.size = grids[0].size
+
+    def run(self, include_trajectories=True):
+        """
+        Integrar todas las combinaciones en paralelo, paso a paso.
+
+        Las combinaciones que divergen quedan como inf/nan sin detener al
+        resto.
+
+        Args:
+            include_trajectories (bool): Devolver y en todos los pasos, no solo al final
+
+        Returns:
+            dict: Tensor de resultados (forma de los parámetros x pasos) y estadísticas
+        """
+        solver = self.method_class(self.function_str, self.x0, np.full(self.size, float(self.y0)),
+                                   self.h, self.num_steps, **self.method_options)
+        solver.guard = None
+        solver.parameters = self.lanes
+        solver._evaluate = solver._evaluate_array
+
+        x_values = np.empty(self.num_steps + 1)
+        x_values[0] = self.x0
+        trajectories = None
+        if include_trajectories:
+            trajectories = np.empty((self.num_steps + 1, self.size))
+            trajectories[0] = self.y0
+
+        final = solver.y0
+        with np.errstate(all='ignore'):
+            for i, x, y, x_next, y_next, k1_next, stages in solver._iterate_steps():
+                x_values[i + 1] = x_next
+                if include_trajectories:
+                    trajectories[i + 1] = y_next
+                final = y_next
+
+        results = {
+            'parameters': {name: values.tolist() for name, values in zip(self.names, self.values)},
+            'combine': self.combine,
+            'shape': list(self.shape),
+            'final': self._to_list(final.reshape(self.shape)),
+            'statistics': self._statistics(final),
+            'summary': {
+                'method': solver.METHOD_NAME,
+                'function': self.function_str,
+                'initial_value': f"y({self.x0}) = {self.y0}",
+                'total_steps': self.num_steps,
+                'step_size': self.h,
+                'interval': f"[{self.x0}, {x_values[-1]:.6f}]",
+                'combinations': self.size,
+                # Cada evaluación cubre todas las combinaciones a la vez
+                'function_evaluations': solver.function_evaluations,
+            }
+        }
+
+        if include_trajectories:
+            results['x_values'] = x_values.tolist()
+            # Tensor con los ejes de los parámetros primero y el de x al final
+            results['trajectories'] = self._to_list(trajectories.T.reshape(self.shape + (self.num_steps + 1,)))
+            results['bands'] = self._bands(trajectories)
+
+        return results
+
+    def _statistics(self, final):
+        """
+        Estadísticas del valor final sobre las combinaciones que no divergieron.
+
+        Args:
+            final (np.ndarray): y final de cada combinación
+
+        Returns:
+            dict: Conteos, momentos, percentiles y combinaciones extremas
+        """
+        finite = np.isfinite(final)
+        statistics = {'count': int(finite.sum()), 'diverged': int((~finite).sum())}
+        if not finite.any():
+            return statistics
+
+        values = final[finite]
+        indices = np.flatnonzero(finite)
+        percentiles = np.percentile(values, [5, 50, 95])
+
+        statistics.update({
+            'mean': float(values.mean()),
+            'std': float(values.std()),
+            'min': float(values.min()),
+            'max': float(values.max()),
+            'p05': float(percentiles[0]),
+            'median': float(percentiles[1]),
+            'p95': float(percentiles[2]),
+            'argmin': self._combination(indices[values.argmin()]),
+            'argmax': self._combination(indices[values.argmax()]),
+        })
+        return statistics
+
+    def _bands(self, trajectories):
+        """
+        Media, mínimo y máximo de y en cada x sobre las combinaciones finitas.
+
+        Args:
+            trajectories (np.ndarray): y con forma (pasos + 1, combinaciones)
+
+        Returns:
+            dict: Listas 'mean', 'min' y 'max' (None donde todas divergieron)
+        """
+        finite = np.isfinite(trajectories)
+        counts = finite.sum(axis=1)
+        empty = counts == 0
+
+        mean = np.where(finite, trajectories, 0.0).sum(axis=1) / np.maximum(counts, 1)
+        lower = np.where(finite, trajectories, np.inf).min(axis=1)
+        upper = np.where(finite, trajectories, -np.inf).max(axis=1)
+        for band in (mean, lower, upper):
+            band[empty] = np.nan
+
+        return {'mean': self._to_list(mean), 'min': self._to_list(lower), 'max': self._to_list(upper)}
+
+    def _combination(self, lane):
+        """Valores de los parámetros de una combinación."""
+        return {name: float(self.lanes[name][lane]) for name in self.names}
+
+    @staticmethod
+    def _to_list(array):
+        """Convertir a lista para JSON, con None en lugar de inf/nan."""
+        if np.isfinite(array).all():
+            return array.tolist()
+        return np.where(np.isfinite(array), array, None).tolist()
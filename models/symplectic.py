@@ -0,0 +1,243 @@
+from .base import ODEMethod
+
+
+class SymplecticMethod(ODEMethod):
+    """
+    Base de los integradores simplécticos para ecuaciones de segundo orden
+    y'' = f(x, y), y(x0) = y0, y'(x0) = v0.
+
+    La expresión de la petición es la aceleración f(x, y), que no puede
+    depender de y'. Cada paso es una composición de subpasos de Verlet en
+    forma de velocidad (medio impulso, deriva, medio impulso) de tamaños
+    WEIGHTS × h. Al ser simplécticos, la energía de un oscilador no deriva
+    con el tiempo sino que oscila acotada, así que las integraciones largas
+    admiten pasos mucho mayores que un método genérico de primer orden.
+
+    La aceleración en el nuevo punto es la pendiente que el bucle común ya
+    evalúa para el paso siguiente; el último medio impulso de cada paso se
+    completa con ella al empezar el siguiente (``_velocity_half``). Así cada
+    subpaso cuesta una sola evaluación de f.
+    """
+
+    # Método de segundo orden: la interfaz pide y'(x0) y muestra y', y''
+    SECOND_ORDER = True
+
+    # La primera etapa (f(x_i, y_i)) es la aceleración; la segunda, y'(x_i)
+    STAGE_ATTRS = ('acceleration_values', 'velocity_values')
+
+    # Tamaños relativos de los subpasos de Verlet (suman 1)
+    WEIGHTS = (1.0,)
+
+    def __init__(self, function_str, x0, y0, h, num_steps, v0=0.0):
+        """
+        Inicializar el método.
+
+        Args:
+            function_str (str): Aceleración f(x, y) como string (ej: "-y", "-sin(y)")
+            x0 (float): Valor inicial de x
+            y0 (float): Valor inicial de y
+            h (float): Tamaño del paso
+            num_steps (int): Número de pasos a realizar
+            v0 (float): Valor inicial de y'
+        """
+        super().__init__(function_str, x0, y0, h, num_steps)
+        self.v0 = v0
+
+        # Velocidad del último paso a falta de su medio impulso final, y la
+        # del último paso entregado junto con su aceleración (para y' final)
+        self._velocity_half = None
+        self._delivered = None
+
+    @classmethod
+    def options_from_request(cls, data):
+        """Leer y'(x0) de la petición."""
+        if data.get('v0') not in (None, ''):
+            return {'v0': float(data['v0'])}
+        return {}
+
+    def _reset(self):
+        """Olvidar la velocidad pendiente antes de integrar."""
+        super()._reset()
+        self._velocity_half = None
+        self._delivered = None
+
+    def checkpoint_signature(self):
+        """y'(x0) forma parte del problema."""
+        return dict(super().checkpoint_signature(), v0=float(self.v0))
+
+    def _checkpoint_state(self, step, x, y, k1):
+        """Añadir la velocidad pendiente del último medio impulso."""
+        return dict(super()._checkpoint_state(step, x, y, k1), velocity_half=float(self._velocity_half))
+
+    def _restore_state(self, state):
+        """Recuperar la velocidad pendiente de un punto de control."""
+        self._velocity_half = state['velocity_half']
+        self._delivered = (state['velocity_half'], state['k1'])
+
+    def _complete_velocity(self, velocity_half, acceleration):
+        """Aplicar el medio impulso final pendiente con la aceleración del nuevo punto."""
+        if velocity_half is None:
+            return self.v0
+        return velocity_half + (self.WEIGHTS[-1] * self.h / 2) * acceleration
+
+    def final_velocity(self):
+        """y' en el último punto entregado por la integración."""
+        if self._delivered is None:
+            return self.v0
+        return self._complete_velocity(*self._delivered)
+
+    def _iterate_steps(self):
+        """Recorrer los pasos recordando la velocidad del último entregado."""
+        for step in super()._iterate_steps():
+            self._delivered = (self._velocity_half, step[5])
+            yield step
+
+    def _step(self, x, y, k1):
+        """
+        Avanzar un paso como composición de subpasos de Verlet.
+
+        Args:
+            x (float): Valor actual de x
+            y (float): Valor actual de y
+            k1 (float): Aceleración f(x_i, y_i)
+
+        Returns:
+            tuple: (y_{i+1}, (aceleración, velocidad) en x_i)
+        """
+        velocity = self._complete_velocity(self._velocity_half, k1)
+
+        y_next, v, a, x_sub = y, velocity, k1, x
+        last = len(self.WEIGHTS) - 1
+        for j, weight in enumerate(self.WEIGHTS):
+            s = weight * self.h
+            v = v + (s / 2) * a
+            y_next = y_next + s * v
+            x_sub = x_sub + s
+            # El medio impulso final del último subpaso espera a f(x_{i+1}, y_{i+1})
+            if j < last:
+                a = self._evaluate(x_sub, y_next)
+                v = v + (s / 2) * a
+
+        self._velocity_half = v
+        return y_next, (k1, velocity)
+
+    def _interpolate(self, x, y, y_next, k1, k1_next, stages, theta):
+        """
+        Interpolante cúbico de Hermite con las velocidades (y') de los extremos.
+
+        La velocidad al final del paso se completa con la aceleración del
+        nuevo punto, sin evaluaciones extra.
+        """
+        v = stages[1]
+        v_next = self._complete_velocity(self._velocity_half, k1_next)
+        theta2 = theta * theta
+        theta3 = theta2 * theta
+        h00 = 2 * theta3 - 3 * theta2 + 1
+        h10 = theta3 - 2 * theta2 + theta
+        h01 = -2 * theta3 + 3 * theta2
+        h11 = theta3 - theta2
+        return h00 * y + h10 * self.h * v + h01 * y_next + h11 * self.h * v_next
+
+    def integrate(self, events=None):
+        """Integrar y completar y' en el último punto de la tabla."""
+        super().integrate(events)
+        self.velocity_values[-1] = self.final_velocity()
+        return self
+
+    def _decorate_results(self, results):
+        """Añadir y' en el punto final al resumen."""
+        results = super()._decorate_results(results)
+        results['summary']['initial_value'] = f"y({self.x0}) = {self.y0}, y'({self.x0}) = {self.v0}"
+        results['summary']['final_velocity'] = float(self.final_velocity())
+        return results
+
+    def _format_results(self):
+        """
+        Formatear resultados para mostrar en la interfaz.
+
+        Returns:
+            dict: Resultados formateados
+        """
+        steps_table = []
+        for i in range(len(self.x_values)):
+            steps_table.append({
+                'step': i,
+                'x': round(self.x_values[i], 6),
+                'y': round(self.y_values[i], 6),
+                'velocity': round(self.velocity_values[i], 6),
+                'acceleration': round(self.acceleration_values[i], 6)
+            })
+
+        plot_data = {
+            'x_values': self._plot_values(self.x_values),
+            'y_values': self._plot_values(self.y_values),
+            'method': self.METHOD_NAME
+        }
+
+        return {
+            'steps_table': steps_table,
+            'plot_data': plot_data,
+            'method_info': dict(self.METHOD_INFO),
+            'summary': {
+                'initial_value': f"y({self.x0}) = {self.y0}",
+                'final_value': f"y({self.x_values[-1]:.6f}) ≈ {self.y_values[-1]:.6f}",
+                'total_steps': self.num_steps,
+                'step_size': self.h,
+                'interval': f"[{self.x0}, {self.x_values[-1]:.6f}]",
+                'function_evaluations': self.function_evaluations
+            }
+        }
+
+
+class StormerVerletMethod(SymplecticMethod):
+    """
+    Método de Störmer-Verlet (leapfrog en forma de velocidad) para
+    y'' = f(x, y): segundo orden, simpléctico y reversible, con una
+    evaluación de f por paso.
+    """
+
+    METHOD_NAME = 'Störmer-Verlet'
+    EVALS_PER_STEP = 1
+
+    METHOD_INFO = {
+        'name': 'Método de Störmer-Verlet (leapfrog)',
+        'formula': "y_{n+1} = y_n + h y'_n + (h²/2) f_n,  y'_{n+1} = y'_n + (h/2)(f_n + f_{n+1})",
+        'description': "Integrador simpléctico de segundo orden para y'' = f(x, y)",
+        'order': 2,
+        'error_type': 'O(h³) por paso, O(h²) global; energía acotada sin deriva',
+        'second_order': True,
+        'steps': [
+            "1. Medio impulso: y'_{n+1/2} = y'_n + (h/2) f(x_n, y_n)",
+            "2. Deriva: y_{n+1} = y_n + h y'_{n+1/2}",
+            "3. Medio impulso: y'_{n+1} = y'_{n+1/2} + (h/2) f(x_{n+1}, y_{n+1})"
+        ]
+    }
+
+
+class YoshidaMethod(SymplecticMethod):
+    """
+    Integrador simpléctico de cuarto orden de Yoshida: tres subpasos de
+    Verlet de tamaños w1·h, w0·h y w1·h (el central, hacia atrás), con tres
+    evaluaciones de f por paso.
+    """
+
+    METHOD_NAME = 'Yoshida'
+    EVALS_PER_STEP = 3
+
+    _CBRT2 = 2 ** (1 / 3)
+    WEIGHTS = (1 / (2 - _CBRT2), -_CBRT2 / (2 - _CBRT2), 1 / (2 - _CBRT2))
+
+    METHOD_INFO = {
+        'name': 'Método de Yoshida (4to orden, simpléctico)',
+        'formula': 'Composición de Verlet con pasos w₁h, w₀h, w₁h;  w₁ = 1/(2 - ∛2), w₀ = -∛2/(2 - ∛2)',
+        'description': "Integrador simpléctico de cuarto orden para y'' = f(x, y)",
+        'order': 4,
+        'error_type': 'O(h⁵) por paso, O(h⁴) global; energía acotada sin deriva',
+        'second_order': True,
+        'steps': [
+            '1. Subpaso de Verlet de tamaño w₁h',
+            '2. Subpaso de Verlet de tamaño w₀h (hacia atrás)',
+            '3. Subpaso de Verlet de tamaño w₁h',
+            '(3 evaluaciones de f por paso: el medio impulso final usa la del paso siguiente)'
+        ]
+    }
@@ -103,6 +103,154 @@ def run_app(debug=True, host='127.0.0.1', port=5000):
         sys.exit(1)
 
 
+def _worker_memory_mb():
+    """Memoria residente (RSS) actual del proceso en MB, o None si no se puede medir."""
+    try:
+        with open('/proc/self/statm') as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+
+    try:
+        import resource
+        # ru_maxrss es el pico (en KB en Linux), suficiente como aproximación
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    except (ImportError, AttributeError):
+        return None
+
+
+def run_production(host='127.0.0.1', port=5000, workers=None, threads=None,
+                   max_requests=None, max_memory_mb=None):
+    """
+    Ejecutar la aplicación con un servidor pre-fork multi-proceso (gunicorn).
+
+    La aplicación y la caché de expresiones se cargan en el proceso maestro
+    antes de crear los workers (preload), por lo que se comparten por
+    copy-on-write. Cada worker se recicla tras ``max_requests`` peticiones o
+    cuando su memoria residente supera ``max_memory_mb``, lo que contiene las
+    fugas acumuladas por matplotlib. SIGTERM apaga el servidor de forma
+    ordenada, esperando a las peticiones en curso.
+
+    Args:
+        host (str): Host para el servidor
+        port (int): Puerto para el servidor
+        workers (int, optional): Número de procesos worker (default: uno por núcleo)
+        threads (int, optional): Hilos por worker
+        max_requests (int, optional): Peticiones antes de reciclar un worker
+        max_memory_mb (int, optional): Límite de memoria por worker en MB (0 = sin límite)
+    """
+    from config import Config
+
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError:
+        print("⚠️  gunicorn no está instalado (pip install gunicorn); "
+              "usando el servidor de desarrollo de Flask")
+        run_app(debug=False, host=host, port=port)
+        return
+
+    workers = workers or Config.SERVER_WORKERS or os.cpu_count() or 1
+    threads = threads or Config.SERVER_THREADS
+    max_requests = Config.SERVER_MAX_REQUESTS if max_requests is None else max_requests
+    max_memory_mb = Config.SERVER_MAX_WORKER_MEMORY_MB if max_memory_mb is None else max_memory_mb
+
+    def post_request(worker, req, environ, resp):
+        """Reciclar el worker si supera el límite de memoria."""
+        if not max_memory_mb:
+            return
+        memory_mb = _worker_memory_mb()
+        if memory_mb is not None and memory_mb > max_memory_mb:
+            worker.log.info("Worker %s usa %.0f MB (> %d MB); reciclando",
+                            worker.pid, memory_mb, max_memory_mb)
+            worker.alive = False
+
+    class ODESolverServer(BaseApplication):
+        """Servidor gunicorn embebido que sirve la aplicación precargada."""
+
+        def __init__(self, application, options):
+            self.application = application
+            self.options = options
+            super().__init__()
+
+        def load_config(self):
+            for key, value in self.options.items():
+                if key in self.cfg.settings and value is not None:
+                    self.cfg.set(key, value)
+
+        def load(self):
+            return self.application
+
+    # Precargar aplicación y caché de expresiones en el proceso maestro
+    from app import app
+    from utils.parser import preload_expressions
+    preloaded = preload_expressions(Config.PRELOAD_EXPRESSIONS)
+
+    print(f"""
+╔══════════════════════════════════════════════════════════════╗
+║                🚀 ODE SOLVER APP (producción)                ║
+╠══════════════════════════════════════════════════════════════╣
+║  🌐 URL: http://{host}:{port}
+║  ⚙️  Workers: {workers} × {threads} hilos
+║  ♻️  Reciclado: {max_requests} peticiones / {max_memory_mb or '∞'} MB
+║  📦 Expresiones precargadas: {preloaded}
+╚══════════════════════════════════════════════════════════════╝
+    """)
+
+    options = {
+        'bind': f'{host}:{port}',
+        'workers': workers,
+        'threads': threads,
+        'worker_class': 'gthread' if threads > 1 else 'sync',
+        'preload_app': True,
+        'max_requests': max_requests,
+        'max_requests_jitter': Config.SERVER_MAX_REQUESTS_JITTER if max_requests else 0,
+        'timeout': Config.SERVER_TIMEOUT,
+        'graceful_timeout': Config.SERVER_GRACEFUL_TIMEOUT,
+        'post_request': post_request,
+    }
+    ODESolverServer(app, options).run()
+
+
+def run_asgi(host='127.0.0.1', port=5000, workers=None):
+    """
+    Ejecutar la aplicación en modo ASGI (asyncio) con uvicorn.
+
+    Las conexiones las atiende un bucle de eventos por proceso y el trabajo
+    de cada petición se ejecuta en un pool acotado de hilos (ver asgi.py):
+    los clientes lentos, las respuestas por bloques y las esperas de
+    /jobs/<id>?wait=<s> no ocupan un hilo.
+
+    Args:
+        host (str): Host para el servidor
+        port (int): Puerto para el servidor
+        workers (int, optional): Número de procesos (default: 1)
+    """
+    from config import Config
+
+    try:
+        import uvicorn
+    except ImportError:
+        print("⚠️  uvicorn no está instalado (pip install uvicorn); "
+              "usando el servidor de desarrollo de Flask")
+        run_app(debug=False, host=host, port=port)
+        return
+
+    workers = workers or 1
+
+    print(f"""
+╔══════════════════════════════════════════════════════════════╗
+║                  🚀 ODE SOLVER APP (ASGI)                    ║
+╠══════════════════════════════════════════════════════════════╣
+║  🌐 URL: http://{host}:{port}
+║  ⚙️  Procesos: {workers} × {Config.ASGI_EXECUTOR_THREADS} hilos de cálculo
+╚══════════════════════════════════════════════════════════════╝
+    """)
+
+    uvicorn.run('asgi:application', host=host, port=port, workers=workers,
+                timeout_graceful_shutdown=Config.SERVER_GRACEFUL_TIMEOUT)
+
+
 def main():
     """Función principal."""
     parser = argparse.ArgumentParser(
@@ -111,7 +259,9 @@ def main():
         epilog="""
 Ejemplos de uso:
   python run.py                    # Ejecutar en modo desarrollo
-  python run.py --prod             # Ejecutar en modo producción  
+  python run.py --prod             # Ejecutar en modo producción (multi-proceso)
+  python run.py --prod --workers 8 --threads 4
+  python run.py --asgi             # Modo ASGI (asyncio, requiere uvicorn)
   python run.py --port 8080        # Ejecutar en puerto 8080
   python run.py --host 0.0.0.0     # Permitir conexiones externas
         """
@@ -119,12 +269,22 @@ Ejemplos de uso:
 
     parser.add_argument('--prod', action='store_true',
                         help='Ejecutar en modo producción (debug=False)')
+    parser.add_argument('--asgi', action='store_true',
+                        help='Ejecutar en modo ASGI (asyncio) con uvicorn')
     parser.add_argument('--host', default='127.0.0.1',
                         help='Host para el servidor (default: 127.0.0.1)')
     parser.add_argument('--port', type=int, default=5000,
                         help='Puerto para el servidor (default: 5000)')
     parser.add_argument('--skip-checks', action='store_true',
                         help='Saltar verificaciones de dependencias')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Procesos worker en modo producción o ASGI (default: uno por núcleo; 1 en ASGI)')
+    parser.add_argument('--threads', type=int, default=None,
+                        help='Hilos por worker en modo producción')
+    parser.add_argument('--max-requests', type=int, default=None,
+                        help='Peticiones antes de reciclar un worker (0 = nunca)')
+    parser.add_argument('--max-memory', type=int, default=None,
+                        help='Memoria máxima por worker en MB antes de reciclarlo (0 = sin límite)')
 
     args = parser.parse_args()
 
@@ -146,11 +306,23 @@ Ejemplos de uso:
     debug_mode = not args.prod
 
     try:
-        run_app(
-            debug=debug_mode,
-            host=args.host,
-            port=args.port
-        )
+        if args.asgi:
+            run_asgi(host=args.host, port=args.port, workers=args.workers)
+        elif args.prod:
+            run_production(
+                host=args.host,
+                port=args.port,
+                workers=args.workers,
+                threads=args.threads,
+                max_requests=args.max_requests,
+                max_memory_mb=args.max_memory
+            )
+        else:
+            run_app(
+                debug=debug_mode,
+                host=args.host,
+                port=args.port
+            )
     except KeyboardInterrupt:
         print("\n\n👋 Aplicación detenida por el usuario")
     except Exception as e:
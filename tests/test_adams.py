@@ -0,0 +1,47 @@
+import math
+
+import numpy as np
+import pytest
+
+from models import AdamsBashforthMethod, AdamsBashforthMoultonMethod, RungeKuttaMethod
+
+
+def final_error(method_class, num_steps, order):
+    solver = method_class('y', 0.0, 1.0, 1.0 / num_steps, num_steps, order=order)
+    solver.integrate()
+    return abs(solver.y_values[-1] - math.e)
+
+
+@pytest.mark.parametrize('method_class', [AdamsBashforthMethod, AdamsBashforthMoultonMethod])
+@pytest.mark.parametrize('order', [2, 3, 4])
+def test_convergence_order(method_class, order):
+    """Al dividir h entre dos el error global baja en torno a 2**orden."""
+    observed = math.log2(final_error(method_class, 80, order) / final_error(method_class, 160, order))
+    assert abs(observed - order) < 0.3
+
+
+@pytest.mark.parametrize('method_class', [AdamsBashforthMethod, AdamsBashforthMoultonMethod])
+def test_bootstrap_is_rk4(method_class):
+    """Los (orden - 1) primeros pasos son exactamente los de Runge-Kutta de 4to orden."""
+    adams = method_class('x*y - 2*x', 0.0, 1.0, 0.1, 10, order=4)
+    adams.integrate()
+    rk4 = RungeKuttaMethod('x*y - 2*x', 0.0, 1.0, 0.1, 10)
+    rk4.integrate()
+
+    assert np.array_equal(adams.y_values[:4], rk4.y_values[:4])
+    assert not np.array_equal(adams.y_values[4:], rk4.y_values[4:])
+
+
+@pytest.mark.parametrize('method_class, per_step', [(AdamsBashforthMethod, 1),
+                                                     (AdamsBashforthMoultonMethod, 2)])
+def test_evaluations_per_step(method_class, per_step):
+    """Tras el arranque, AB evalúa f una vez por paso y ABM (PECE) dos."""
+    solver = method_class('x + y', 0.0, 1.0, 0.01, 100, order=4)
+    solver.integrate()
+    # Pendiente inicial + 4 evaluaciones por paso de arranque + las del multipaso
+    assert solver.function_evaluations == 1 + 4 * 3 + per_step * 97
+
+
+def test_unsupported_order():
+    with pytest.raises(ValueError, match='Orden no soportado'):
+        AdamsBashforthMethod('y', 0.0, 1.0, 0.1, 10, order=5)
@@ -0,0 +1,31 @@
+import pytest
+
+from app import app
+
+PROBLEM = {'function': 'y', 'x0': 0, 'y0': 1, 'xn': 1, 'num_steps': 10}
+
+
+@pytest.fixture
+def client():
+    return app.test_client()
+
+
+@pytest.mark.parametrize('options', [{'rtol': -1}, {'atol': -1e-9}])
+def test_bulirsch_stoer_tolerances_are_request_errors(client, options):
+    response = client.post('/solve_bulirsch_stoer', json=dict(PROBLEM, **options))
+    assert response.status_code == 400
+    assert 'tolerancias' in response.get_json()['error']
+
+
+@pytest.mark.parametrize('url', ['/solve_runge_kutta', '/export/runge_kutta/csv'])
+def test_unsupported_dtype_is_request_error(client, url):
+    response = client.post(url, json=dict(PROBLEM, dtype='float16'))
+    assert response.status_code == 400
+    assert 'float16' in response.get_json()['error']
+
+
+@pytest.mark.parametrize('url', ['/solve_runge_kutta', '/export/runge_kutta/csv'])
+def test_unknown_backend_is_request_error(client, url):
+    response = client.post(url, json=dict(PROBLEM, backend='gpu'))
+    assert response.status_code == 400
+    assert 'Backend desconocido' in response.get_json()['error']
@@ -0,0 +1,53 @@
+import math
+
+import numpy as np
+import pytest
+
+from models import BulirschStoerMethod, RungeKuttaMethod
+
+
+@pytest.mark.parametrize('rtol', [1e-6, 1e-9, 1e-12])
+def test_error_follows_tolerance(rtol):
+    """El error global en y' = y*cos(x) sigue a la tolerancia pedida."""
+    solver = BulirschStoerMethod('y*cos(x)', 0.0, 1.0, 0.5, 20, rtol=rtol, atol=rtol * 1e-3)
+    solver.integrate()
+
+    exact = np.exp(np.sin(solver.x_values))
+    error = np.max(np.abs(solver.y_values - exact) / exact)
+    assert error < 100 * rtol
+
+
+@pytest.mark.parametrize('num_steps', [20, 30, 200])
+def test_backward_integration(num_steps):
+    """Con xn < x0 (h < 0) los pasos internos van hacia atrás y caen en la malla."""
+    solver = BulirschStoerMethod('y*cos(x)', 0.0, 1.0, -3.0 / num_steps, num_steps, rtol=1e-9, atol=1e-12)
+    results = solver.solve()
+
+    assert 'divergence' not in results
+    assert solver.x_values[-1] == pytest.approx(-3.0)
+    np.testing.assert_allclose(solver.y_values, np.exp(np.sin(solver.x_values)), rtol=1e-7)
+
+
+def test_fewer_evaluations_than_rk4_for_same_accuracy():
+    bs = BulirschStoerMethod('y*cos(x)', 0.0, 1.0, 0.5, 20, rtol=1e-10, atol=1e-13)
+    bs.integrate()
+    rk4 = RungeKuttaMethod('y*cos(x)', 0.0, 1.0, 0.01, 1000)
+    rk4.integrate()
+
+    exact = math.exp(math.sin(10.0))
+    assert abs(bs.y_values[-1] - exact) < abs(rk4.y_values[-1] - exact)
+    assert bs.function_evaluations < rk4.function_evaluations / 4
+
+
+def test_statistics_in_summary():
+    results = BulirschStoerMethod('-2*x*y', 0.0, 1.0, 0.25, 8, rtol=1e-8).solve()
+
+    summary = results['summary']
+    assert summary['internal_steps'] >= 8
+    assert summary['mean_order'] >= 4
+    assert results['plot_data']['y_values'][-1] == pytest.approx(math.exp(-4.0), rel=1e-6)
+
+
+def test_invalid_tolerances():
+    with pytest.raises(ValueError):
+        BulirschStoerMethod('y', 0.0, 1.0, 0.1, 10, rtol=0)
@@ -0,0 +1,69 @@
+import os
+import time
+
+import numpy as np
+import pytest
+
+from models import AdamsBashforthMoultonMethod, RungeKuttaMethod
+from models.events import Event
+from utils.checkpoints import CheckpointStore
+
+
+def make_solver(method_class, num_steps, store, **options):
+    solver = method_class('x*y - 2*x + sin(y)', 0.0, 1.0, 0.001, num_steps, **options)
+    solver.checkpoints = store
+    return solver
+
+
+@pytest.mark.parametrize('method_class, options', [(RungeKuttaMethod, {}),
+                                                   (AdamsBashforthMoultonMethod, {'order': 4})])
+def test_lean_resume_is_bit_identical(tmp_path, method_class, options):
+    """Continuar desde el punto de control da el mismo valor final que integrar desde x0."""
+    store = CheckpointStore(str(tmp_path))
+    make_solver(method_class, 2000, store, **options).solve_lean()
+
+    resumed = make_solver(method_class, 3000, store, **options).solve_lean()
+    direct = make_solver(method_class, 3000, None, **options).solve_lean()
+
+    assert resumed['summary']['resumed_from_step'] == 2000
+    assert resumed['final'] == direct['final']
+    assert resumed['summary']['function_evaluations'] == direct['summary']['function_evaluations']
+
+
+def test_full_table_resume(tmp_path):
+    store = CheckpointStore(str(tmp_path))
+    make_solver(RungeKuttaMethod, 500, store).integrate()
+
+    resumed = make_solver(RungeKuttaMethod, 800, store).integrate()
+    direct = make_solver(RungeKuttaMethod, 800, None).integrate()
+
+    assert resumed.resume_from['step'] == 500
+    assert np.array_equal(resumed.y_values, direct.y_values)
+    assert np.array_equal(resumed.k1_values, direct.k1_values)
+
+
+def test_events_integrate_from_start(tmp_path):
+    store = CheckpointStore(str(tmp_path))
+    make_solver(RungeKuttaMethod, 500, store).solve_lean()
+
+    results = make_solver(RungeKuttaMethod, 800, store).solve_lean(events=[Event('y - 100')])
+    assert 'resumed_from_step' not in results['summary']
+
+
+def test_short_solves_are_not_saved(tmp_path):
+    store = CheckpointStore(str(tmp_path), min_steps=1000)
+    make_solver(RungeKuttaMethod, 500, store).solve_lean()
+    assert os.listdir(tmp_path) == []
+
+
+def test_sweep_limits_problems_and_age(tmp_path):
+    store = CheckpointStore(str(tmp_path), max_problems=2)
+    for y0 in (1.0, 2.0, 3.0):
+        solver = RungeKuttaMethod('y', 0.0, y0, 0.01, 10)
+        solver.checkpoints = store
+        solver.solve_lean()
+    assert len([name for name in os.listdir(tmp_path) if name.endswith('.json')]) == 2
+
+    store.max_age = 60.0
+    assert store.sweep(now=time.time() + 3600)['removed'] == 2
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from models import EulerMethod, HeunMethod, RungeKuttaMethod
+
+
+@pytest.mark.parametrize('method_class', [EulerMethod, HeunMethod, RungeKuttaMethod])
+def test_dense_output_matches_grid(method_class):
+    """En los nodos de la malla la salida densa da los mismos valores que la tabla completa."""
+    full = method_class('x + y', 0.0, 1.0, 0.1, 20).solve()
+    dense = method_class('x + y', 0.0, 1.0, 0.1, 20).solve_dense(np.linspace(0.0, 2.0, 21))
+
+    assert dense['output_mode'] == 'dense'
+    np.testing.assert_allclose(dense['plot_data']['y_values'], full['plot_data']['y_values'],
+                               rtol=1e-13, atol=0)
+
+
+def test_dense_output_between_nodes_keeps_order():
+    """Entre nodos el interpolante de RK4 conserva la precisión del método (y' = y)."""
+    points = np.linspace(0.0, 1.0, 37)
+    results = RungeKuttaMethod('y', 0.0, 1.0, 0.05, 20).solve_dense(points)
+
+    error = np.max(np.abs(np.array(results['plot_data']['y_values']) - np.exp(points)))
+    assert error < 1e-6
+
+
+def test_dense_output_stops_at_last_point_without_tables():
+    """La integración se detiene en el último punto pedido y no reserva la tabla."""
+    solver = RungeKuttaMethod('y', 0.0, 1.0, 0.01, 1000)
+    results = solver.solve_dense([0.0, 0.5, 0.255])
+
+    assert solver.x_values is None
+    assert results['summary']['total_steps'] == 50
+    assert results['plot_data']['y_values'][0] == 1.0
+
+
+def test_dense_output_rejects_points_outside_interval():
+    with pytest.raises(Exception, match='Los puntos de salida'):
+        RungeKuttaMethod('y', 0.0, 1.0, 0.1, 10).solve_dense([0.5, 1.5])
+
+
+def test_exact_error_norm_independent_of_output_points():
+    """La norma L2 frente a la solución exacta no depende de cuántos puntos densos se piden."""
+    from concurrent.futures import Future
+
+    from utils.exact_solution import attach_exact_solution
+
+    solution = Future()
+    solution.set_result({'expression': 'exp(x)', 'function': np.exp})
+    norms = []
+    for points in (11, 101, 1001):
+        results = EulerMethod('y', 0.0, 1.0, 1e-3, 1000).solve_dense(np.linspace(0.0, 1.0, points))
+        norms.append(attach_exact_solution(results, solution, 1.0)['summary']['l2_error'])
+
+    assert norms[0] == pytest.approx(norms[2], rel=1e-2)
+    assert norms[1] == pytest.approx(norms[2], rel=1e-3)
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from models import DivergenceGuard, EulerMethod, RungeKuttaMethod
+
+
+def test_blow_up_keeps_valid_prefix():
+    """y' = y**2, y(0) = 1 explota en x = 1: se conserva la parte válida con un diagnóstico."""
+    results = RungeKuttaMethod('y**2', 0.0, 1.0, 0.01, 200).solve()
+
+    divergence = results['divergence']
+    assert results['summary']['diverged'] is True
+    assert divergence['reason'] in DivergenceGuard.REASONS.values()
+    assert results['summary']['total_steps'] == divergence['step'] - 1
+    assert results['plot_data']['x_values'][-1] == pytest.approx(1.0)
+    assert len(results['plot_data']['y_values']) == divergence['step']
+
+
+def test_evaluation_error_stops_integration():
+    """Un error al evaluar f (log de un negativo) se diagnostica en lugar de propagarse."""
+    with np.errstate(all='ignore'):
+        results = EulerMethod('log(1 - x)', 0.0, 0.0, 0.1, 20).solve_lean()
+    assert results['divergence']['reason'] == 'error_evaluacion'
+    assert results['divergence']['step'] == 11
+    assert results['final']['x'] == pytest.approx(1.0)
+
+
+def test_growth_threshold():
+    guard = DivergenceGuard(max_magnitude=1e6, max_growth=10.0)
+    assert guard.check(1.0, 5.0, 1.0) == guard.OK
+    assert guard.check(1.0, 20.0, 1.0) == guard.GROWTH
+    assert guard.check(1.0, 2e6, 1.0) == guard.MAGNITUDE
+    assert guard.check(1.0, float('nan'), 1.0) == guard.NON_FINITE
+
+
+def test_disabled_guard_raises():
+    solver = EulerMethod('log(1 - x)', 0.0, 0.0, 0.1, 20)
+    solver.guard = None
+    with np.errstate(all='ignore'), pytest.raises(Exception):
+        solver.solve()
+
+
+def test_invalid_thresholds():
+    with pytest.raises(ValueError):
+        DivergenceGuard(max_magnitude=0)
@@ -0,0 +1,58 @@
+import math
+
+import pytest
+
+from models import EulerMethod, RungeKuttaMethod
+from models.events import Event
+
+
+def test_crossing_located_inside_step():
+    """El cruce y = 2 de y' = y, y(0) = 1 se localiza en ln 2 con el interpolante del paso."""
+    results = RungeKuttaMethod('y', 0.0, 1.0, 0.1, 10).solve(events=[Event('y - 2')])
+
+    (event,) = results['events']
+    assert event['x'] == pytest.approx(math.log(2), abs=1e-6)
+    assert event['y'] == pytest.approx(2.0, abs=1e-6)
+    assert event['direction'] == 'ascendente'
+    assert results['summary']['terminated_by_event'] is False
+    assert len(results['plot_data']['x_values']) == 11
+
+
+def test_terminal_event_stops_integration():
+    """Un evento terminal detiene la integración al final del paso que lo contiene."""
+    results = RungeKuttaMethod('y', 0.0, 1.0, 0.1, 10).solve(events=[Event('y - 2', terminal=True)])
+
+    assert results['summary']['terminated_by_event'] is True
+    assert results['summary']['total_steps'] == 7
+    assert results['plot_data']['x_values'][-1] == pytest.approx(0.7)
+
+
+def test_direction_filters_crossings():
+    """sin(x) cruza cero subiendo en 2π y bajando en π: cada dirección ve solo el suyo."""
+    events = [Event('y', direction=1, name='sube'), Event('y', direction=-1, name='baja')]
+    results = RungeKuttaMethod('cos(x)', 0.0, 0.0, 0.01, 700).solve(events=events)
+
+    found = {event['name']: event['x'] for event in results['events']}
+    assert found['baja'] == pytest.approx(math.pi, abs=1e-6)
+    assert found['sube'] == pytest.approx(2 * math.pi, abs=1e-6)
+
+
+def test_event_uses_named_parameters():
+    """Los eventos se evalúan con los parámetros del método (y = c con c = 2)."""
+    solver = RungeKuttaMethod('k*y', 0.0, 1.0, 0.01, 100)
+    solver.parameters = {'k': 1.0, 'c': 2.0}
+    results = solver.solve(events=[Event('y - c', parameters=['k', 'c'])])
+
+    assert results['events'][0]['x'] == pytest.approx(math.log(2), abs=1e-6)
+
+
+def test_invalid_event():
+    with pytest.raises(ValueError):
+        Event('y - import')
+    with pytest.raises(ValueError):
+        Event('y', direction=2)
+
+
+def test_no_events_no_monitor():
+    results = EulerMethod('y', 0.0, 1.0, 0.1, 10).solve()
+    assert 'events' not in results
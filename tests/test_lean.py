@@ -0,0 +1,38 @@
+import pytest
+
+from models import HeunMethod, RungeKuttaMethod
+
+
+@pytest.mark.parametrize('method_class', [HeunMethod, RungeKuttaMethod])
+def test_lean_final_value_matches_full_solve(method_class):
+    """El modo ligero llega al mismo valor final que la tabla completa, sin reservarla."""
+    full = method_class('x*y - 2*x', 0.0, 1.0, 0.01, 200)
+    full.integrate()
+    lean = method_class('x*y - 2*x', 0.0, 1.0, 0.01, 200)
+    results = lean.solve_lean()
+
+    assert lean.x_values is None
+    assert results['output_mode'] == 'lean'
+    assert results['final']['y'] == full.y_values[-1]
+    assert results['final']['x'] == full.x_values[-1]
+
+
+def test_lean_trace_is_strided_and_keeps_endpoints():
+    results = RungeKuttaMethod('y', 0.0, 1.0, 0.01, 105).solve_lean(stride=10)
+
+    x_values = results['plot_data']['x_values']
+    assert len(x_values) == 1 + 10 + 1
+    assert x_values[0] == 0.0
+    assert x_values[-1] == pytest.approx(1.05)
+    assert results['summary']['stride'] == 10
+
+
+def test_lean_without_stride_keeps_only_endpoints():
+    results = RungeKuttaMethod('y', 0.0, 1.0, 0.001, 5000).solve_lean()
+    assert len(results['plot_data']['x_values']) == 2
+    assert results['summary']['total_steps'] == 5000
+
+
+def test_lean_rejects_invalid_stride():
+    with pytest.raises(Exception, match='submuestreo'):
+        RungeKuttaMethod('y', 0.0, 1.0, 0.1, 10).solve_lean(stride=0)
@@ -0,0 +1,12 @@
+from utils.optimizer import check_equivalence
+
+
+def test_corpus_is_bit_exact():
+    """La evaluación optimizada coincide bit a bit con la de referencia en todo el corpus."""
+    assert check_equivalence() == []
+
+
+def test_powers_keep_reference_overflow():
+    """x**2 desborda con el mismo error que el evaluador de referencia (no devuelve inf)."""
+    assert check_equivalence(['x**2', 'y**3', 'x**2 + y'], [(1e200, 1.0), (1.0, -1e120)]) == []
+
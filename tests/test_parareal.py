@@ -0,0 +1,44 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from models import Parareal, RungeKuttaMethod
+
+
+def sequential_final(num_steps):
+    return RungeKuttaMethod('y*cos(x)', 0.0, 1.0, 0.001, num_steps).solve_lean()['final']['y']
+
+
+def test_converges_to_sequential_fine_solution():
+    parareal = Parareal(RungeKuttaMethod, 'y*cos(x)', 0.0, 1.0, 0.001, 4000, 8, tolerance=1e-12)
+    results = parareal.solve()
+
+    assert results['summary']['converged'] is True
+    assert results['summary']['iterations'] < 8
+    assert results['final']['y'] == pytest.approx(sequential_final(4000), rel=1e-10)
+    assert results['summary']['processes'] == 1
+
+
+def test_slices_iterations_reproduce_fine_solution():
+    """Tras tantas iteraciones como subintervalos la solución es la fina secuencial."""
+    parareal = Parareal(RungeKuttaMethod, 'y*cos(x)', 0.0, 1.0, 0.001, 3000, 3, tolerance=0.0)
+    results = parareal.solve()
+
+    assert results['summary']['iterations'] == 3
+    assert results['summary']['converged'] is True
+    assert results['final']['y'] == pytest.approx(sequential_final(3000), rel=1e-12)
+
+
+def test_process_pool_gives_same_result():
+    arguments = (RungeKuttaMethod, 'k*y*cos(x)', 0.0, 1.0, 0.001, 2000, 4)
+    serial = Parareal(*arguments, parameters={'k': 0.5}).solve()
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        parallel = Parareal(*arguments, parameters={'k': 0.5}).solve(executor=pool, processes=2)
+
+    assert parallel['boundaries'] == serial['boundaries']
+    assert parallel['summary']['processes'] == 2
+
+
+def test_invalid_slices():
+    with pytest.raises(ValueError):
+        Parareal(RungeKuttaMethod, 'y', 0.0, 1.0, 0.1, 10, 11)
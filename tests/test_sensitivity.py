@@ -0,0 +1,61 @@
+import math
+
+import pytest
+
+from models import ForwardSensitivity, HeunMethod, RungeKuttaMethod, StormerVerletMethod
+
+FUNCTION = 'k*sin(y) + c*x*y'
+PARAMETERS = {'k': 0.8, 'c': -0.3}
+
+
+def final_value(method_class, y0=1.0, **parameters):
+    solver = method_class(FUNCTION, 0.0, y0, 0.01, 200)
+    solver.parameters = dict(PARAMETERS, **parameters)
+    return solver.solve_lean()['final']['y']
+
+
+def sensitivities(method_class):
+    solver = method_class(FUNCTION, 0.0, 1.0, 0.01, 200)
+    solver.parameters = dict(PARAMETERS)
+    ForwardSensitivity(solver)
+    return solver.solve_lean()
+
+
+def test_linear_problem_closed_form():
+    """y' = k*y: ∂y/∂y0 = e^{kx}, ∂y/∂k = x·y0·e^{kx} y ∂y/∂x0 = -k·e^{kx}."""
+    solver = RungeKuttaMethod('k*y', 0.0, 1.0, 0.01, 100)
+    solver.parameters = {'k': 0.5}
+    ForwardSensitivity(solver)
+    report = solver.solve_lean()['sensitivity']
+
+    assert report['dy_dy0'] == pytest.approx(math.exp(0.5), rel=1e-9)
+    assert report['derivatives']['k'] == pytest.approx(math.exp(0.5), rel=1e-9)
+    assert report['derivatives']['x0'] == pytest.approx(-0.5 * math.exp(0.5), rel=1e-9)
+    assert report['relative']['k'] == pytest.approx(0.5, rel=1e-9)
+
+
+@pytest.mark.parametrize('method_class', [HeunMethod, RungeKuttaMethod])
+def test_matches_finite_differences(method_class):
+    """Las sensibilidades coinciden con diferencias centradas de la misma solución discreta."""
+    results = sensitivities(method_class)
+    derivatives = results['sensitivity']['derivatives']
+    eps = 1e-6
+
+    fd_y0 = (final_value(method_class, y0=1.0 + eps) - final_value(method_class, y0=1.0 - eps)) / (2 * eps)
+    assert derivatives['y0'] == pytest.approx(fd_y0, rel=1e-7)
+    for name, value in PARAMETERS.items():
+        fd = (final_value(method_class, **{name: value + eps})
+              - final_value(method_class, **{name: value - eps})) / (2 * eps)
+        assert derivatives[name] == pytest.approx(fd, rel=1e-7)
+
+    # Las sensibilidades no cambian la solución entregada
+    assert results['final']['y'] == final_value(method_class)
+
+
+def test_unsupported_methods_and_parameters():
+    with pytest.raises(ValueError):
+        ForwardSensitivity(StormerVerletMethod('-y', 0.0, 1.0, 0.1, 10))
+    solver = RungeKuttaMethod('k*y', 0.0, 1.0, 0.1, 10)
+    solver.parameters = {'k': 1.0}
+    with pytest.raises(ValueError, match='Parámetro desconocido'):
+        ForwardSensitivity(solver, parameters=['c'])
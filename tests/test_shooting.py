@@ -0,0 +1,57 @@
+import math
+
+import numpy as np
+import pytest
+
+from models import AdamsBashforthMethod, RungeKuttaMethod, ShootingMethod
+from models.symplectic import StormerVerletMethod
+
+
+def test_linear_problem():
+    """y'' = 6x, y(0) = 0, y(1) = 1 tiene solución x**3 (pendiente inicial 0)."""
+    results = ShootingMethod(RungeKuttaMethod, '6*x', 0.0, 0.0, 1.0, 1.0, 100).solve()
+
+    (solution,) = results['solutions']
+    assert solution['initial_slope'] == pytest.approx(0.0, abs=1e-8)
+    assert abs(solution['residual']) <= 1e-10 * 2
+    x = np.array(results['x_values'])
+    np.testing.assert_allclose(solution['y_values'], x ** 3, atol=1e-10)
+
+
+def test_one_integration_per_round():
+    """y'' = -y, y(0) = 0, y(1) = sin(1): pendiente 1, con una integración vectorizada por ronda."""
+    results = ShootingMethod(RungeKuttaMethod, '-y', 0.0, 0.0, 1.0, math.sin(1.0), 200,
+                             slope_range=(-5.0, 5.0), candidates=16).solve()
+
+    slopes = [solution['initial_slope'] for solution in results['solutions']]
+    assert slopes == pytest.approx([1.0], abs=1e-8)
+    assert results['summary']['unconverged'] == 0
+    # Más la integración final que guarda las trayectorias
+    assert results['summary']['batched_solves'] == len(results['rounds']) + 1
+
+
+def test_nonlinear_problem_with_two_solutions():
+    """y'' = -exp(y) (Bratu), y(0) = y(1) = 0 con lambda = 1 tiene dos soluciones."""
+    results = ShootingMethod(RungeKuttaMethod, '-exp(y)', 0.0, 0.0, 1.0, 0.0, 200,
+                             slope_range=(0.0, 20.0), candidates=64).solve()
+
+    assert results['summary']['solutions_found'] == 2
+    for solution in results['solutions']:
+        assert abs(solution['residual']) < 1e-9
+
+
+def test_parameters_and_multistep_method():
+    results = ShootingMethod(AdamsBashforthMethod, '-k*y', 0.0, 0.0, 1.0, 1.0, 400,
+                             method_options={'order': 4}, parameters={'k': 4.0}).solve()
+    (solution,) = results['solutions']
+    assert solution['initial_slope'] == pytest.approx(2.0 / math.sin(2.0), rel=1e-6)
+
+
+def test_invalid_problems():
+    with pytest.raises(Exception, match='no cambia de signo'):
+        ShootingMethod(RungeKuttaMethod, '0', 0.0, 0.0, 1.0, 100.0, 10,
+                       slope_range=(-1.0, 1.0)).solve()
+    with pytest.raises(ValueError):
+        ShootingMethod(StormerVerletMethod, '-y', 0.0, 0.0, 1.0, 1.0, 10)
+    with pytest.raises(ValueError):
+        ShootingMethod(RungeKuttaMethod, '-y', 0.0, 0.0, 1.0, 1.0, 10, candidates=1)
@@ -0,0 +1,43 @@
+import math
+
+import numpy as np
+import pytest
+
+from models import StormerVerletMethod, YoshidaMethod
+
+
+def energy(solver):
+    return 0.5 * (solver.velocity_values ** 2 + solver.y_values ** 2)
+
+
+@pytest.mark.parametrize('method_class, bound', [(StormerVerletMethod, 2e-3), (YoshidaMethod, 1e-5)])
+def test_oscillator_energy_stays_bounded(method_class, bound):
+    """En y'' = -y la energía oscila acotada, sin deriva, durante ~3000 periodos."""
+    solver = method_class('-y', 0.0, 1.0, 0.1, 200_000, v0=0.0)
+    solver.integrate()
+
+    deviation = np.abs(energy(solver) - 0.5)
+    assert deviation.max() < bound
+    # Sin deriva: el final no se aleja más que el principio
+    tenth = len(deviation) // 10
+    assert deviation[-tenth:].max() < 1.5 * deviation[:tenth].max()
+
+
+@pytest.mark.parametrize('method_class, order', [(StormerVerletMethod, 2), (YoshidaMethod, 4)])
+def test_convergence_order(method_class, order):
+    def error(num_steps):
+        solver = method_class('-y', 0.0, 1.0, 2.0 / num_steps, num_steps)
+        solver.integrate()
+        return abs(solver.y_values[-1] - math.cos(2.0))
+
+    assert abs(math.log2(error(100) / error(200)) - order) < 0.2
+
+
+@pytest.mark.parametrize('method_class', [StormerVerletMethod, YoshidaMethod])
+def test_evaluations_and_final_velocity(method_class):
+    solver = method_class('-y', 0.0, 0.0, 0.01, 100, v0=1.0)
+    results = solver.solve()
+
+    assert solver.function_evaluations == 1 + method_class.EVALS_PER_STEP * 100
+    assert results['summary']['final_velocity'] == pytest.approx(math.cos(1.0), abs=1e-4)
+    assert solver.velocity_values[-1] == results['summary']['final_velocity']
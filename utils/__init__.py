@@ -4,18 +4,22 @@ Módulo de utilidades para la aplicación de métodos numéricos.
 Contiene:
 - parser.py: Evaluación segura de funciones matemáticas
 - plotter.py: Generación de gráficas interactivas
+- exact_solution.py: Solución exacta con sympy y métricas de error
 """
 
 try:
     from .parser import validate_function, evaluate_function, get_allowed_functions
     from .plotter import create_ode_plot, create_comparison_plot
+    from .exact_solution import request_exact_solution, attach_exact_solution
 
     __all__ = [
         'validate_function',
         'evaluate_function',
         'get_allowed_functions',
         'create_ode_plot',
-        'create_comparison_plot'
+        'create_comparison_plot',
+        'request_exact_solution',
+        'attach_exact_solution'
     ]
 except ImportError as e:
     print(f"Warning: Could not import some utilities: {e}")
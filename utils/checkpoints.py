@@ -0,0 +1,229 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, Optional
+
+import numpy as np
+
+
+class CheckpointStore:
+    """
+    Puntos de control de las resoluciones, guardados en disco por problema.
+
+    Un problema se identifica por el hash de (método, f, parámetros, x0, y0,
+    h): dos peticiones que solo difieren en xn recorren la misma malla, así
+    que una puede continuar desde donde terminó la otra. De cada problema se
+    conserva el punto de control más avanzado (estado del método: x, y, f y
+    el historial multipaso) y, aparte, el más avanzado que incluye los
+    arrays de la tabla completa.
+
+    Los ficheros se escriben de forma atómica, de modo que sobreviven al
+    reinicio de un worker y pueden compartirse entre procesos.
+
+    Solo se guardan los puntos de control de ``min_steps`` pasos o más: las
+    resoluciones cortas se repiten más rápido de lo que se leen de disco.
+    Como el almacén de gráficas (PlotSweeper), se borran los problemas que
+    llevan más de ``max_age`` segundos sin usarse y, por encima de
+    ``max_problems`` o de ``max_bytes``, los menos usados.
+    """
+
+    # Temporales de escrituras interrumpidas (se borran pasada esta antigüedad)
+    TEMP_SUFFIX = '.tmp'
+    TEMP_GRACE = 600.0
+
+    def __init__(self, directory: str, max_problems: int = 256, min_steps: int = 0,
+                 max_age: Optional[float] = None, max_bytes: Optional[int] = None):
+        """
+        Inicializar el almacén.
+
+        Args:
+            directory (str): Directorio de los puntos de control
+            max_problems (int): Máximo de problemas conservados (se borran
+                los usados hace más tiempo)
+            min_steps (int): Pasos mínimos para guardar un punto de control
+            max_age (float, optional): Segundos sin uso tras los que se borra un problema
+            max_bytes (int, optional): Tamaño máximo del almacén
+        """
+        self.directory = directory
+        self.max_problems = max_problems
+        self.min_steps = min_steps
+        self.max_age = max_age
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        with self._lock:
+            self.sweep()
+
+    def __getstate__(self):
+        # El cerrojo no viaja a otros procesos (los métodos se envían al pool)
+        state = dict(self.__dict__)
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def problem_key(method) -> str:
+        """Hash del problema de un método (ver ODEMethod.checkpoint_signature)."""
+        signature = json.dumps(method.checkpoint_signature(), sort_keys=True)
+        return hashlib.sha256(signature.encode('utf-8')).hexdigest()
+
+    def _path(self, key: str, suffix: str) -> str:
+        return os.path.join(self.directory, key + suffix)
+
+    def _read(self, key: str) -> Dict:
+        """Leer el registro de un problema (vacío si no existe o está dañado)."""
+        try:
+            with open(self._path(key, '.json'), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_atomic(self, path: str, write):
+        """Escribir un fichero a través de un temporal y renombrarlo."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                write(f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def load(self, method, arrays: bool = False) -> Optional[Dict]:
+        """
+        Buscar el punto de control más avanzado utilizable por un método.
+
+        Args:
+            method (ODEMethod): Método configurado (problema y número de pasos)
+            arrays (bool): Exigir los arrays de la tabla completa
+
+        Returns:
+            dict: Estado guardado (con 'arrays' si se pidieron), o None si no
+                hay ninguno que no supere los pasos pedidos
+        """
+        key = self.problem_key(method)
+        with self._lock:
+            record = self._read(key)
+            state = record.get('arrays_state' if arrays else 'state')
+            if not state or state['step'] > method.num_steps:
+                return None
+
+            if arrays:
+                try:
+                    with np.load(self._path(key, '.npz')) as data:
+                        state = dict(state, arrays={name: data[name] for name in data.files})
+                except (OSError, ValueError):
+                    return None
+                if len(state['arrays']['x_values']) != state['step'] + 1:
+                    return None
+
+            try:
+                os.utime(self._path(key, '.json'))
+            except OSError:
+                pass
+            return state
+
+    def save(self, method, state: Dict, arrays: Optional[Dict] = None):
+        """
+        Guardar un punto de control si es más avanzado que el existente.
+
+        Args:
+            method (ODEMethod): Método que lo generó
+            state (dict): Estado (ver ODEMethod._checkpoint_state)
+            arrays (dict, optional): Arrays de la tabla completa hasta state['step']
+        """
+        if state['step'] < self.min_steps:
+            return
+        key = self.problem_key(method)
+        with self._lock:
+            record = self._read(key)
+            changed = False
+
+            if not record.get('state') or state['step'] > record['state']['step']:
+                record['state'] = state
+                changed = True
+
+            if arrays is not None and (not record.get('arrays_state')
+                                       or state['step'] > record['arrays_state']['step']):
+                self._write_atomic(self._path(key, '.npz'), lambda f: np.savez(f, **arrays))
+                record['arrays_state'] = state
+                changed = True
+
+            if changed:
+                record['problem'] = method.checkpoint_signature()
+                self._write_atomic(self._path(key, '.json'),
+                                   lambda f: f.write(json.dumps(record).encode('utf-8')))
+                self.sweep()
+
+    def sweep(self, now: Optional[float] = None) -> Dict:
+        """
+        Borrar los problemas caducados y, por encima de los máximos, los menos usados.
+
+        Se llama con el cerrojo tomado (al crear el almacén y tras cada escritura).
+
+        Args:
+            now (float, optional): Instante de referencia (por defecto, ahora)
+
+        Returns:
+            dict: Problemas borrados y tamaño final del almacén
+        """
+        now = time.time() if now is None else now
+        problems = []
+        total = 0
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            if name.endswith(self.TEMP_SUFFIX):
+                if now - self._mtime(path) >= self.TEMP_GRACE:
+                    self._remove(path)
+                continue
+            if not name.endswith('.json'):
+                continue
+            key = name[:-len('.json')]
+            size = sum(self._size(self._path(key, suffix)) for suffix in ('.json', '.npz'))
+            problems.append((self._mtime(path), key, size))
+            total += size
+
+        # Los menos usados primero
+        problems.sort()
+        removed = 0
+        for index, (mtime, key, size) in enumerate(problems):
+            expired = self.max_age is not None and now - mtime >= self.max_age
+            too_many = len(problems) - index > self.max_problems
+            too_big = self.max_bytes is not None and total > self.max_bytes
+            if not (expired or too_many or too_big):
+                break
+            for suffix in ('.json', '.npz'):
+                self._remove(self._path(key, suffix))
+            total -= size
+            removed += 1
+
+        return {'removed': removed, 'total_bytes': total}
+
+    @staticmethod
+    def _remove(path: str):
+        # Otro proceso puede haberlo borrado ya
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _size(path: str) -> int:
+        try:
+            return os.path.getsize(path)
+        except OSError:
+            return 0
+
+    @staticmethod
+    def _mtime(path: str) -> float:
+        try:
+            return os.path.getmtime(path)
+        except OSError:
+            return 0.0
@@ -0,0 +1,218 @@
+import ast
+from typing import Dict, Iterable, Tuple
+
+from utils.parser import _parse_expression
+
+
+class CostEstimator:
+    """
+    Modelo estático del coste de una petición de resolución.
+
+    Antes de integrar estima el tiempo de CPU y la memoria a partir del AST
+    de la expresión (número de nodos y peso de cada función), de las
+    evaluaciones por paso del método, del número de pasos y del modo de
+    salida. Los coeficientes están medidos sobre el evaluador de
+    utils/parser.py; solo pretenden acertar el orden de magnitud.
+    """
+
+    # Coste fijo de una llamada al evaluador (función compilada, comprobación del resultado)
+    SECONDS_PER_EVALUATION = 1.8e-6
+
+    # Coste de cada nodo del AST según su tipo
+    NODE_SECONDS = {
+        ast.BinOp: 2e-7,
+        ast.UnaryOp: 1.5e-7,
+        ast.Name: 1e-7,
+        ast.Constant: 5e-8,
+        ast.Call: 2e-7,
+    }
+
+    # Coste adicional de cada función (las funciones de NumPy sobre escalares son caras)
+    FUNCTION_SECONDS = {
+        'floor': 5e-7, 'ceil': 5e-7, 'abs': 5e-7, 'fabs': 5e-7,
+        'round': 1.5e-6, 'factorial': 5e-7,
+    }
+    DEFAULT_FUNCTION_SECONDS = 1e-6
+
+    # Bucle de integración (por paso) y tabla de resultados + plantilla + gráfica (por fila)
+    SECONDS_PER_STEP = 5e-7
+    SECONDS_PER_TABLE_ROW = 2.5e-4
+
+    # Backend JIT: coste por nodo del código compilado y compilación en frío
+    JIT_SECONDS_PER_NODE = 5e-9
+    JIT_COMPILE_SECONDS = 1.5
+
+    # Memoria: valor por paso de los arrays (float64 por defecto) y tabla/HTML por fila
+    BYTES_PER_VALUE = 8
+    BYTES_PER_TABLE_ROW = 1500
+
+    def expression_seconds(self, expression: str) -> float:
+        """
+        Estimar el tiempo de una evaluación de la expresión en el evaluador.
+
+        Args:
+            expression (str): Expresión f(x, y) (ya validada)
+
+        Returns:
+            float: Segundos por evaluación
+        """
+        seconds = self.SECONDS_PER_EVALUATION
+        for node in ast.walk(_parse_expression(expression).body):
+            seconds += self.NODE_SECONDS.get(type(node), 0.0)
+            if isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
+                seconds += self.FUNCTION_SECONDS.get(node.func.id, self.DEFAULT_FUNCTION_SECONDS)
+        return seconds
+
+    def node_count(self, expression: str) -> int:
+        """Número de nodos del AST de la expresión."""
+        return sum(1 for _ in ast.walk(_parse_expression(expression).body))
+
+    def estimate(self, method_class, expression: str, num_steps: int, mode: str = 'full',
+                 backend: str = 'python', output_points: int = 0,
+                 event_expressions: Iterable[str] = (), value_bytes: int = None,
+                 derivative_expressions: Iterable[str] = (), batch: int = 1) -> Dict:
+        """
+        Estimar el coste de resolver un problema.
+
+        Args:
+            method_class (type): Clase del método (usa EVALS_PER_STEP y STAGE_ATTRS)
+            expression (str): Expresión f(x, y) (ya validada)
+            num_steps (int): Número de pasos
+            mode (str): 'full' (tabla completa), 'arrays' (solo arrays, exportación),
+                'dense' o 'lean'
+            backend (str): 'python' o 'jit'
+            output_points (int): Puntos de salida del modo denso
+            event_expressions (iterable): Expresiones g(x, y) de los eventos
+            value_bytes (int, optional): Bytes por valor guardado (4 en float32)
+            derivative_expressions (iterable): Derivadas de f que se evalúan junto
+                a ella (sensibilidades)
+            batch (int): Problemas integrados a la vez (combinaciones de un barrido,
+                disparos); el coste de uno se multiplica por ellos, una cota
+                superior para la evaluación vectorizada
+
+        Returns:
+            dict: Modo, nodos, evaluaciones, segundos de CPU y MB estimados
+        """
+        evaluations = 1 + num_steps * method_class.EVALS_PER_STEP
+        nodes = self.node_count(expression)
+        event_seconds = sum(self.expression_seconds(event) for event in event_expressions)
+
+        compile_seconds = 0.0
+        if backend == 'jit' and not event_seconds:
+            compile_seconds = self.JIT_COMPILE_SECONDS
+            cpu_seconds = evaluations * nodes * self.JIT_SECONDS_PER_NODE
+        else:
+            evaluation_seconds = self.expression_seconds(expression) + sum(
+                self.expression_seconds(derivative) for derivative in derivative_expressions)
+            cpu_seconds = (evaluations * evaluation_seconds
+                           + num_steps * (self.SECONDS_PER_STEP + event_seconds))
+
+        # Valores guardados por paso: x, y y una columna por etapa
+        columns = 2 + len(method_class.STAGE_ATTRS)
+        value_bytes = value_bytes or self.BYTES_PER_VALUE
+        if mode == 'full':
+            rows = num_steps + 1
+            cpu_seconds += rows * self.SECONDS_PER_TABLE_ROW
+            memory_bytes = rows * (columns * value_bytes + self.BYTES_PER_TABLE_ROW)
+        elif mode == 'arrays':
+            memory_bytes = (num_steps + 1) * columns * value_bytes
+        elif mode == 'dense':
+            cpu_seconds += output_points * self.SECONDS_PER_TABLE_ROW
+            memory_bytes = output_points * (2 * value_bytes + self.BYTES_PER_TABLE_ROW)
+        else:
+            memory_bytes = 0
+
+        # La compilación se paga una vez; la integración y sus arrays, por problema
+        cpu_seconds = compile_seconds + batch * cpu_seconds
+        memory_bytes *= batch
+
+        return {
+            'mode': mode,
+            'nodes': nodes,
+            'evaluations': evaluations,
+            'cpu_seconds': cpu_seconds,
+            'memory_mb': memory_bytes / (1024 * 1024),
+        }
+
+
+class AdmissionController:
+    """
+    Decide qué hacer con una petición según su coste estimado y los
+    presupuestos configurados: aceptarla, degradarla a un modo sin tabla
+    completa, mandarla a la cola en segundo plano o rechazarla.
+    """
+
+    ACCEPT, DOWNGRADE, BACKGROUND, REJECT = 'accept', 'downgrade', 'background', 'reject'
+
+    def __init__(self, config):
+        """
+        Inicializar el controlador.
+
+        Args:
+            config (dict): Configuración de la aplicación (umbrales ADMISSION_*,
+                MAX_STEPS, MIN_STEP_SIZE, MAX_STEP_SIZE, LEAN_MAX_STEPS)
+        """
+        self.config = config
+
+    def check_problem(self, h: float, num_steps: int, mode: str):
+        """
+        Aplicar los límites fijos de la configuración al problema.
+
+        Raises:
+            ValueError: Si el paso o el número de pasos están fuera de rango
+        """
+        if not self.config['MIN_STEP_SIZE'] <= abs(h) <= self.config['MAX_STEP_SIZE']:
+            raise ValueError(f"Tamaño de paso fuera de rango: |h| debe estar en "
+                             f"[{self.config['MIN_STEP_SIZE']}, {self.config['MAX_STEP_SIZE']}]")
+        if num_steps < 0:
+            raise ValueError("El número de pasos no puede ser negativo (revise x0, xn y h)")
+        if mode == 'lean' and num_steps > self.config['LEAN_MAX_STEPS']:
+            raise ValueError(f"Demasiados pasos: máximo {self.config['LEAN_MAX_STEPS']}")
+
+    def decide(self, estimate: Dict, num_steps: int, can_downgrade: bool = True) -> Tuple[str, str]:
+        """
+        Decidir el destino de una petición.
+
+        Args:
+            estimate (dict): Resultado de CostEstimator.estimate
+            num_steps (int): Número de pasos
+            can_downgrade (bool): Si la petición admite un modo sin tabla completa
+
+        Returns:
+            tuple: (decisión, motivo)
+        """
+        if estimate['mode'] == 'full':
+            if num_steps > self.config['MAX_STEPS']:
+                reason = f"{num_steps} pasos superan el máximo de la tabla completa ({self.config['MAX_STEPS']})"
+                if can_downgrade:
+                    return self.DOWNGRADE, reason
+                return self.REJECT, reason
+            if estimate['memory_mb'] > self.config['ADMISSION_MEMORY_MB']:
+                reason = f"memoria estimada {estimate['memory_mb']:.0f} MB > {self.config['ADMISSION_MEMORY_MB']} MB"
+                if can_downgrade:
+                    return self.DOWNGRADE, reason
+                return self.REJECT, reason
+        elif estimate['memory_mb'] > self.config['ADMISSION_MEMORY_MB']:
+            return self.REJECT, f"memoria estimada {estimate['memory_mb']:.0f} MB > {self.config['ADMISSION_MEMORY_MB']} MB"
+
+        if estimate['cpu_seconds'] <= self.config['ADMISSION_CPU_SECONDS']:
+            return self.ACCEPT, ''
+
+        reason = f"tiempo estimado {estimate['cpu_seconds']:.1f} s > {self.config['ADMISSION_CPU_SECONDS']} s"
+        if estimate['cpu_seconds'] <= self.config['BACKGROUND_CPU_SECONDS']:
+            return self.BACKGROUND, reason
+        return self.REJECT, reason
+
+
+# Instancia global del estimador
+_estimator = CostEstimator()
+
+
+def estimate_cost(method_class, expression: str, num_steps: int, **kwargs) -> Dict:
+    """
+    Estimar el coste de resolver un problema (ver CostEstimator.estimate).
+
+    Returns:
+        dict: Nodos, evaluaciones, segundos de CPU y MB estimados
+    """
+    return _estimator.estimate(method_class, expression, num_steps, **kwargs)
@@ -0,0 +1,249 @@
+import ast
+import copy
+from functools import lru_cache
+
+
+class ExpressionDifferentiator:
+    """
+    Derivación simbólica de las expresiones de la lista blanca del evaluador.
+
+    Recorre el AST de f(x, y) aplicando las reglas de derivación (suma,
+    producto, cociente, potencia y regla de la cadena para cada función
+    permitida) y devuelve otra expresión de la misma lista blanca, que se
+    evalúa y se cachea como cualquier f. Los ceros y unos que aparecen al
+    derivar se simplifican sobre la marcha para que la derivada no crezca
+    más de lo necesario.
+    """
+
+    # Derivada de cada función respecto a su argumento u
+    DERIVATIVES = {
+        'sin': 'cos(u)',
+        'cos': '-sin(u)',
+        'tan': '1 / cos(u)**2',
+        'arcsin': '1 / sqrt(1 - u**2)',
+        'arccos': '-1 / sqrt(1 - u**2)',
+        'arctan': '1 / (1 + u**2)',
+        'asin': '1 / sqrt(1 - u**2)',
+        'acos': '-1 / sqrt(1 - u**2)',
+        'atan': '1 / (1 + u**2)',
+        'sinh': 'cosh(u)',
+        'cosh': 'sinh(u)',
+        'tanh': '1 / cosh(u)**2',
+        'arcsinh': '1 / sqrt(u**2 + 1)',
+        'arccosh': '1 / sqrt(u**2 - 1)',
+        'arctanh': '1 / (1 - u**2)',
+        'exp': 'exp(u)',
+        'log': '1 / u',
+        'ln': '1 / u',
+        'log10': '1 / (u * log(10))',
+        'log2': '1 / (u * log(2))',
+        'sqrt': '1 / (2 * sqrt(u))',
+        'abs': 'u / abs(u)',
+        'fabs': 'u / abs(u)',
+    }
+
+    # Funciones constantes a trozos: derivada nula donde existe
+    PIECEWISE_CONSTANT = ('floor', 'ceil', 'round')
+
+    def __init__(self):
+        self.templates = {name: ast.parse(source, mode='eval').body
+                          for name, source in self.DERIVATIVES.items()}
+
+    def differentiate(self, expression: str, variable: str) -> str:
+        """
+        Derivar una expresión respecto a una variable.
+
+        Args:
+            expression (str): Expresión de la lista blanca (ej: "k*y - sin(x)")
+            variable (str): Variable o parámetro respecto al que se deriva
+
+        Returns:
+            str: Expresión de la derivada (ej: "k")
+
+        Raises:
+            ValueError: Si la expresión contiene algo no derivable
+        """
+        tree = ast.parse(expression, mode='eval')
+        derivative = self._derive(tree.body, variable)
+        return ast.unparse(ast.fix_missing_locations(derivative))
+
+    def _derive(self, node, variable):
+        if not self._depends(node, variable):
+            return self._number(0)
+
+        if isinstance(node, ast.Name):
+            return self._number(1)
+
+        if isinstance(node, ast.UnaryOp):
+            inner = self._derive(node.operand, variable)
+            if isinstance(node.op, ast.USub):
+                return self._neg(inner)
+            if isinstance(node.op, ast.UAdd):
+                return inner
+
+        if isinstance(node, ast.BinOp):
+            left, right = node.left, node.right
+            if isinstance(node.op, ast.Add):
+                return self._add(self._derive(left, variable), self._derive(right, variable))
+            if isinstance(node.op, ast.Sub):
+                return self._sub(self._derive(left, variable), self._derive(right, variable))
+            if isinstance(node.op, ast.Mult):
+                return self._add(self._mul(self._derive(left, variable), right),
+                                 self._mul(left, self._derive(right, variable)))
+            if isinstance(node.op, ast.Div):
+                numerator = self._sub(self._mul(self._derive(left, variable), right),
+                                      self._mul(left, self._derive(right, variable)))
+                return self._div(numerator, self._pow(right, self._number(2)))
+            if isinstance(node.op, ast.Pow):
+                return self._derive_power(left, right, variable)
+
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
+            return self._derive_call(node, variable)
+
+        raise ValueError(f"No se puede derivar: {ast.unparse(node)}")
+
+    def _derive_power(self, base, exponent, variable):
+        """Derivada de base**exponent según de qué dependa cada parte."""
+        if isinstance(exponent, ast.UnaryOp) and isinstance(exponent.op, ast.USub):
+            exponent = self._neg(exponent.operand)
+        if not self._depends(exponent, variable):
+            # n * u**(n-1) * u'
+            reduced = self._sub(exponent, self._number(1))
+            return self._mul(self._mul(exponent, self._pow(base, reduced)),
+                             self._derive(base, variable))
+
+        power = ast.BinOp(left=base, op=ast.Pow(), right=exponent)
+        log_base = self._call('log', base)
+        if not self._depends(base, variable):
+            # a**v * log(a) * v'
+            return self._mul(self._mul(power, log_base), self._derive(exponent, variable))
+
+        # u**v * (v' * log(u) + v * u' / u)
+        return self._mul(power, self._add(
+            self._mul(self._derive(exponent, variable), log_base),
+            self._div(self._mul(exponent, self._derive(base, variable)), base)))
+
+    def _derive_call(self, node, variable):
+        """Regla de la cadena para una llamada a una función permitida."""
+        name = node.func.id
+        if name in self.PIECEWISE_CONSTANT:
+            return self._number(0)
+        if name == 'pow' and len(node.args) == 2:
+            return self._derive_power(node.args[0], node.args[1], variable)
+        if name not in self.templates:
+            raise ValueError(f"Función no derivable: {name}")
+        if len(node.args) != 1 or node.keywords:
+            raise ValueError(f"La función {name} espera un único argumento")
+
+        argument = node.args[0]
+        outer = _Substitute(argument).visit(copy.deepcopy(self.templates[name]))
+        return self._mul(outer, self._derive(argument, variable))
+
+    # ------------------------------------------------------------------
+    # Construcción de nodos con simplificación de ceros y unos
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _depends(node, variable) -> bool:
+        return any(isinstance(child, ast.Name) and child.id == variable for child in ast.walk(node))
+
+    @staticmethod
+    def _number(value):
+        return ast.Constant(value=value)
+
+    @classmethod
+    def _is_value(cls, node, value) -> bool:
+        return cls._is_number(node) and node.value == value
+
+    @staticmethod
+    def _is_number(node) -> bool:
+        return (isinstance(node, ast.Constant) and isinstance(node.value, (int, float))
+                and not isinstance(node.value, bool))
+
+    @staticmethod
+    def _call(name, argument):
+        return ast.Call(func=ast.Name(id=name, ctx=ast.Load()), args=[argument], keywords=[])
+
+    def _neg(self, node):
+        if self._is_number(node):
+            return self._number(-node.value)
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+            return node.operand
+        return ast.UnaryOp(op=ast.USub(), operand=node)
+
+    def _add(self, left, right):
+        if self._is_value(left, 0):
+            return right
+        if self._is_value(right, 0):
+            return left
+        return ast.BinOp(left=left, op=ast.Add(), right=right)
+
+    def _sub(self, left, right):
+        if self._is_number(left) and self._is_number(right):
+            return self._number(left.value - right.value)
+        if self._is_value(right, 0):
+            return left
+        if self._is_value(left, 0):
+            return self._neg(right)
+        return ast.BinOp(left=left, op=ast.Sub(), right=right)
+
+    def _mul(self, left, right):
+        if self._is_value(left, 0) or self._is_value(right, 0):
+            return self._number(0)
+        if self._is_value(left, 1):
+            return right
+        if self._is_value(right, 1):
+            return left
+        if self._is_value(left, -1):
+            return self._neg(right)
+        if self._is_value(right, -1):
+            return self._neg(left)
+        return ast.BinOp(left=left, op=ast.Mult(), right=right)
+
+    def _div(self, left, right):
+        if self._is_value(left, 0):
+            return left
+        if self._is_value(right, 1):
+            return left
+        return ast.BinOp(left=left, op=ast.Div(), right=right)
+
+    def _pow(self, base, exponent):
+        if self._is_value(exponent, 1):
+            return base
+        if self._is_value(exponent, 0):
+            return self._number(1)
+        return ast.BinOp(left=base, op=ast.Pow(), right=exponent)
+
+
+class _Substitute(ast.NodeTransformer):
+    """Sustituir el argumento u de una plantilla de derivada."""
+
+    def __init__(self, argument):
+        self.argument = argument
+
+    def visit_Name(self, node):
+        if node.id == 'u':
+            return copy.deepcopy(self.argument)
+        return node
+
+
+# Instancia global del derivador
+_differentiator = ExpressionDifferentiator()
+
+
+@lru_cache(maxsize=256)
+def differentiate_expression(expression: str, variable: str) -> str:
+    """
+    Derivar simbólicamente una expresión de f(x, y).
+
+    Args:
+        expression (str): Expresión matemática
+        variable (str): 'x', 'y' o el nombre de un parámetro
+
+    Returns:
+        str: Expresión de la derivada parcial
+
+    Raises:
+        ValueError: Si la expresión contiene algo no derivable
+    """
+    return _differentiator.differentiate(expression, variable)
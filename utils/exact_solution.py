@@ -0,0 +1,330 @@
+import multiprocessing
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from queue import Full
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import sympy as sp
+
+from config import Config
+from utils.parser import validate_function
+
+
+# Traducción de los nombres permitidos por el parser a sympy
+SYMPY_NAMES = {
+    'sin': sp.sin, 'cos': sp.cos, 'tan': sp.tan,
+    'arcsin': sp.asin, 'arccos': sp.acos, 'arctan': sp.atan,
+    'asin': sp.asin, 'acos': sp.acos, 'atan': sp.atan,
+    'sinh': sp.sinh, 'cosh': sp.cosh, 'tanh': sp.tanh,
+    'arcsinh': sp.asinh, 'arccosh': sp.acosh, 'arctanh': sp.atanh,
+    'exp': sp.exp, 'log': sp.log, 'ln': sp.log,
+    'log10': lambda arg: sp.log(arg, 10),
+    'log2': lambda arg: sp.log(arg, 2),
+    'sqrt': sp.sqrt, 'pow': sp.Pow, 'abs': sp.Abs, 'fabs': sp.Abs,
+    'floor': sp.floor, 'ceil': sp.ceiling,
+    'factorial': sp.factorial,
+    'pi': sp.pi, 'e': sp.E, 'euler': sp.E, 'inf': sp.oo,
+}
+
+# Variable independiente de las soluciones cerradas
+X = sp.Symbol('x', real=True)
+
+
+def find_closed_form(expression: str, x0: float, y0: float, parameters: Tuple = ()):
+    """
+    Ejecutar dsolve con la condición inicial y elegir la rama que la cumple.
+
+    Args:
+        expression (str): Función f(x, y) ya validada
+        x0 (float): Valor inicial de x
+        y0 (float): Valor inicial de y
+        parameters (tuple): Pares (nombre, valor) de los parámetros
+
+    Returns:
+        sympy.Expr: Solución y(x) en forma cerrada, o None si sympy no
+            encuentra una solución explícita
+    """
+    y = sp.Function('y')
+    names = dict(SYMPY_NAMES, x=X, y=y(X))
+    # Los parámetros se sustituyen por sus valores exactos
+    names.update({name: sp.nsimplify(value, rational=True) for name, value in parameters})
+
+    try:
+        rhs = sp.parse_expr(expression, local_dict=names)
+        x0_exact = sp.nsimplify(x0, rational=True)
+        y0_exact = sp.nsimplify(y0, rational=True)
+        solutions = sp.dsolve(sp.Eq(y(X).diff(X), rhs), y(X), ics={y(x0_exact): y0_exact})
+    except Exception:
+        return None
+
+    if not isinstance(solutions, list):
+        solutions = [solutions]
+
+    for solution in solutions:
+        closed_form = solution.rhs
+        if closed_form.has(y) or closed_form.free_symbols - {X}:
+            continue
+
+        try:
+            value_at_x0 = complex(sp.lambdify(X, closed_form, modules='numpy')(np.float64(x0)))
+        except Exception:
+            continue
+
+        # Con varias ramas, quedarse con la que cumple la condición inicial
+        if abs(value_at_x0.imag) < 1e-9 and np.isclose(value_at_x0.real, y0):
+            return closed_form
+
+    return None
+
+
+def _dsolve_process(connection, *key):
+    """Punto de entrada del proceso hijo: enviar la forma cerrada (o None) por la tubería."""
+    try:
+        connection.send(find_closed_form(*key))
+    finally:
+        connection.close()
+
+
+class ExactSolver:
+    """
+    Buscador de soluciones analíticas de dy/dx = f(x, y) con sympy ``dsolve``.
+
+    ``dsolve`` puede tardar segundos (o no terminar) para funciones no
+    triviales y no se puede interrumpir desde otro hilo, así que cada
+    búsqueda corre en un proceso hijo que se mata al llegar al plazo. Unos
+    pocos hilos vigilan esos procesos (como mucho ``max_workers`` a la vez),
+    la cola de búsquedas pendientes está acotada y las soluciones (o su
+    ausencia, también por plazo agotado) se guardan en una caché LRU por
+    (expresión, x0, y0, parámetros).
+    """
+
+    def __init__(self, cache_size=256, max_workers=2, deadline=10.0, max_pending=16):
+        """
+        Inicializar el buscador de soluciones exactas.
+
+        Args:
+            cache_size (int): Número máximo de soluciones en caché
+            max_workers (int): Procesos de dsolve simultáneos
+            deadline (float): Segundos de vida de cada proceso de dsolve
+            max_pending (int): Búsquedas en curso o en cola admitidas
+        """
+        self.cache_size = cache_size
+        self.deadline = deadline
+        self.max_pending = max_pending
+        self._cache = OrderedDict()
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix='dsolve')
+        methods = multiprocessing.get_all_start_methods()
+        self._context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+        if self._context.get_start_method() == 'forkserver':
+            # sympy se importa una vez en el servidor y cada proceso hijo nace con él
+            self._context.set_forkserver_preload([__name__])
+
+    def submit(self, expression: str, x0: float, y0: float, parameters: Dict = None) -> Future:
+        """
+        Solicitar la solución exacta sin bloquear.
+
+        Las peticiones concurrentes del mismo problema comparten el mismo
+        cálculo, y un resultado en caché se devuelve como futuro ya resuelto.
+        Con la cola llena el futuro falla con ``queue.Full``.
+
+        Args:
+            expression (str): Función f(x, y) ya validada
+            x0 (float): Valor inicial de x
+            y0 (float): Valor inicial de y
+            parameters (dict, optional): Valores de los parámetros con nombre
+
+        Returns:
+            Future: Futuro con un diccionario {'expression', 'function'} o None
+        """
+        key = (expression, float(x0), float(y0), tuple(sorted((parameters or {}).items())))
+
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                future = Future()
+                future.set_result(self._cache[key])
+                return future
+
+            if key in self._pending:
+                return self._pending[key]
+
+            if len(self._pending) >= self.max_pending:
+                future = Future()
+                future.set_exception(Full())
+                return future
+
+            future = self._executor.submit(self._solve, *key)
+            self._pending[key] = future
+
+        # Guardar en caché al terminar, aunque la petición ya no espere
+        future.add_done_callback(lambda done: self._store(key, done))
+        return future
+
+    def _store(self, key: Tuple, future: Future):
+        """Mover un cálculo terminado de pendientes a la caché."""
+        with self._lock:
+            self._pending.pop(key, None)
+            if future.cancelled() or future.exception() is not None:
+                return
+            self._cache[key] = future.result()
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def _solve(self, expression: str, x0: float, y0: float, parameters: Tuple = ()) -> Optional[Dict]:
+        """
+        Ejecutar dsolve en un proceso hijo con plazo y compilar la solución.
+
+        Returns:
+            dict: {'expression': str, 'function': callable vectorizado} o None
+                si sympy no encuentra una solución explícita a tiempo
+        """
+        receiver, sender = self._context.Pipe(duplex=False)
+        process = self._context.Process(target=_dsolve_process,
+                                        args=(sender, expression, x0, y0, parameters), daemon=True)
+        process.start()
+        sender.close()
+
+        try:
+            closed_form = receiver.recv() if receiver.poll(self.deadline) else None
+        except EOFError:
+            # El proceso murió sin responder
+            closed_form = None
+        finally:
+            receiver.close()
+            process.terminate()
+            process.join(1.0)
+            if process.is_alive():
+                process.kill()
+                process.join()
+
+        if closed_form is None:
+            return None
+        return {'expression': str(closed_form),
+                'function': sp.lambdify(X, closed_form, modules='numpy')}
+
+
+def evaluate_exact(solution: Dict, x_values) -> np.ndarray:
+    """
+    Evaluar la solución cerrada sobre una malla de x de forma vectorizada.
+
+    Args:
+        solution (dict): Solución devuelta por ExactSolver
+        x_values (array-like): Malla de evaluación
+
+    Returns:
+        np.ndarray: Valores y(x); NaN donde la solución no es real o finita
+    """
+    x_array = np.asarray(x_values, dtype=float)
+    with np.errstate(all='ignore'):
+        values = np.broadcast_to(solution['function'](x_array), x_array.shape)
+        values = np.asarray(values, dtype=complex)
+
+    real_values = values.real.copy()
+    real_values[np.abs(values.imag) > 1e-9] = np.nan
+    real_values[~np.isfinite(real_values)] = np.nan
+    return real_values
+
+
+def error_metrics(y_numeric, y_exact, x_values) -> Dict[str, float]:
+    """
+    Calcular métricas de error de la solución numérica frente a la exacta.
+
+    La norma L2 discreta se pondera con la separación real de los puntos
+    comparados (regla del trapecio), que no es h en la salida densa ni en
+    las trazas submuestreadas.
+
+    Args:
+        y_numeric (array-like): Valores del método numérico
+        y_exact (array-like): Valores exactos en los mismos puntos
+        x_values (array-like): Puntos comparados
+
+    Returns:
+        dict: Error máximo, error L2 discreto y error en el punto final
+    """
+    errors = np.abs(np.asarray(y_numeric, dtype=float) - np.asarray(y_exact, dtype=float))
+    x_array = np.asarray(x_values, dtype=float)
+    order = np.argsort(x_array, kind='stable')
+    squared = errors[order] ** 2
+    l2_squared = np.sum(np.diff(x_array[order]) * (squared[1:] + squared[:-1]) / 2)
+    return {
+        'max_error': float(np.max(errors)),
+        'l2_error': float(np.sqrt(l2_squared)),
+        'final_error': float(errors[-1]),
+    }
+
+
+# Instancia global del buscador de soluciones exactas
+_exact_solver = ExactSolver(cache_size=Config.EXACT_SOLUTION_CACHE_SIZE,
+                            max_workers=Config.EXACT_SOLUTION_WORKERS,
+                            deadline=Config.EXACT_SOLUTION_DEADLINE,
+                            max_pending=Config.EXACT_SOLUTION_MAX_PENDING)
+
+
+def request_exact_solution(expression: str, x0: float, y0: float,
+                           parameters: Dict = None) -> Optional[Future]:
+    """
+    Lanzar en segundo plano la búsqueda de la solución exacta.
+
+    Args:
+        expression (str): Función f(x, y)
+        x0 (float): Valor inicial de x
+        y0 (float): Valor inicial de y
+        parameters (dict, optional): Valores de los parámetros con nombre
+
+    Returns:
+        Future: Futuro de la solución, o None si la expresión no es válida
+    """
+    if not validate_function(expression, parameters or ()):
+        return None
+    return _exact_solver.submit(expression, x0, y0, parameters)
+
+
+def attach_exact_solution(results: Dict, future: Optional[Future], timeout: float) -> Dict:
+    """
+    Añadir la solución exacta y las métricas de error a unos resultados.
+
+    Si la solución no llega a tiempo o no existe, los resultados se devuelven
+    con ``summary['exact_status']`` explicando el motivo y sin errores.
+
+    Args:
+        results (dict): Resultados de un método numérico
+        future (Future): Futuro devuelto por request_exact_solution
+        timeout (float): Segundos máximos de espera
+
+    Returns:
+        dict: Los mismos resultados, ampliados
+    """
+    summary = results['summary']
+
+    try:
+        solution = future.result(timeout=timeout) if future is not None else None
+    except FutureTimeoutError:
+        summary['exact_status'] = f'Tiempo agotado buscando solución exacta ({timeout}s)'
+        return results
+    except Full:
+        summary['exact_status'] = 'Demasiadas búsquedas de solución exacta en curso; inténtelo más tarde'
+        return results
+    except Exception:
+        solution = None
+
+    if solution is None:
+        summary['exact_status'] = 'No se encontró solución exacta'
+        return results
+
+    plot_data = results['plot_data']
+    y_exact = evaluate_exact(solution, plot_data['x_values'])
+    if np.isnan(y_exact).any():
+        summary['exact_status'] = 'La solución exacta no es real en todo el intervalo'
+        return results
+
+    plot_data['y_exact'] = y_exact.tolist()
+    summary['exact_solution'] = f"y(x) = {solution['expression']}"
+    summary['exact_status'] = 'ok'
+    summary.update(error_metrics(plot_data['y_values'], y_exact, plot_data['x_values']))
+    return results
@@ -0,0 +1,175 @@
+import io
+from typing import Iterator, List, Tuple
+
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+
+# Formatos de exportación: extensión -> tipo MIME
+EXPORT_FORMATS = {
+    'csv': 'text/csv',
+    'npy': 'application/octet-stream',
+    'parquet': 'application/vnd.apache.parquet',
+}
+
+
+def solution_columns(method) -> List[Tuple[str, np.ndarray]]:
+    """
+    Obtener las columnas de una solución ya integrada.
+
+    Args:
+        method (ODEMethod): Método tras llamar a integrate() o solve()
+
+    Returns:
+        list: Pares (nombre, array) con x, y y las etapas del método
+    """
+    columns = [('x', method.x_values), ('y', method.y_values)]
+    for attr in method.STAGE_ATTRS:
+        name = attr[:-len('_values')] if attr.endswith('_values') else attr
+        columns.append((name, getattr(method, attr)))
+    return columns
+
+
+def stream_csv(columns, chunk_rows=4096) -> Iterator[str]:
+    """
+    Generar un CSV por bloques de filas.
+
+    Args:
+        columns (list): Pares (nombre, array) de igual longitud
+        chunk_rows (int): Filas por bloque
+
+    Yields:
+        str: Cabecera y bloques de filas
+    """
+    names = [name for name, _ in columns]
+    arrays = [array for _, array in columns]
+    total_rows = len(arrays[0])
+    # %.17g conserva todos los dígitos significativos de un float64; %.9g, los de un float32
+    fmt = '%.9g' if np.result_type(*arrays) == np.float32 else '%.17g'
+
+    yield ','.join(names) + '\n'
+
+    for start in range(0, total_rows, chunk_rows):
+        block = np.column_stack([array[start:start + chunk_rows] for array in arrays])
+        buffer = io.StringIO()
+        np.savetxt(buffer, block, delimiter=',', fmt=fmt)
+        yield buffer.getvalue()
+
+
+def stream_npy(columns, chunk_bytes=1 << 20) -> Iterator[bytes]:
+    """
+    Generar un archivo ``.npy`` 2D (filas x columnas) directamente de los buffers.
+
+    La cabecera declara orden Fortran, así que los datos son las columnas
+    una tras otra y se copian tal cual desde la memoria de cada array, sin
+    apilarlas ni pasar por listas de Python.
+
+    Args:
+        columns (list): Pares (nombre, array) de igual longitud
+        chunk_bytes (int): Tamaño de cada bloque de datos
+
+    Yields:
+        bytes: Cabecera y bloques de datos
+    """
+    arrays = [array for _, array in columns]
+    dtype = np.result_type(*arrays)
+
+    header = io.BytesIO()
+    np.lib.format.write_array_header_1_0(header, {
+        'descr': np.lib.format.dtype_to_descr(dtype),
+        'fortran_order': True,
+        'shape': (len(arrays[0]), len(arrays)),
+    })
+    yield header.getvalue()
+
+    for array in arrays:
+        data = memoryview(np.ascontiguousarray(array, dtype=dtype)).cast('B')
+        for start in range(0, len(data), chunk_bytes):
+            yield bytes(data[start:start + chunk_bytes])
+
+
+class _ChunkSink(io.RawIOBase):
+    """Archivo en memoria que entrega lo escrito por bloques y lo descarta."""
+
+    def __init__(self):
+        super().__init__()
+        self._chunks = []
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def drain(self) -> bytes:
+        """Devolver y olvidar lo escrito desde la última llamada."""
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def stream_parquet(columns, row_group_rows=65536) -> Iterator[bytes]:
+    """
+    Generar un archivo Parquet columnar por grupos de filas (requiere pyarrow).
+
+    Args:
+        columns (list): Pares (nombre, array) de igual longitud
+        row_group_rows (int): Filas por grupo de filas
+
+    Yields:
+        bytes: Bloques del archivo Parquet
+    """
+    if not PARQUET_AVAILABLE:
+        raise RuntimeError("La exportación Parquet requiere pyarrow (pip install pyarrow)")
+
+    names = [name for name, _ in columns]
+    arrays = [array for _, array in columns]
+    schema = pa.schema([(name, pa.from_numpy_dtype(array.dtype)) for name, array in columns])
+
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema)
+    try:
+        for start in range(0, len(arrays[0]), row_group_rows):
+            # pa.array sobre una porción de un array NumPy no copia los datos
+            batch = pa.record_batch([pa.array(array[start:start + row_group_rows]) for array in arrays],
+                                    names=names)
+            writer.write_batch(batch)
+            chunk = sink.drain()
+            if chunk:
+                yield chunk
+    finally:
+        writer.close()
+    yield sink.drain()
+
+
+def stream_solution(method, fmt: str) -> Iterator:
+    """
+    Generar la exportación de una solución en el formato pedido.
+
+    Args:
+        method (ODEMethod): Método ya integrado
+        fmt (str): 'csv', 'npy' o 'parquet'
+
+    Returns:
+        iterator: Bloques del archivo
+    """
+    columns = solution_columns(method)
+    if fmt == 'csv':
+        return stream_csv(columns)
+    if fmt == 'npy':
+        return stream_npy(columns)
+    if fmt == 'parquet':
+        return stream_parquet(columns)
+    raise ValueError(f"Formato de exportación no soportado: {fmt}")
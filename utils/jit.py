@@ -0,0 +1,316 @@
+import ast
+import threading
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+from utils.parser import FunctionEvaluator, _parse_expression
+
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    numba = None
+    NUMBA_AVAILABLE = False
+
+
+class JITCompiler:
+    """
+    Compilador opcional (Numba) de expresiones y bucles de integración.
+
+    Traduce el AST ya validado por FunctionEvaluator a código Python que
+    Numba compila a máquina, y fusiona el bucle completo de un método de paso
+    fijo en un único kernel compilado. Los kernels se guardan en caché por
+    (expresión, método), ya que compilar cuesta del orden de un segundo.
+    """
+
+    # Traducción de funciones permitidas a funciones soportadas por Numba
+    JIT_FUNCTIONS = {
+        'sin': 'np.sin', 'cos': 'np.cos', 'tan': 'np.tan',
+        'arcsin': 'np.arcsin', 'arccos': 'np.arccos', 'arctan': 'np.arctan',
+        'asin': 'np.arcsin', 'acos': 'np.arccos', 'atan': 'np.arctan',
+        'sinh': 'np.sinh', 'cosh': 'np.cosh', 'tanh': 'np.tanh',
+        'arcsinh': 'np.arcsinh', 'arccosh': 'np.arccosh', 'arctanh': 'np.arctanh',
+        'exp': 'np.exp', 'log': 'np.log', 'ln': 'np.log',
+        'log10': 'np.log10', 'log2': 'np.log2',
+        'sqrt': 'np.sqrt', 'pow': 'np.power', 'abs': 'np.abs', 'fabs': 'np.abs',
+        'floor': 'np.floor', 'ceil': 'np.ceil',
+    }
+
+    OPERATORS = {
+        ast.Add: '+', ast.Sub: '-', ast.Mult: '*', ast.Div: '/', ast.Pow: '**',
+        ast.USub: '-', ast.UAdd: '+',
+    }
+
+    # Comprobación de divergencia tras cada paso (mismos códigos que DivergenceGuard)
+    CHECK = '''
+        if not (np.isfinite(y_next) and np.isfinite(k1_next)):
+            status = 1
+        elif abs(y_next) > max_magnitude:
+            status = 2
+        elif abs(y_next - y) > max_growth * max(abs(y), 1.0):
+            status = 3
+        if status:
+            break'''
+
+    # Plantilla del kernel que guarda cada paso (modo normal)
+    FULL_KERNEL = '''
+def kernel(x0, y0, h, n, max_magnitude, max_growth, x_out, y_out{stage_args}):
+    x = x0
+    y = y0
+    k1 = f(x, y)
+    evaluations = 1
+    status = 0
+    steps = 0
+    x_out[0] = x
+    y_out[0] = y
+    for i in range(n):
+{step}
+        x_next = x + h
+        k1_next = f(x_next, y_next)
+        evaluations += {evals_per_step}
+{check}
+{store}
+        x_out[i + 1] = x_next
+        y_out[i + 1] = y_next
+        x = x_next
+        y = y_next
+        k1 = k1_next
+        steps = i + 1
+    {first_stage}[steps] = k1
+    return steps, evaluations, status
+'''
+
+    # Plantilla del kernel que solo conserva el estado (modo lean)
+    LEAN_KERNEL = '''
+def kernel(x0, y0, h, n, max_magnitude, max_growth):
+    x = x0
+    y = y0
+    k1 = f(x, y)
+    evaluations = 1
+    status = 0
+    steps = 0
+    for i in range(n):
+{step}
+        x_next = x + h
+        k1_next = f(x_next, y_next)
+        evaluations += {evals_per_step}
+{check}
+        x = x_next
+        y = y_next
+        k1 = k1_next
+        steps = i + 1
+    return steps, x, y, evaluations, status
+'''
+
+    def __init__(self):
+        self._functions = {}
+        self._kernels = {}
+        self._lock = threading.Lock()
+
+    def expression_source(self, expression: str) -> str:
+        """
+        Traducir una expresión validada a código fuente compilable por Numba.
+
+        Args:
+            expression (str): Expresión f(x, y)
+
+        Returns:
+            str: Código Python equivalente
+
+        Raises:
+            ValueError: Si la expresión usa algo no soportado por el backend
+        """
+        return self._node_source(_parse_expression(expression).body)
+
+    def _node_source(self, node: ast.AST) -> str:
+        """Traducir un nodo del AST, con la misma lista blanca que el evaluador."""
+        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+            return repr(float(node.value))
+
+        if isinstance(node, ast.Name):
+            if node.id in ('x', 'y'):
+                return node.id
+            if node.id in FunctionEvaluator.ALLOWED_CONSTANTS:
+                return repr(float(FunctionEvaluator.ALLOWED_CONSTANTS[node.id]))
+            raise ValueError(f"Variable no permitida: {node.id}")
+
+        if isinstance(node, ast.BinOp) and type(node.op) in self.OPERATORS:
+            return (f"({self._node_source(node.left)} {self.OPERATORS[type(node.op)]} "
+                    f"{self._node_source(node.right)})")
+
+        if isinstance(node, ast.UnaryOp) and type(node.op) in self.OPERATORS:
+            return f"({self.OPERATORS[type(node.op)]}{self._node_source(node.operand)})"
+
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
+            if node.func.id not in self.JIT_FUNCTIONS:
+                raise ValueError(f"Función no soportada por el backend JIT: {node.func.id}")
+            args = ', '.join(self._node_source(arg) for arg in node.args)
+            return f"{self.JIT_FUNCTIONS[node.func.id]}({args})"
+
+        raise ValueError(f"Tipo de nodo no soportado por el backend JIT: {type(node).__name__}")
+
+    def compile_function(self, expression: str) -> Callable:
+        """
+        Compilar f(x, y) a una función Numba (con caché por expresión).
+
+        Args:
+            expression (str): Expresión f(x, y) validada
+
+        Returns:
+            callable: Función compilada f(x, y) -> float
+        """
+        with self._lock:
+            if expression in self._functions:
+                return self._functions[expression]
+
+        source = f"def f(x, y):\n    return {self.expression_source(expression)}\n"
+        namespace = {'np': np}
+        exec(compile(source, '<jit-expression>', 'exec'), namespace)
+        function = numba.njit(inline='always', error_model='numpy')(namespace['f'])
+
+        with self._lock:
+            return self._functions.setdefault(expression, function)
+
+    def compile_kernel(self, expression: str, method_class, lean: bool = False) -> Callable:
+        """
+        Compilar el bucle de integración completo de un método para f(x, y).
+
+        Args:
+            expression (str): Expresión f(x, y) validada
+            method_class (type): Clase con JIT_STEP_SOURCE y STAGE_ATTRS
+            lean (bool): Generar el kernel que solo conserva el estado final
+
+        Returns:
+            callable: Kernel compilado
+        """
+        key = (expression, method_class.__name__, lean)
+        with self._lock:
+            if key in self._kernels:
+                return self._kernels[key]
+
+        function = self.compile_function(expression)
+        step = self._indent(method_class.JIT_STEP_SOURCE, 8)
+        stage_names = [f's{index}' for index in range(len(method_class.STAGE_ATTRS))]
+
+        if lean:
+            source = self.LEAN_KERNEL.format(step=step, check=self.CHECK,
+                                             evals_per_step=method_class.EVALS_PER_STEP)
+        else:
+            store = '\n'.join(f"        {array}[i] = {value}"
+                              for array, value in zip(stage_names, method_class.JIT_STAGES))
+            source = self.FULL_KERNEL.format(
+                stage_args=''.join(f', {name}' for name in stage_names),
+                step=step,
+                check=self.CHECK,
+                store=store,
+                evals_per_step=method_class.EVALS_PER_STEP,
+                first_stage=stage_names[0]
+            )
+
+        namespace = {'np': np, 'f': function}
+        exec(compile(source, f'<jit-kernel-{method_class.__name__}>', 'exec'), namespace)
+        kernel = numba.njit(nogil=True, error_model='numpy')(namespace['kernel'])
+
+        with self._lock:
+            return self._kernels.setdefault(key, kernel)
+
+    @staticmethod
+    def _indent(source: str, spaces: int) -> str:
+        """Indentar un bloque de código fuente."""
+        prefix = ' ' * spaces
+        return '\n'.join(prefix + line.strip() for line in source.strip().splitlines())
+
+
+# Instancia global del compilador
+_compiler = JITCompiler()
+
+
+def jit_supported(expression: str, method_class) -> bool:
+    """
+    Comprobar si una expresión y un método pueden usar el backend JIT.
+
+    Args:
+        expression (str): Expresión f(x, y)
+        method_class (type): Clase del método
+
+    Returns:
+        bool: True si Numba está instalado y ambos son traducibles
+    """
+    if not NUMBA_AVAILABLE or not getattr(method_class, 'JIT_STEP_SOURCE', None):
+        return False
+    try:
+        _compiler.expression_source(expression)
+        return True
+    except (ValueError, SyntaxError):
+        return False
+
+
+def compiled_function(expression: str) -> Optional[Callable]:
+    """
+    Compilar f(x, y) para llamarla desde Python (ej: desde SciPy).
+
+    Args:
+        expression (str): Expresión f(x, y) validada
+
+    Returns:
+        callable: Función compilada f(x, y) -> float, o None si Numba no está
+            instalado o la expresión no es traducible
+    """
+    if not NUMBA_AVAILABLE:
+        return None
+    try:
+        return _compiler.compile_function(expression)
+    except (ValueError, SyntaxError):
+        return None
+
+
+def run_kernel(method, lean: bool = False, start=0, num_steps=None) -> Tuple:
+    """
+    Ejecutar la integración de un método con su kernel compilado.
+
+    En modo normal llena los arrays ya reservados del método; en modo lean
+    solo devuelve el estado final. El kernel se detiene en el primer paso
+    divergente según la guarda del método (sin guarda, solo ante valores no
+    finitos).
+
+    Args:
+        method (ODEMethod): Método con los arrays reservados (modo normal)
+        lean (bool): Usar el kernel que solo conserva el estado final
+        start: Punto de partida para continuar una integración: en modo
+            normal, el índice ya rellenado de los arrays; en modo lean, la
+            tupla (paso, x, y). 0 parte de (x0, y0)
+        num_steps (int, optional): Pasos a integrar (por defecto, hasta el final)
+
+    Returns:
+        tuple: (pasos completados, evaluaciones, estado) en modo normal, o
+            (pasos completados, x, y, evaluaciones, estado) en modo lean;
+            los pasos se cuentan desde el punto de partida y estado es 0 o
+            el código de DivergenceGuard
+    """
+    kernel = _compiler.compile_kernel(method.function_str, type(method), lean=lean)
+    h = float(method.h)
+
+    guard = method.guard
+    max_magnitude = guard.max_magnitude if guard else np.inf
+    max_growth = guard.max_growth if guard else np.inf
+
+    if lean:
+        step, x0, y0 = start if start else (0, method.x0, method.y0)
+        if num_steps is None:
+            num_steps = method.num_steps - step
+        return kernel(float(x0), float(y0), h, num_steps, max_magnitude, max_growth)
+
+    if num_steps is None:
+        num_steps = method.num_steps - start
+    stage_arrays = [getattr(method, attr)[start:] for attr in method.STAGE_ATTRS]
+    # Al continuar, el estado en float64 del punto de control (los arrays
+    # pueden estar en un tipo más corto)
+    state = method.resume_from
+    if start and state is not None and state['step'] == start:
+        x_start, y_start = state['x'], state['y']
+    else:
+        x_start, y_start = method.x_values[start], method.y_values[start]
+    return kernel(float(x_start), float(y_start), h, num_steps,
+                  max_magnitude, max_growth,
+                  method.x_values[start:], method.y_values[start:], *stage_arrays)
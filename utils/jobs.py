@@ -0,0 +1,212 @@
+import multiprocessing
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+
+from config import Config
+
+
+class JobQueue:
+    """
+    Cola en segundo plano para las resoluciones demasiado largas para
+    responder en la misma petición.
+
+    Cada trabajo recibe un identificador con el que se consulta su estado;
+    los resultados terminados se conservan (los más recientes) hasta que
+    alguien los recoge.
+    """
+
+    def __init__(self, max_workers=1, max_pending=16, max_results=64):
+        """
+        Inicializar la cola.
+
+        Args:
+            max_workers (int): Hilos que ejecutan trabajos
+            max_pending (int): Máximo de trabajos en espera o en ejecución
+            max_results (int): Máximo de trabajos terminados conservados
+        """
+        self.max_pending = max_pending
+        self.max_results = max_results
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='solve-job')
+        self._jobs = OrderedDict()
+        self._active = 0
+        self._lock = threading.Lock()
+
+        # Funciones a llamar cuando termine cada trabajo (esperas largas)
+        self._callbacks = {}
+
+    def submit(self, function: Callable[[], Dict], description: Optional[Dict] = None) -> Optional[str]:
+        """
+        Encolar un trabajo.
+
+        Args:
+            function (callable): Función sin argumentos que devuelve el resultado (dict)
+            description (dict, optional): Datos del trabajo a mostrar en su estado
+
+        Returns:
+            str: Identificador del trabajo, o None si la cola está llena
+        """
+        with self._lock:
+            if self._active >= self.max_pending:
+                return None
+            job_id = uuid.uuid4().hex
+            self._jobs[job_id] = {'status': 'pending', 'description': description or {}}
+            self._active += 1
+            self._trim()
+
+        self._executor.submit(self._run, job_id, function)
+        return job_id
+
+    def _run(self, job_id: str, function: Callable[[], Dict]):
+        """Ejecutar un trabajo y guardar su resultado o su error."""
+        self._update(job_id, status='running')
+        try:
+            self._update(job_id, status='done', result=function())
+        except Exception as e:
+            self._update(job_id, status='error', error=str(e))
+        finally:
+            with self._lock:
+                self._active -= 1
+                callbacks = self._callbacks.pop(job_id, [])
+            for callback in callbacks:
+                callback()
+
+    def _update(self, job_id: str, **fields):
+        with self._lock:
+            if job_id in self._jobs:
+                self._jobs[job_id].update(fields)
+
+    def _trim(self):
+        """Olvidar los trabajos terminados más antiguos por encima del máximo."""
+        finished = [job_id for job_id, job in self._jobs.items() if job['status'] in ('done', 'error')]
+        for job_id in finished[:max(0, len(finished) - self.max_results)]:
+            del self._jobs[job_id]
+
+    def add_done_callback(self, job_id: str, callback: Callable[[], None]) -> bool:
+        """
+        Llamar a ``callback`` (sin argumentos, desde el hilo del trabajo)
+        cuando el trabajo termine; en el acto si ya terminó.
+
+        Returns:
+            bool: False si el trabajo no existe
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return False
+            finished = job['status'] in ('done', 'error')
+            if not finished:
+                self._callbacks.setdefault(job_id, []).append(callback)
+        if finished:
+            callback()
+        return True
+
+    def remove_done_callback(self, job_id: str, callback: Callable[[], None]):
+        """Olvidar una función registrada con add_done_callback (espera abandonada)."""
+        with self._lock:
+            callbacks = self._callbacks.get(job_id, [])
+            if callback in callbacks:
+                callbacks.remove(callback)
+            if not callbacks:
+                self._callbacks.pop(job_id, None)
+
+    def wait(self, job_id: str, timeout: float) -> Optional[Dict]:
+        """
+        Esperar (bloqueando el hilo) a que un trabajo termine.
+
+        Args:
+            job_id (str): Identificador del trabajo
+            timeout (float): Segundos máximos de espera
+
+        Returns:
+            dict: Estado del trabajo al terminar o al agotar la espera, o
+                None si no existe
+        """
+        finished = threading.Event()
+        if not self.add_done_callback(job_id, finished.set):
+            return None
+        if not finished.wait(timeout):
+            self.remove_done_callback(job_id, finished.set)
+        return self.status(job_id)
+
+    def status(self, job_id: str) -> Optional[Dict]:
+        """
+        Consultar un trabajo.
+
+        Returns:
+            dict: Estado ('pending', 'running', 'done' o 'error') con el
+                resultado o el error, o None si no existe
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job, job_id=job_id) if job is not None else None
+
+
+# Instancia global de la cola
+_job_queue = JobQueue(max_workers=Config.BACKGROUND_WORKERS,
+                      max_pending=Config.BACKGROUND_MAX_PENDING,
+                      max_results=Config.BACKGROUND_MAX_RESULTS)
+
+
+def submit_job(function: Callable[[], Dict], description: Optional[Dict] = None) -> Optional[str]:
+    """Encolar un trabajo en segundo plano (ver JobQueue.submit)."""
+    return _job_queue.submit(function, description)
+
+
+def job_status(job_id: str) -> Optional[Dict]:
+    """Consultar un trabajo en segundo plano (ver JobQueue.status)."""
+    return _job_queue.status(job_id)
+
+
+def wait_for_job(job_id: str, timeout: float) -> Optional[Dict]:
+    """Esperar a que termine un trabajo en segundo plano (ver JobQueue.wait)."""
+    return _job_queue.wait(job_id, timeout)
+
+
+def add_job_callback(job_id: str, callback: Callable[[], None]) -> bool:
+    """Avisar cuando termine un trabajo (ver JobQueue.add_done_callback)."""
+    return _job_queue.add_done_callback(job_id, callback)
+
+
+def remove_job_callback(job_id: str, callback: Callable[[], None]):
+    """Cancelar un aviso (ver JobQueue.remove_done_callback)."""
+    _job_queue.remove_done_callback(job_id, callback)
+
+
+# Pool de procesos compartido para el trabajo CPU en paralelo (Parareal)
+_process_pool = None
+_process_pool_pid = None
+_process_pool_lock = threading.Lock()
+
+
+def process_pool_size() -> int:
+    """Número de procesos del pool compartido (PROCESS_POOL_WORKERS, 0 = uno por núcleo)."""
+    return Config.PROCESS_POOL_WORKERS or os.cpu_count() or 1
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """
+    Obtener el pool de procesos compartido, creándolo al primer uso.
+
+    Se crea uno por proceso servidor (tras el fork de los workers) con
+    PROCESS_POOL_WORKERS procesos (0 = uno por núcleo), y se recrea si
+    alguno de sus procesos muere. Los procesos se
+    lanzan con 'forkserver' cuando existe: hacer fork de un servidor con
+    hilos en marcha puede heredar cerrojos tomados.
+
+    Returns:
+        ProcessPoolExecutor: Pool compartido
+    """
+    global _process_pool, _process_pool_pid
+    with _process_pool_lock:
+        # Un proceso muerto (por ejemplo, por falta de memoria) inutiliza el pool: se recrea
+        if (_process_pool is None or _process_pool_pid != os.getpid()
+                or getattr(_process_pool, '_broken', False)):
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+            _process_pool = ProcessPoolExecutor(max_workers=process_pool_size(), mp_context=context)
+            _process_pool_pid = os.getpid()
+        return _process_pool
@@ -0,0 +1,342 @@
+import ast
+import struct
+from typing import Callable, Dict, Iterable, List
+
+import numpy as np
+
+
+class Chain(ast.expr):
+    """
+    Nodo optimizado: cadena asociativa por la izquierda aplanada, por
+    ejemplo ``a - b + c`` como first=a, ops=[Sub, Add], operands=[b, c].
+    Se evalúa en el mismo orden que el árbol original.
+    """
+    _fields = ('first', 'ops', 'operands')
+
+
+class ExpressionOptimizer:
+    """
+    Pase de optimización entre la validación y la evaluación de f(x, y).
+
+    Sobre el AST ya parseado:
+
+    - pliega los subárboles constantes (``2*pi/3``, ``sqrt(2)``) con las
+      mismas funciones que usaría el evaluador;
+    - aplana las cadenas asociativas por la izquierda (``a + b - c + d``)
+      para evaluarlas en un bucle, en el mismo orden;
+    - y compila el resultado a clausuras con las funciones, constantes y
+      operadores ya resueltos, sin buscar por nombre en cada evaluación.
+
+    El resultado es idéntico bit a bit al del evaluador de referencia
+    (``FunctionEvaluator._eval_node``); ver check_equivalence. Por eso las
+    potencias se dejan a ``pow``: ``x*x`` no coincide con ``x**2`` (pow de
+    libm no siempre redondea igual y desborda con OverflowError, no con inf).
+    """
+
+    # Operadores de las cadenas que se aplanan (misma precedencia, asociativos por la izquierda)
+    CHAIN_GROUPS = {ast.Add: 'sum', ast.Sub: 'sum', ast.Mult: 'product', ast.Div: 'product'}
+
+    def __init__(self, operators: Dict, functions: Dict, constants: Dict):
+        """
+        Inicializar el optimizador.
+
+        Args:
+            operators (dict): Tipo de operador del AST -> función (lista blanca)
+            functions (dict): Nombre -> función permitida
+            constants (dict): Nombre -> valor de las constantes permitidas
+        """
+        self.operators = operators
+        self.functions = functions
+        self.constants = constants
+
+    # ------------------------------------------------------------------
+    # Optimización del árbol
+    # ------------------------------------------------------------------
+
+    def optimize(self, node: ast.AST) -> ast.AST:
+        """
+        Devolver una versión optimizada del árbol (el original no se modifica).
+
+        Args:
+            node (ast.AST): Cuerpo de la expresión parseada
+
+        Returns:
+            ast.AST: Árbol con constantes plegadas y cadenas aplanadas
+        """
+        return self._flatten(self._fold(node))
+
+    def _fold(self, node):
+        """Plegar los subárboles constantes, de abajo arriba."""
+        if isinstance(node, ast.Name) and node.id not in ('x', 'y') and node.id in self.constants:
+            return ast.Constant(self.constants[node.id])
+
+        if isinstance(node, ast.BinOp):
+            left, right = self._fold(node.left), self._fold(node.right)
+            folded = ast.BinOp(left=left, op=node.op, right=right)
+            operator = self.operators.get(type(node.op))
+            if operator and self._is_number(left) and self._is_number(right):
+                # Una división por cero (u otro error) se deja para la evaluación
+                if not (isinstance(node.op, ast.Div) and right.value == 0):
+                    return self._try_constant(folded, operator, left.value, right.value)
+            return folded
+
+        if isinstance(node, ast.UnaryOp):
+            operand = self._fold(node.operand)
+            folded = ast.UnaryOp(op=node.op, operand=operand)
+            operator = self.operators.get(type(node.op))
+            if operator and self._is_number(operand):
+                return self._try_constant(folded, operator, operand.value)
+            return folded
+
+        if isinstance(node, ast.Call):
+            args = [self._fold(arg) for arg in node.args]
+            folded = ast.Call(func=node.func, args=args, keywords=node.keywords)
+            name = node.func.id if isinstance(node.func, ast.Name) else None
+            if name in self.functions and all(self._is_number(arg) for arg in args):
+                return self._try_constant(folded, self.functions[name], *(arg.value for arg in args))
+            return folded
+
+        return node
+
+    @staticmethod
+    def _is_number(node) -> bool:
+        return isinstance(node, ast.Constant) and isinstance(node.value, (int, float, np.number)) \
+            and not isinstance(node.value, bool)
+
+    @staticmethod
+    def _try_constant(node, function, *args):
+        """Calcular un nodo constante; si falla, conservarlo para la evaluación."""
+        try:
+            return ast.Constant(function(*args))
+        except Exception:
+            return node
+
+    def _flatten(self, node):
+        """Aplanar las cadenas de operadores asociativos por la izquierda."""
+        if isinstance(node, ast.BinOp) and type(node.op) in self.CHAIN_GROUPS:
+            group = self.CHAIN_GROUPS[type(node.op)]
+            ops, operands = [], []
+            current = node
+            # Bajar por la rama izquierda mientras siga la misma precedencia
+            while isinstance(current, ast.BinOp) and self.CHAIN_GROUPS.get(type(current.op)) == group:
+                ops.append(current.op)
+                operands.append(self._flatten(current.right))
+                current = current.left
+            first = self._flatten(current)
+            if len(ops) == 1:
+                return ast.BinOp(left=first, op=ops[0], right=operands[0])
+            return Chain(first=first, ops=ops[::-1], operands=operands[::-1])
+        if isinstance(node, ast.BinOp):
+            return ast.BinOp(left=self._flatten(node.left), op=node.op, right=self._flatten(node.right))
+        if isinstance(node, ast.UnaryOp):
+            return ast.UnaryOp(op=node.op, operand=self._flatten(node.operand))
+        if isinstance(node, ast.Call):
+            return ast.Call(func=node.func, args=[self._flatten(arg) for arg in node.args], keywords=node.keywords)
+        return node
+
+    # ------------------------------------------------------------------
+    # Compilación a clausuras
+    # ------------------------------------------------------------------
+
+    def compile(self, node: ast.AST) -> Callable:
+        """
+        Compilar un árbol (optimizado) a una función f(x, y, params).
+
+        Los errores de la lista blanca (operadores, funciones o nodos no
+        permitidos) se detectan aquí, con los mismos mensajes que el
+        evaluador; los de valores (división por cero, dominio de una
+        función, parámetros que faltan) al evaluar.
+
+        Args:
+            node (ast.AST): Árbol a compilar
+
+        Returns:
+            callable: f(x, y, params) -> valor
+        """
+        if isinstance(node, ast.Constant):
+            value = node.value
+            return lambda x, y, params: value
+
+        if isinstance(node, ast.Name):
+            return self._compile_name(node.id)
+
+        if isinstance(node, Chain):
+            return self._compile_chain(node)
+
+        if isinstance(node, ast.BinOp):
+            operator = self._operator(node.op, "Operador no permitido")
+            left, right = self.compile(node.left), self.compile(node.right)
+
+            if isinstance(node.op, ast.Div) and not self._nonzero_constant(node.right):
+                def divide(x, y, params):
+                    numerator = left(x, y, params)
+                    denominator = right(x, y, params)
+                    if denominator == 0:
+                        raise ValueError("División por cero")
+                    return numerator / denominator
+                return divide
+
+            if isinstance(node.right, ast.Constant):
+                # Exponente, factor o sumando constante: sin llamada para el lado derecho
+                constant = node.right.value
+                return lambda x, y, params: operator(left(x, y, params), constant)
+
+            return lambda x, y, params: operator(left(x, y, params), right(x, y, params))
+
+        if isinstance(node, ast.UnaryOp):
+            operator = self._operator(node.op, "Operador unario no permitido")
+            operand = self.compile(node.operand)
+            return lambda x, y, params: operator(operand(x, y, params))
+
+        if isinstance(node, ast.Call):
+            return self._compile_call(node)
+
+        raise ValueError(f"Tipo de nodo no soportado: {type(node).__name__}")
+
+    def _compile_name(self, name: str) -> Callable:
+        """Resolver una variable: x e y directamente, el resto como parámetro."""
+        if name == 'x':
+            return lambda x, y, params: x
+        if name == 'y':
+            return lambda x, y, params: y
+
+        def parameter(x, y, params):
+            try:
+                return params[name]
+            except (KeyError, TypeError):
+                raise ValueError(f"Variable no permitida: {name}")
+        return parameter
+
+    def _operator(self, op, message: str) -> Callable:
+        if type(op) not in self.operators:
+            raise ValueError(f"{message}: {type(op).__name__}")
+        return self.operators[type(op)]
+
+    def _nonzero_constant(self, node) -> bool:
+        """Comprobar si un divisor es una constante distinta de cero."""
+        return self._is_number(node) and node.value != 0
+
+    def _compile_chain(self, node: Chain) -> Callable:
+        """Compilar una cadena aplanada a un bucle sobre sus operandos."""
+        first = self.compile(node.first)
+        steps = []
+        for op, operand in zip(node.ops, node.operands):
+            operator = self._operator(op, "Operador no permitido")
+            checked = isinstance(op, ast.Div) and not self._nonzero_constant(operand)
+            steps.append((operator, self.compile(operand), checked))
+        steps = tuple(steps)
+
+        def chain(x, y, params):
+            value = first(x, y, params)
+            for operator, operand, checked in steps:
+                right = operand(x, y, params)
+                if checked and right == 0:
+                    raise ValueError("División por cero")
+                value = operator(value, right)
+            return value
+        return chain
+
+    def _compile_call(self, node: ast.Call) -> Callable:
+        """Compilar una llamada con la función ya resuelta."""
+        name = node.func.id if isinstance(node.func, ast.Name) else None
+        if name not in self.functions:
+            raise ValueError(f"Función no permitida: {name}")
+        function = self.functions[name]
+        args = tuple(self.compile(arg) for arg in node.args)
+
+        if len(args) == 1:
+            argument = args[0]
+
+            def call(x, y, params):
+                value = argument(x, y, params)
+                try:
+                    return function(value)
+                except Exception as e:
+                    raise ValueError(f"Error en función {name}: {str(e)}")
+            return call
+
+        def call(x, y, params):
+            values = [arg(x, y, params) for arg in args]
+            try:
+                return function(*values)
+            except Exception as e:
+                raise ValueError(f"Error en función {name}: {str(e)}")
+        return call
+
+
+# Corpus de expresiones para comprobar la equivalencia con el evaluador de referencia
+EQUIVALENCE_CORPUS = [
+    'x + y', 'x - y', 'x * y', 'x / y', 'x ** y', '-x', '+y',
+    'x*y - 2*x', 'x**2 - y**2', 'x**2 + y**2', 'y**2', 'x**3', 'y**4', 'x**2.0', 'x**0.5',
+    '2*pi/3', 'sqrt(2)*x', 'x*2*pi', '2*pi*x', 'x + 1 + 2 + y', 'x - y - 1 - 2',
+    'x / 2 / y / 3', 'x / (y - y)', '1/0 + x', 'x/0', 'y * 3 / 7 * x',
+    'sin(x) + cos(y)', 'sin(x)*cos(y)', 'exp(-x)*y', 'log(abs(y) + 1)', 'ln(e) * y',
+    'tan(pi/4) + x', 'sqrt(x**2 + y**2)', 'arctan(y/x)', 'atan(y) - asin(0.5)',
+    'sinh(x) - cosh(y) + tanh(x*y)', 'log10(100)*x + log2(8)*y', 'pow(x, 2) + pow(2, 3)',
+    'floor(x) + ceil(y)', 'round(x) - round(2.5)', 'fabs(-x) * y', 'factorial(5) * x',
+    '-(-x)', '-2**2 + x', '(-2)**2 * y', 'x - -y', '2**10 * y / 1024', '10**400 * x',
+    'x + y + x*y + x**2 + y**2 + x*y**2 + x**2*y', '((x + 1) * (y - 1)) / ((x - 2) * (y + 2))',
+    'exp(x*y) - 1', 'y - x + e - pi + euler', 'x*inf', 'log(x)', 'sqrt(y)',
+    'k*y - c', 'a*x**2 + b*x + c', 'k * (y - c) / k',
+]
+
+# Puntos de prueba (incluyen ceros con signo, extremos y valores negativos)
+EQUIVALENCE_POINTS = [
+    (0.0, 0.0), (-0.0, 1.0), (1.0, -0.0), (0.5, 0.25), (-1.5, 2.0), (3.7, -2.5),
+    (1e-200, 1e-200), (1e150, -1e150), (2.0, 3.0), (-7.25, -0.125), (np.pi, np.e),
+    (1.949115048520226e-97, 1.4541703605166023e+25),
+]
+
+EQUIVALENCE_PARAMETERS = {'k': 1.75, 'c': -0.3, 'a': 2.0, 'b': -3.0}
+
+
+def _bits(value):
+    """Representación exacta de un resultado (bits del float o mensaje del error)."""
+    if isinstance(value, Exception):
+        return ('error', type(value).__name__)
+    return ('value', struct.pack('<d', float(value)))
+
+
+def check_equivalence(expressions: Iterable[str] = None, points: Iterable = None,
+                      params: Dict[str, float] = None) -> List[Dict]:
+    """
+    Comparar bit a bit la evaluación optimizada con el evaluador de referencia.
+
+    Args:
+        expressions (iterable, optional): Expresiones (default: EQUIVALENCE_CORPUS)
+        points (iterable, optional): Pares (x, y) (default: EQUIVALENCE_POINTS)
+        params (dict, optional): Parámetros con nombre (default: EQUIVALENCE_PARAMETERS)
+
+    Returns:
+        list: Diferencias encontradas (vacía si todo coincide)
+    """
+    from utils.parser import FunctionEvaluator
+
+    expressions = EQUIVALENCE_CORPUS if expressions is None else expressions
+    points = EQUIVALENCE_POINTS if points is None else points
+    params = EQUIVALENCE_PARAMETERS if params is None else params
+
+    with np.errstate(all='ignore'):
+        return _compare(FunctionEvaluator(), expressions, points, params)
+
+
+def _compare(evaluator, expressions, points, params) -> List[Dict]:
+    """Evaluar cada expresión en cada punto por ambos caminos y anotar diferencias."""
+    mismatches = []
+    for expression in expressions:
+        for x, y in points:
+            try:
+                expected = evaluator.evaluate_reference(expression, x, y, params)
+            except Exception as e:
+                expected = e
+            try:
+                result = evaluator.evaluate(expression, x, y, params)
+            except Exception as e:
+                result = e
+
+            if _bits(expected) != _bits(result):
+                mismatches.append({'expression': expression, 'x': x, 'y': y,
+                                   'expected': repr(expected), 'result': repr(result)})
+
+    return mismatches
+
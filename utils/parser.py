@@ -2,13 +2,19 @@ import ast
 import operator
 import numpy as np
 import math
-from typing import Union, Dict, Any
+from functools import lru_cache
+from typing import Union, Dict, Any, Callable, Iterable
+
+from utils.optimizer import ExpressionOptimizer
 
 
 class FunctionEvaluator:
     """
     Evaluador seguro de funciones matemáticas para ecuaciones diferenciales.
     Permite evaluar expresiones como "x + y", "x*sin(y)", etc. de forma segura.
+
+    No guarda estado entre llamadas: los valores de las variables viajan en
+    cada evaluación, así que una misma instancia se comparte entre hilos.
     """
 
     # Operadores permitidos
@@ -73,10 +79,8 @@ class FunctionEvaluator:
         'inf': np.inf,
     }
 
-    def __init__(self):
-        self.variables = {}
-
-    def evaluate(self, expression: str, x: float = 0, y: float = 0) -> float:
+    def evaluate(self, expression: str, x: float = 0, y: float = 0,
+                 params: Dict[str, float] = None) -> float:
         """
         Evaluar una expresión matemática de forma segura.
 
@@ -84,6 +88,32 @@ class FunctionEvaluator:
             expression (str): Expresión matemática (ej: "x + y", "sin(x)*cos(y)")
             x (float): Valor de la variable x
             y (float): Valor de la variable y
+            params (dict, optional): Valores de los parámetros con nombre (ej: {"k": 2})
+
+        Returns:
+            float: Resultado de la evaluación
+
+        Raises:
+            ValueError: Si la expresión no es segura o contiene errores
+        """
+        try:
+            # Expresión optimizada y compilada a clausuras (cacheada por expresión)
+            result = _compile_expression(expression)(x, y, params)
+            return self._check_result(result)
+
+        except Exception as e:
+            raise ValueError(f"Error evaluando '{expression}': {str(e)}")
+
+    def evaluate_reference(self, expression: str, x: float = 0, y: float = 0,
+                           params: Dict[str, float] = None) -> float:
+        """
+        Evaluar recorriendo el AST sin optimizar (referencia de evaluate()).
+
+        Args:
+            expression (str): Expresión matemática
+            x (float): Valor de la variable x
+            y (float): Valor de la variable y
+            params (dict, optional): Valores de los parámetros con nombre
 
         Returns:
             float: Resultado de la evaluación
@@ -92,33 +122,75 @@ class FunctionEvaluator:
             ValueError: Si la expresión no es segura o contiene errores
         """
         # Preparar variables
-        self.variables = {'x': x, 'y': y}
+        variables = {'x': x, 'y': y}
+        if params:
+            variables.update(params)
 
         try:
-            # Parsear la expresión
-            tree = ast.parse(expression, mode='eval')
+            # Parsear la expresión (cacheado por expresión)
+            tree = _parse_expression(expression)
 
             # Evaluar el árbol AST
-            result = self._eval_node(tree.body)
-
-            # Verificar que el resultado sea un número válido
-            if isinstance(result, (int, float, np.integer, np.floating)):
-                if np.isfinite(result):
-                    return float(result)
-                else:
-                    raise ValueError(f"Resultado no finito: {result}")
+            return self._check_result(self._eval_node(tree.body, variables))
+
+        except Exception as e:
+            raise ValueError(f"Error evaluando '{expression}': {str(e)}")
+
+    @staticmethod
+    def _check_result(result) -> float:
+        """Verificar que el resultado sea un número finito."""
+        if isinstance(result, (int, float, np.integer, np.floating)):
+            if np.isfinite(result):
+                return float(result)
             else:
-                raise ValueError(f"Resultado no numérico: {type(result)}")
+                raise ValueError(f"Resultado no finito: {result}")
+        else:
+            raise ValueError(f"Resultado no numérico: {type(result)}")
+
+    def evaluate_array(self, expression: str, x: float, y: np.ndarray,
+                       params: Dict[str, np.ndarray] = None) -> np.ndarray:
+        """
+        Evaluar una expresión sobre arrays de estados y parámetros a la vez.
+
+        Se recorre el mismo árbol AST y con la misma lista blanca que
+        evaluate(), pero los operadores y funciones de NumPy se aplican
+        elemento a elemento (con broadcasting) sobre todos los valores. Los
+        resultados no finitos no se rechazan: quedan como inf/nan en su
+        posición para que el llamador los trate.
+
+        Args:
+            expression (str): Expresión matemática
+            x (float): Valor de la variable x (común a todos los elementos)
+            y (np.ndarray): Valores de la variable y
+            params (dict, optional): Arrays de parámetros, compatibles con y
+
+        Returns:
+            np.ndarray: Resultado con la forma de y
+
+        Raises:
+            ValueError: Si la expresión no es segura o contiene errores
+        """
+        variables = {'x': x, 'y': y}
+        if params:
+            variables.update(params)
 
+        try:
+            tree = _parse_expression(expression)
+            with np.errstate(all='ignore'):
+                result = np.asarray(self._eval_node(tree.body, variables), dtype=float)
         except Exception as e:
             raise ValueError(f"Error evaluando '{expression}': {str(e)}")
 
-    def _eval_node(self, node: ast.AST) -> Union[float, int]:
+        # Expresiones que no dependen de y (o de algún parámetro) se expanden
+        return np.broadcast_to(result, np.shape(y)).copy() if result.shape != np.shape(y) else result
+
+    def _eval_node(self, node: ast.AST, variables: Dict[str, Any]) -> Union[float, int]:
         """
         Evaluar un nodo del árbol AST de forma recursiva.
 
         Args:
             node: Nodo del AST
+            variables (dict): Valores de x, y y los parámetros
 
         Returns:
             Valor numérico del nodo
@@ -132,8 +204,8 @@ class FunctionEvaluator:
         elif isinstance(node, ast.Name):
             # Variable o constante
             var_name = node.id
-            if var_name in self.variables:
-                return self.variables[var_name]
+            if var_name in variables:
+                return variables[var_name]
             elif var_name in self.ALLOWED_CONSTANTS:
                 return self.ALLOWED_CONSTANTS[var_name]
             else:
@@ -141,13 +213,13 @@ class FunctionEvaluator:
 
         elif isinstance(node, ast.BinOp):
             # Operación binaria
-            left = self._eval_node(node.left)
-            right = self._eval_node(node.right)
+            left = self._eval_node(node.left, variables)
+            right = self._eval_node(node.right, variables)
             op_type = type(node.op)
 
             if op_type in self.ALLOWED_OPERATORS:
                 # Manejar división por cero
-                if op_type == ast.Div and right == 0:
+                if op_type == ast.Div and np.ndim(right) == 0 and right == 0:
                     raise ValueError("División por cero")
                 return self.ALLOWED_OPERATORS[op_type](left, right)
             else:
@@ -155,7 +227,7 @@ class FunctionEvaluator:
 
         elif isinstance(node, ast.UnaryOp):
             # Operación unaria
-            operand = self._eval_node(node.operand)
+            operand = self._eval_node(node.operand, variables)
             op_type = type(node.op)
 
             if op_type in self.ALLOWED_OPERATORS:
@@ -169,7 +241,7 @@ class FunctionEvaluator:
 
             if func_name in self.ALLOWED_FUNCTIONS:
                 func = self.ALLOWED_FUNCTIONS[func_name]
-                args = [self._eval_node(arg) for arg in node.args]
+                args = [self._eval_node(arg, variables) for arg in node.args]
 
                 try:
                     return func(*args)
@@ -182,29 +254,96 @@ class FunctionEvaluator:
             raise ValueError(f"Tipo de nodo no soportado: {type(node).__name__}")
 
 
+@lru_cache(maxsize=1024)
+def _parse_expression(expression: str) -> ast.Expression:
+    """
+    Parsear una expresión a su árbol AST, reutilizando el resultado entre llamadas.
+
+    Los métodos numéricos evalúan la misma expresión miles de veces por
+    solución; sin esta caché cada evaluación volvía a ejecutar ``ast.parse``.
+
+    Args:
+        expression (str): Expresión matemática
+
+    Returns:
+        ast.Expression: Árbol AST de la expresión (no debe modificarse)
+    """
+    return ast.parse(expression, mode='eval')
+
+
+# Optimizador con la misma lista blanca que el evaluador
+_optimizer = ExpressionOptimizer(FunctionEvaluator.ALLOWED_OPERATORS,
+                                 FunctionEvaluator.ALLOWED_FUNCTIONS,
+                                 FunctionEvaluator.ALLOWED_CONSTANTS)
+
+
+@lru_cache(maxsize=1024)
+def _compile_expression(expression: str) -> Callable:
+    """
+    Optimizar y compilar una expresión a una función f(x, y, params).
+
+    Args:
+        expression (str): Expresión matemática
+
+    Returns:
+        callable: Función compilada (ver ExpressionOptimizer)
+    """
+    tree = _parse_expression(expression)
+    return _optimizer.compile(_optimizer.optimize(tree.body))
+
+
 # Instancia global del evaluador
 _evaluator = FunctionEvaluator()
 
 
-def validate_function(expression: str) -> bool:
+def validate_parameters(names: Iterable[str]) -> list:
+    """
+    Validar los nombres de los parámetros de una expresión.
+
+    Un parámetro debe ser un identificador simple que no oculte a x, y ni a
+    ninguna función o constante permitida.
+
+    Args:
+        names (iterable): Nombres de los parámetros
+
+    Returns:
+        list: Los nombres validados
+
+    Raises:
+        ValueError: Si algún nombre no es válido
+    """
+    reserved = {'x', 'y'} | set(FunctionEvaluator.ALLOWED_FUNCTIONS) | set(FunctionEvaluator.ALLOWED_CONSTANTS)
+    names = list(names)
+    for name in names:
+        if not isinstance(name, str) or not name.isidentifier() or name.startswith('_'):
+            raise ValueError(f"Nombre de parámetro inválido: {name}")
+        if name in reserved:
+            raise ValueError(f"Nombre de parámetro reservado: {name}")
+    return names
+
+
+def validate_function(expression: str, parameters: Iterable[str] = ()) -> bool:
     """
     Validar que una expresión sea segura para evaluar.
 
     Args:
         expression (str): Expresión a validar
+        parameters (iterable, optional): Nombres de los parámetros que puede usar
 
     Returns:
         bool: True si es segura, False en caso contrario
     """
     try:
         # Intentar evaluar con valores de prueba
-        _evaluator.evaluate(expression, x=1.0, y=1.0)
+        params = {name: 1.0 for name in validate_parameters(parameters)}
+        _evaluator.evaluate(expression, x=1.0, y=1.0, params=params)
         return True
     except:
         return False
 
 
-def evaluate_function(expression: str, x: float, y: float) -> float:
+def evaluate_function(expression: str, x: float, y: float,
+                      params: Dict[str, float] = None) -> float:
     """
     Evaluar una función f(x, y) de forma segura.
 
@@ -212,6 +351,7 @@ def evaluate_function(expression: str, x: float, y: float) -> float:
         expression (str): Expresión matemática
         x (float): Valor de x
         y (float): Valor de y
+        params (dict, optional): Valores de los parámetros con nombre
 
     Returns:
         float: f(x, y)
@@ -219,7 +359,24 @@ def evaluate_function(expression: str, x: float, y: float) -> float:
     Raises:
         ValueError: Si la expresión no es válida
     """
-    return _evaluator.evaluate(expression, x, y)
+    return _evaluator.evaluate(expression, x, y, params)
+
+
+def evaluate_function_array(expression: str, x: float, y: np.ndarray,
+                            params: Dict[str, np.ndarray] = None) -> np.ndarray:
+    """
+    Evaluar f(x, y) sobre arrays de estados y parámetros (ver evaluate_array).
+
+    Args:
+        expression (str): Expresión matemática
+        x (float): Valor de x
+        y (np.ndarray): Valores de y
+        params (dict, optional): Arrays de parámetros
+
+    Returns:
+        np.ndarray: f(x, y) elemento a elemento
+    """
+    return _evaluator.evaluate_array(expression, x, y, params)
 
 
 def get_allowed_functions() -> Dict[str, Any]:
@@ -237,4 +394,24 @@ def get_allowed_functions() -> Dict[str, Any]:
         'constantes': ['pi', 'e'],
         'variables': ['x', 'y'],
         'operadores': ['+', '-', '*', '/', '**', '()']
-    }
\ No newline at end of file
+    }
+
+
+def preload_expressions(expressions: Iterable[str]) -> int:
+    """
+    Precargar la caché de expresiones con un conjunto de funciones conocidas.
+
+    Pensado para ejecutarse en el proceso maestro del servidor antes de crear
+    los workers, de modo que la caché se comparta por copy-on-write.
+
+    Args:
+        expressions (iterable): Expresiones a precargar
+
+    Returns:
+        int: Número de expresiones válidas precargadas
+    """
+    loaded = 0
+    for expression in expressions:
+        if validate_function(expression):
+            loaded += 1
+    return loaded
@@ -0,0 +1,155 @@
+import logging
+import os
+import threading
+import time
+from typing import Callable, Dict, Iterable, Optional
+
+
+class PlotSweeper:
+    """
+    Recolector en segundo plano del almacén de gráficas.
+
+    Las gráficas se guardan con nombres derivados de su contenido y
+    repartidas en subdirectorios (ver ODEPlotter.plot_name). Periódicamente
+    se borran las que llevan más de ``max_age`` segundos sin usarse y, si el
+    almacén sigue por encima de ``max_bytes``, las menos usadas. Nunca se
+    borra una gráfica referenciada por el historial ni una creada hace menos
+    de ``grace`` segundos (puede estar a punto de guardarse en él). Si no se
+    sabe qué gráficas referencia el historial, la pasada no borra nada.
+
+    Solo se recorren los subdirectorios del almacén: los archivos sueltos
+    del directorio raíz (gráficas con nombre por fecha) no se tocan.
+    """
+
+    # Temporales de escrituras interrumpidas
+    TEMP_SUFFIX = '.tmp'
+
+    def __init__(self, directory: str, referenced: Callable[[], Iterable[str]],
+                 max_bytes: int, max_age: float, interval: float = 600.0, grace: float = 600.0,
+                 logger: Optional[logging.Logger] = None):
+        """
+        Inicializar el recolector.
+
+        Args:
+            directory (str): Directorio raíz de las gráficas
+            referenced (callable): Devuelve los nombres de las gráficas en uso,
+                o None si no se pueden conocer
+            max_bytes (int): Tamaño máximo del almacén
+            max_age (float): Segundos sin uso tras los que se borra una gráfica
+            interval (float): Segundos entre pasadas
+            grace (float): Antigüedad mínima para poder borrar una gráfica
+            logger (logging.Logger, optional): Registro de los errores del hilo
+        """
+        self.directory = directory
+        self.referenced = referenced
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.interval = interval
+        self.grace = grace
+        self.logger = logger or logging.getLogger(__name__)
+
+        self._wake = threading.Event()
+        self._thread = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        """
+        Arrancar el hilo recolector si no está en marcha en este proceso.
+
+        Se llama de forma perezosa (al crear una gráfica) para que cada worker
+        de un servidor pre-fork arranque el suyo después del fork.
+        """
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive() and self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name='plot-sweeper', daemon=True)
+            self._thread.start()
+
+    def request_sweep(self):
+        """Adelantar la próxima pasada (por ejemplo, al limpiar el historial)."""
+        self._wake.set()
+
+    def _run(self):
+        while True:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            try:
+                self.sweep()
+            except Exception as e:
+                self.logger.exception(f"Error en el recolector de gráficas: {e}")
+
+    def _groups(self) -> Dict[str, Dict]:
+        """
+        Agrupar los archivos del almacén por gráfica (todas sus variantes y
+        su especificación).
+
+        Returns:
+            dict: Clave 'shard/hash' -> {'paths', 'bytes', 'mtime'}
+        """
+        groups = {}
+        for shard in os.listdir(self.directory):
+            shard_path = os.path.join(self.directory, shard)
+            if not os.path.isdir(shard_path):
+                continue
+            for name in os.listdir(shard_path):
+                path = os.path.join(shard_path, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                key = f"{shard}/{name.split('.')[0]}"
+                if name.endswith(self.TEMP_SUFFIX):
+                    key = path
+                group = groups.setdefault(key, {'paths': [], 'bytes': 0, 'mtime': 0.0})
+                group['paths'].append(path)
+                group['bytes'] += stat.st_size
+                group['mtime'] = max(group['mtime'], stat.st_mtime)
+        return groups
+
+    @staticmethod
+    def group_key(name: str) -> str:
+        """Clave de grupo de un nombre de gráfica ('ab/<hash>.png' -> 'ab/<hash>')."""
+        directory, base = os.path.split(name)
+        return f"{directory}/{base.split('.')[0]}" if directory else base.split('.')[0]
+
+    def sweep(self, now: Optional[float] = None) -> Dict:
+        """
+        Hacer una pasada de recolección.
+
+        Args:
+            now (float, optional): Instante de referencia (por defecto, ahora)
+
+        Returns:
+            dict: Gráficas y bytes borrados y tamaño final del almacén
+        """
+        now = time.time() if now is None else now
+        names = self.referenced()
+        groups = self._groups()
+
+        total = sum(group['bytes'] for group in groups.values())
+        if names is None:
+            # Historial ilegible: cualquier gráfica podría estar referenciada
+            return {'removed': 0, 'removed_bytes': 0, 'total_bytes': total, 'skipped': True}
+        referenced = {self.group_key(name) for name in names if name}
+        # Las menos usadas primero
+        candidates = sorted((group['mtime'], key) for key, group in groups.items()
+                            if key not in referenced and now - group['mtime'] >= self.grace)
+
+        removed, removed_bytes = 0, 0
+        for mtime, key in candidates:
+            if now - mtime < self.max_age and total <= self.max_bytes:
+                break
+            group = groups[key]
+            for path in group['paths']:
+                # Otro worker puede haberlo borrado ya
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            total -= group['bytes']
+            removed += 1
+            removed_bytes += group['bytes']
+
+        return {'removed': removed, 'removed_bytes': removed_bytes, 'total_bytes': total}
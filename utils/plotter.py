@@ -1,12 +1,20 @@
 import matplotlib
+import matplotlib.image
 
 matplotlib.use('Agg')  # Backend no interactivo para servidor
 import matplotlib.pyplot as plt
 import numpy as np
+import hashlib
+import json
 import os
+import tempfile
+import threading
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 import seaborn as sns
 
+from config import Config
+
 # Configurar estilo
 plt.style.use('seaborn-v0_8')
 sns.set_palette("husl")
@@ -15,18 +23,51 @@ sns.set_palette("husl")
 class ODEPlotter:
     """
     Generador de gráficas para métodos de solución de ecuaciones diferenciales.
+
+    Cada gráfica se dibuja una vez y se guarda en varias variantes: 'web'
+    (PNG a la resolución normal), 'thumb' (miniatura para el historial) y,
+    solo cuando se piden, 'svg' y 'hidpi' (PNG de alta resolución). Junto a
+    la gráfica se guarda su especificación (datos y título) para poder
+    generar más tarde las variantes bajo demanda.
+
+    El nombre de una gráfica es el hash de su especificación y de la
+    configuración de dibujo, repartido en subdirectorios por sus dos
+    primeros caracteres ('ab/ab12….png'): dos resoluciones idénticas
+    comparten archivos y no se dibujan dos veces.
     """
 
-    def __init__(self, figsize=(12, 8), dpi=150):
+    # Variante -> (sufijo del archivo, formato)
+    VARIANTS = {
+        'web': ('.png', 'png'),
+        'thumb': ('.thumb.png', 'png'),
+        'hidpi': ('.hidpi.png', 'png'),
+        'svg': ('.svg', 'svg'),
+    }
+
+    # Variantes que se generan al crear la gráfica
+    EAGER_VARIANTS = ('web', 'thumb')
+
+    MIMETYPES = {'png': 'image/png', 'svg': 'image/svg+xml'}
+
+    def __init__(self, figsize=(12, 8), dpi=150, hidpi=300, thumbnail_width=320,
+                 directory=os.path.join('static', 'plots')):
         """
         Inicializar el graficador.
 
         Args:
             figsize (tuple): Tamaño de la figura
-            dpi (int): Resolución de la imagen
+            dpi (int): Resolución de la variante web
+            hidpi (int): Resolución de la variante de alta resolución
+            thumbnail_width (int): Ancho aproximado de la miniatura en píxeles
+            directory (str): Directorio de las gráficas
         """
         self.figsize = figsize
         self.dpi = dpi
+        self.hidpi = hidpi
+        self.thumbnail_width = thumbnail_width
+        self.directory = directory
+        # pyplot no es seguro entre hilos: una figura a la vez
+        self._lock = threading.Lock()
         self.colors = {
             'Euler': '#FF6B6B',
             'Heun': '#4ECDC4',
@@ -35,7 +76,7 @@ class ODEPlotter:
             'predictor': '#FFA726'
         }
 
-    def create_solution_plot(self, results: Dict, title: str, filename: str,
+    def create_solution_plot(self, results: Dict, title: str, filename: Optional[str] = None,
                              compare_with: Optional[Dict] = None) -> str:
         """
         Crear gráfica de la solución de una ecuación diferencial.
@@ -43,12 +84,23 @@ class ODEPlotter:
         Args:
             results (dict): Resultados del método numérico
             title (str): Título de la gráfica
-            filename (str): Nombre del archivo de salida
+            filename (str, optional): Nombre de la variante web (.png); por
+                defecto, el derivado del contenido
             compare_with (dict, optional): Resultados de otro método para comparar
 
         Returns:
-            str: Ruta del archivo generado
+            str: Nombre de la gráfica (relativo al directorio de gráficas)
         """
+        spec = {
+            'kind': 'solution',
+            'title': title,
+            'results': self._spec_results(results),
+            'compare_with': self._spec_results(compare_with) if compare_with else None,
+        }
+        return self._store(spec, filename)
+
+    def _solution_figure(self, results: Dict, title: str, compare_with: Optional[Dict] = None):
+        """Dibujar la figura de la solución (ver create_solution_plot)."""
         fig, (ax1, ax2) = plt.subplots(2, 1, figsize=self.figsize, dpi=self.dpi)
         fig.suptitle(title, fontsize=16, fontweight='bold')
 
@@ -73,6 +125,13 @@ class ODEPlotter:
                      linewidth=1, markersize=3, alpha=0.7,
                      label='Predictor (Euler)')
 
+        # Solución exacta si se pudo calcular
+        if 'y_exact' in plot_data:
+            ax1.plot(x_vals, plot_data['y_exact'], '-',
+                     color=self.colors['exact'],
+                     linewidth=1.5, alpha=0.9,
+                     label='Solución exacta')
+
         # Comparación con otro método si se proporciona
         if compare_with:
             comp_data = compare_with['plot_data']
@@ -90,28 +149,31 @@ class ODEPlotter:
         self._add_slope_field(ax2, results, x_vals, y_vals)
 
         plt.tight_layout()
-
-        # Guardar archivo
-        filepath = os.path.join('static', 'plots', filename)
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
-        plt.savefig(filepath, dpi=self.dpi, bbox_inches='tight')
-        plt.close()
-
-        return filepath
+        return fig
 
     def create_comparison_plot(self, euler_results: Dict, heun_results: Dict,
-                               filename: str) -> str:
+                               filename: Optional[str] = None) -> str:
         """
         Crear gráfica comparativa entre métodos de Euler y Heun.
 
         Args:
             euler_results (dict): Resultados del método de Euler
             heun_results (dict): Resultados del método de Heun
-            filename (str): Nombre del archivo de salida
+            filename (str, optional): Nombre de la variante web (.png); por
+                defecto, el derivado del contenido
 
         Returns:
-            str: Ruta del archivo generado
+            str: Nombre de la gráfica (relativo al directorio de gráficas)
         """
+        spec = {
+            'kind': 'comparison',
+            'euler_results': self._spec_results(euler_results),
+            'heun_results': self._spec_results(heun_results),
+        }
+        return self._store(spec, filename)
+
+    def _comparison_figure(self, euler_results: Dict, heun_results: Dict):
+        """Dibujar la figura comparativa (ver create_comparison_plot)."""
         fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 10), dpi=self.dpi)
         fig.suptitle('Comparación: Método de Euler vs Método de Heun',
                      fontsize=16, fontweight='bold')
@@ -150,14 +212,187 @@ class ODEPlotter:
         self._plot_method_details(ax4, heun_results, 'Heun')
 
         plt.tight_layout()
+        return fig
+
+    @staticmethod
+    def _spec_results(results: Dict) -> Dict:
+        """
+        Quedarse con lo que necesita el dibujo de unos resultados: los datos
+        de la gráfica y las pendientes de los primeros pasos (campo de
+        direcciones).
+        """
+        steps = results.get('steps_table') or []
+        return {
+            'plot_data': results['plot_data'],
+            'steps_table': [{'slope': step['slope']} if 'slope' in step else {} for step in steps[:15]],
+        }
+
+    def _build_figure(self, spec: Dict):
+        """Dibujar la figura descrita por una especificación."""
+        if spec['kind'] == 'comparison':
+            return self._comparison_figure(spec['euler_results'], spec['heun_results'])
+        return self._solution_figure(spec['results'], spec['title'], spec.get('compare_with'))
+
+    def plot_name(self, spec: Dict) -> str:
+        """
+        Nombre de una gráfica derivado de su contenido.
+
+        Args:
+            spec (dict): Especificación de la gráfica
+
+        Returns:
+            str: 'ab/<hash>.png' (subdirectorio con los dos primeros caracteres)
+        """
+        content = json.dumps({'spec': spec, 'figsize': list(self.figsize), 'dpi': self.dpi,
+                              'thumbnail_width': self.thumbnail_width}, sort_keys=True)
+        digest = hashlib.sha256(content.encode('utf-8')).hexdigest()[:32]
+        return f"{digest[:2]}/{digest}.png"
 
-        # Guardar archivo
-        filepath = os.path.join('static', 'plots', filename)
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
-        plt.savefig(filepath, dpi=self.dpi, bbox_inches='tight')
-        plt.close()
+    @staticmethod
+    def is_valid_name(filename: str) -> bool:
+        """
+        Comprobar que un nombre pedido es una gráfica del almacén ('ab/<hash>.png')
+        o una gráfica antigua del directorio raíz, sin salir del directorio.
+        """
+        parts = filename.split('/')
+        if len(parts) == 2:
+            shard, base = parts
+            stem = base[:-len('.png')] if base.endswith('.png') else ''
+            return (len(shard) == 2 and len(stem) == 32 and stem.startswith(shard)
+                    and all(c in '0123456789abcdef' for c in stem))
+        return len(parts) == 1 and not filename.startswith('.') and '\\' not in filename
+
+    def _store(self, spec: Dict, filename: Optional[str]) -> str:
+        """
+        Guardar una gráfica en el almacén, reutilizándola si ya existe.
 
-        return filepath
+        Returns:
+            str: Nombre de la gráfica
+        """
+        filename = filename or self.plot_name(spec)
+        if all(os.path.exists(self.variant_path(filename, variant)) for variant in self.EAGER_VARIANTS):
+            # Misma gráfica ya dibujada: marcarla como usada para el recolector
+            try:
+                os.utime(self.variant_path(filename, 'spec'))
+            except OSError:
+                pass
+            return filename
+        self._render(spec, filename, self.EAGER_VARIANTS)
+        return filename
+
+    def variant_path(self, filename: str, variant: str) -> str:
+        """
+        Ruta de una variante de una gráfica.
+
+        Args:
+            filename (str): Nombre de la variante web (el que guarda el historial)
+            variant (str): 'web', 'thumb', 'hidpi', 'svg' o 'spec' (especificación)
+
+        Returns:
+            str: Ruta del archivo
+        """
+        stem = os.path.splitext(filename)[0]
+        suffix = '.json' if variant == 'spec' else self.VARIANTS[variant][0]
+        return os.path.join(self.directory, stem + suffix)
+
+    def _variant_dpi(self, variant: str, fig) -> float:
+        """Resolución de una variante (la miniatura se ajusta a su ancho en píxeles)."""
+        if variant == 'thumb':
+            return self.thumbnail_width / fig.get_figwidth()
+        if variant == 'hidpi':
+            return self.hidpi
+        return self.dpi
+
+    def _save_atomic(self, path: str, write):
+        """Escribir un archivo a través de un temporal para no servir nunca uno a medias."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                write(f)
+            # Legible por el servidor web que sirva static/
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _render(self, spec: Dict, filename: str, variants) -> Dict[str, str]:
+        """
+        Dibujar una figura una sola vez y guardar las variantes pedidas.
+
+        Args:
+            spec (dict): Especificación de la gráfica (se guarda si no existe)
+            filename (str): Nombre de la variante web
+            variants (iterable): Variantes a guardar
+
+        Returns:
+            dict: Variante -> ruta del archivo
+        """
+        spec_path = self.variant_path(filename, 'spec')
+        if not os.path.exists(spec_path):
+            self._save_atomic(spec_path, lambda f: f.write(json.dumps(spec).encode('utf-8')))
+
+        paths = {}
+        with self._lock:
+            fig = self._build_figure(spec)
+            try:
+                for variant in variants:
+                    path = self.variant_path(filename, variant)
+                    dpi = self._variant_dpi(variant, fig)
+                    fmt = self.VARIANTS[variant][1]
+                    self._save_atomic(path, lambda f: fig.savefig(f, format=fmt, dpi=dpi, bbox_inches='tight'))
+                    paths[variant] = path
+            finally:
+                plt.close(fig)
+        return paths
+
+    def get_variant(self, filename: str, variant: str) -> str:
+        """
+        Obtener una variante de una gráfica, generándola si aún no existe.
+
+        Args:
+            filename (str): Nombre de la variante web
+            variant (str): Nombre de la variante (ver VARIANTS)
+
+        Returns:
+            str: Ruta del archivo
+
+        Raises:
+            FileNotFoundError: Si la gráfica no existe (ni su especificación)
+        """
+        if variant not in self.VARIANTS:
+            raise FileNotFoundError(f"Variante desconocida: {variant}")
+        path = self.variant_path(filename, variant)
+        if os.path.exists(path):
+            return path
+
+        spec_path = self.variant_path(filename, 'spec')
+        if not os.path.exists(spec_path):
+            return self._legacy_variant(filename, variant)
+        try:
+            with open(spec_path, 'r', encoding='utf-8') as f:
+                spec = json.load(f)
+        except ValueError:
+            raise FileNotFoundError(spec_path)
+        return self._render(spec, filename, (variant,))[variant]
+
+    def _legacy_variant(self, filename: str, variant: str) -> str:
+        """
+        Variantes de las gráficas anteriores a las especificaciones: solo la
+        miniatura, reducida a partir del PNG guardado.
+        """
+        web_path = self.variant_path(filename, 'web')
+        if variant != 'thumb' or not os.path.exists(web_path):
+            raise FileNotFoundError(self.variant_path(filename, variant))
+
+        with self._lock:
+            width = matplotlib.image.imread(web_path).shape[1]
+            path = self.variant_path(filename, 'thumb')
+            scale = min(1.0, self.thumbnail_width / width)
+            self._save_atomic(path, lambda f: matplotlib.image.thumbnail(web_path, f, scale=scale))
+        return path
 
     def _add_slope_field(self, ax, results: Dict, x_vals: List, y_vals: List):
         """
@@ -250,35 +485,81 @@ class ODEPlotter:
         ax.grid(True, alpha=0.3)
 
 
+@lru_cache(maxsize=1024)
+def _file_digest(path: str, mtime_ns: int, size: int) -> str:
+    """Hash del contenido de un archivo (en caché mientras no cambie)."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
 # Instancia global del graficador
-_plotter = ODEPlotter()
+_plotter = ODEPlotter(figsize=Config.PLOT_FIGSIZE, dpi=Config.PLOT_DPI, hidpi=Config.PLOT_HIDPI,
+                      thumbnail_width=Config.PLOT_THUMBNAIL_WIDTH)
 
 
-def create_ode_plot(results: Dict, title: str, filename: str) -> str:
+def create_ode_plot(results: Dict, title: str, filename: Optional[str] = None) -> str:
     """
     Crear gráfica de la solución de una EDO.
 
     Args:
         results (dict): Resultados del método numérico
         title (str): Título de la gráfica
-        filename (str): Nombre del archivo
+        filename (str, optional): Nombre del archivo (por defecto, derivado del contenido)
 
     Returns:
-        str: Ruta del archivo generado
+        str: Nombre de la gráfica (relativo a static/plots)
     """
     return _plotter.create_solution_plot(results, title, filename)
 
 
-def create_comparison_plot(euler_results: Dict, heun_results: Dict, filename: str) -> str:
+def create_comparison_plot(euler_results: Dict, heun_results: Dict, filename: Optional[str] = None) -> str:
     """
     Crear gráfica comparativa entre métodos.
 
     Args:
         euler_results (dict): Resultados de Euler
         heun_results (dict): Resultados de Heun
-        filename (str): Nombre del archivo
+        filename (str, optional): Nombre del archivo (por defecto, derivado del contenido)
+
+    Returns:
+        str: Nombre de la gráfica (relativo a static/plots)
+    """
+    return _plotter.create_comparison_plot(euler_results, heun_results, filename)
+
+
+def get_plot_variant(filename: str, variant: str) -> Tuple[str, str]:
+    """
+    Obtener una variante de una gráfica (ver ODEPlotter.get_variant).
+
+    Returns:
+        tuple: (ruta del archivo, tipo MIME)
+    """
+    path = _plotter.get_variant(filename, variant)
+    return path, ODEPlotter.MIMETYPES[ODEPlotter.VARIANTS[variant][1]]
+
+
+def is_plot_name(filename: str) -> bool:
+    """Comprobar que un nombre pedido es una gráfica válida (ver ODEPlotter.is_valid_name)."""
+    return ODEPlotter.is_valid_name(filename)
+
+
+def plot_directory() -> str:
+    """Directorio raíz del almacén de gráficas."""
+    return _plotter.directory
+
+
+def plot_etag(path: str) -> str:
+    """
+    ETag fuerte de un archivo de gráfica: el hash de su contenido.
+
+    Args:
+        path (str): Ruta del archivo
 
     Returns:
-        str: Ruta del archivo generado
+        str: Hash SHA-256 en hexadecimal
     """
-    return _plotter.create_comparison_plot(euler_results, heun_results, filename)
\ No newline at end of file
+    stat = os.stat(path)
+    return _file_digest(path, stat.st_mtime_ns, stat.st_size)
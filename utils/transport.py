@@ -0,0 +1,195 @@
+import os
+import tempfile
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+
+from config import Config
+
+
+class SharedArrayTransport:
+    """
+    Transporte sin copias de los arrays de una solución entre procesos.
+
+    El proceso worker reserva los arrays del método (x, y y una fila por
+    etapa) como filas de un único archivo mapeado en memoria, en un sistema
+    de archivos en RAM (/dev/shm cuando existe), e integra escribiendo
+    directamente en él. Al proceso web solo viaja la ruta: lo mapea, obtiene
+    vistas de NumPy de las mismas páginas y borra el nombre del archivo en
+    el acto. La memoria se libera sola cuando desaparece la última vista
+    (el recuento de referencias de Python sobre el mapeo), y si algo falla
+    antes de recogerla, ``sweep_stale`` borra los archivos abandonados.
+    """
+
+    PREFIX = 'ode-arrays-'
+
+    def __init__(self, directory: Optional[str] = None):
+        """
+        Inicializar el transporte.
+
+        Args:
+            directory (str, optional): Directorio de los archivos compartidos
+                (por defecto /dev/shm si existe, si no el temporal del sistema)
+        """
+        if not directory:
+            directory = '/dev/shm' if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK) \
+                else tempfile.gettempdir()
+        self.directory = directory
+
+    def allocate(self, names: Iterable[str], length: int,
+                 dtype=np.float64) -> Tuple[str, Dict[str, np.ndarray]]:
+        """
+        Reservar arrays compartidos (a cero) en el proceso que los rellena.
+
+        Args:
+            names (iterable): Nombres de los arrays
+            length (int): Longitud de cada array
+            dtype: Tipo de los valores
+
+        Returns:
+            tuple: (ruta del archivo, nombre -> array)
+        """
+        names = list(names)
+        fd, path = tempfile.mkstemp(prefix=self.PREFIX, dir=self.directory)
+        os.close(fd)
+        try:
+            block = np.memmap(path, dtype=dtype, mode='w+', shape=(len(names), length))
+        except BaseException:
+            self.discard(path)
+            raise
+        return path, {name: block[row] for row, name in enumerate(names)}
+
+    def attach(self, path: str, names: Iterable[str], length: int, dtype=np.float64) -> Dict[str, np.ndarray]:
+        """
+        Mapear en el proceso receptor los arrays escritos por otro proceso.
+
+        El archivo se desvincula inmediatamente: el mapeo sigue siendo válido
+        mientras exista alguna vista.
+
+        Args:
+            path (str): Ruta devuelta por allocate
+            names (iterable): Nombres de los arrays, en el mismo orden
+            length (int): Longitud reservada de cada array
+            dtype: Tipo de los valores, el mismo que en allocate
+
+        Returns:
+            dict: Nombre -> vista del array (sin copia)
+        """
+        names = list(names)
+        try:
+            block = np.memmap(path, dtype=dtype, mode='r+', shape=(len(names), length))
+        finally:
+            self.discard(path)
+        return {name: block[row] for row, name in enumerate(names)}
+
+    @staticmethod
+    def discard(path: Optional[str]):
+        """Borrar un archivo compartido que ya no se va a recoger."""
+        if path:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+    def sweep_stale(self, max_age: float = 3600.0) -> int:
+        """
+        Borrar los archivos abandonados (un worker que murió o un resultado
+        que nadie recogió).
+
+        Args:
+            max_age (float): Antigüedad mínima en segundos
+
+        Returns:
+            int: Archivos borrados
+        """
+        removed = 0
+        now = time.time()
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return 0
+        for name in names:
+            if not name.startswith(self.PREFIX):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                if now - os.path.getmtime(path) >= max_age:
+                    os.unlink(path)
+                    removed += 1
+            except OSError:
+                pass
+        return removed
+
+
+# Instancia global del transporte
+_transport = SharedArrayTransport(Config.SHARED_ARRAY_DIR)
+
+
+def _integrate_in_worker(solver, events):
+    """
+    Integrar un método en un proceso worker con los arrays en memoria compartida.
+
+    Returns:
+        dict: Ruta y forma de los arrays compartidos y el estado escalar del método
+    """
+    shared = {}
+
+    def allocate(names, length, dtype):
+        shared['path'], arrays = _transport.allocate(names, length, dtype)
+        shared['names'], shared['length'], shared['dtype'] = list(names), length, dtype.str
+        return arrays
+
+    solver.allocator = allocate
+    try:
+        solver.integrate(events)
+    except BaseException:
+        _transport.discard(shared.get('path'))
+        raise
+
+    return dict(shared,
+                num_steps=solver.num_steps,
+                function_evaluations=solver.function_evaluations,
+                divergence=solver.divergence,
+                backend_used=solver.backend_used,
+                event_monitor=solver.event_monitor,
+                # Del punto de control solo interesa el paso (los arrays ya están en los resultados)
+                resume_from={'step': solver.resume_from['step']} if solver.resume_from else None)
+
+
+def integrate_in_process(solver, executor, events=None):
+    """
+    Ejecutar ``solver.integrate(events)`` en un proceso del pool y recibir
+    los arrays sin copiarlos (ver SharedArrayTransport).
+
+    Al terminar, el método queda como si hubiera integrado en este proceso:
+    x_values, y_values y las etapas son vistas de la memoria compartida.
+
+    Args:
+        solver (ODEMethod): Método configurado
+        executor (concurrent.futures.Executor): Pool de procesos
+        events (list, optional): Eventos a detectar
+
+    Returns:
+        ODEMethod: El propio método
+    """
+    if events is not None:
+        solver.events = events
+    state = executor.submit(_integrate_in_worker, solver, events).result()
+
+    arrays = _transport.attach(state['path'], state['names'], state['length'], np.dtype(state['dtype']))
+    solver.num_steps = state['num_steps']
+    for name, array in arrays.items():
+        setattr(solver, name, array[:solver.num_steps + 1])
+
+    solver.function_evaluations = state['function_evaluations']
+    solver.divergence = state['divergence']
+    solver.backend_used = state['backend_used']
+    solver.event_monitor = state['event_monitor']
+    solver.resume_from = state['resume_from']
+    return solver
+
+
+def sweep_shared_arrays(max_age: float = 3600.0) -> int:
+    """Borrar los archivos compartidos abandonados (ver SharedArrayTransport.sweep_stale)."""
+    return _transport.sweep_stale(max_age)